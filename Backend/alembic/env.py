@@ -22,6 +22,7 @@ from app.modules.statistics.models.user_statistic import UserStatistic
 from app.modules.statistics.models.company_statistic import CompanyStatistic
 from app.modules.statistics.models.task_point_history import TaskPointHistory
 from app.modules.statistics.models.difficulty_config import DifficultyConfig
+from app.modules.auth.model.revoked_token import RevokedToken
 
 config = context.config
 
@@ -0,0 +1,37 @@
+"""add task full-text search vector
+
+Revision ID: a5c1e8f3d7b2
+Revises: f2b8d4a6c1e3
+Create Date: 2026-10-19 01:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a5c1e8f3d7b2"
+down_revision: Union[str, Sequence[str], None] = "f2b8d4a6c1e3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Name words weigh more than description words in ts_rank (see app.modules.search).
+    op.execute(
+        """
+        ALTER TABLE task ADD COLUMN search_vector tsvector GENERATED ALWAYS AS (
+            setweight(to_tsvector('simple', coalesce(name, '')), 'A') ||
+            setweight(to_tsvector('simple', coalesce(description, '')), 'B')
+        ) STORED
+        """
+    )
+    # btree_gin lets one GIN index answer both the company filter and the text match.
+    op.execute("CREATE EXTENSION IF NOT EXISTS btree_gin")
+    op.execute("CREATE INDEX idx_task_company_search_vector ON task USING gin (company_id, search_vector)")
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_task_company_search_vector")
+    op.execute("ALTER TABLE task DROP COLUMN IF EXISTS search_vector")
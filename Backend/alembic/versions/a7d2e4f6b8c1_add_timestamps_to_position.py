@@ -0,0 +1,35 @@
+"""add timestamps to position
+
+Revision ID: a7d2e4f6b8c1
+Revises: f1c3d9a7b2e1
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a7d2e4f6b8c1"
+down_revision: Union[str, Sequence[str], None] = "f1c3d9a7b2e1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # updated_at feeds the ETag of the position endpoints.
+    op.add_column(
+        "position",
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+    )
+    op.add_column(
+        "position",
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("position", "updated_at")
+    op.drop_column("position", "created_at")
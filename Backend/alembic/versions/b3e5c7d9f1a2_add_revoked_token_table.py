@@ -0,0 +1,41 @@
+"""add revoked token table
+
+Revision ID: b3e5c7d9f1a2
+Revises: a7d2e4f6b8c1
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b3e5c7d9f1a2"
+down_revision: Union[str, Sequence[str], None] = "a7d2e4f6b8c1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "revoked_token",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("jti", sa.String(length=64), nullable=True),
+        sa.Column("user_id", sa.Integer(), nullable=True),
+        sa.Column("not_before", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["user.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("jti"),
+    )
+    op.create_index("idx_revoked_token_created_at", "revoked_token", ["created_at"])
+    op.create_index("idx_revoked_token_expires_at", "revoked_token", ["expires_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("idx_revoked_token_expires_at", table_name="revoked_token")
+    op.drop_index("idx_revoked_token_created_at", table_name="revoked_token")
+    op.drop_table("revoked_token")
@@ -0,0 +1,26 @@
+"""add task version column for optimistic locking
+
+Revision ID: b7d3f9e2a6c4
+Revises: a5c1e8f3d7b2
+Create Date: 2026-10-19 02:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b7d3f9e2a6c4"
+down_revision: Union[str, Sequence[str], None] = "a5c1e8f3d7b2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("task", sa.Column("version", sa.Integer(), server_default="1", nullable=False))
+
+
+def downgrade() -> None:
+    op.drop_column("task", "version")
@@ -0,0 +1,35 @@
+"""add user keyset pagination indexes
+
+Revision ID: c4f8a1d6e2b9
+Revises: b3e5c7d9f1a2
+Create Date: 2026-10-18 21:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c4f8a1d6e2b9"
+down_revision: Union[str, Sequence[str], None] = "b3e5c7d9f1a2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = {
+    "idx_user_first_name_id": ["first_name", "id"],
+    "idx_user_last_name_id": ["last_name", "id"],
+    "idx_user_salary_id": ["salary", "id"],
+    "idx_user_created_at_id": ["created_at", "id"],
+    "idx_user_company_id_id": ["company_id", "id"],
+}
+
+
+def upgrade() -> None:
+    for name, columns in INDEXES.items():
+        op.create_index(name, "user", columns)
+
+
+def downgrade() -> None:
+    for name in INDEXES:
+        op.drop_index(name, table_name="user")
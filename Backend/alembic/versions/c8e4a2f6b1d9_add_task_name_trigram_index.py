@@ -0,0 +1,27 @@
+"""add task name trigram index
+
+Revision ID: c8e4a2f6b1d9
+Revises: b7d3f9e2a6c4
+Create Date: 2026-10-19 03:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c8e4a2f6b1d9"
+down_revision: Union[str, Sequence[str], None] = "b7d3f9e2a6c4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Substring matches (ILIKE '%q%') that the task search ORs with the full-text match.
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute("CREATE INDEX idx_task_name_trgm ON task USING gin (name gin_trgm_ops)")
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_task_name_trgm")
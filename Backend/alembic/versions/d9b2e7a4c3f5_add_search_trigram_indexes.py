@@ -0,0 +1,44 @@
+"""add pg_trgm search indexes for users and companies
+
+Revision ID: d9b2e7a4c3f5
+Revises: c4f8a1d6e2b9
+Create Date: 2026-10-18 22:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d9b2e7a4c3f5"
+down_revision: Union[str, Sequence[str], None] = "c4f8a1d6e2b9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, column) pairs searched by app.modules.search.
+SEARCH_COLUMNS = [
+    ("user", "first_name"),
+    ("user", "last_name"),
+    ("user", "login"),
+    ("company", "name"),
+]
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for table, column in SEARCH_COLUMNS:
+        # Substring (ILIKE '%q%') and similarity (%) matches.
+        op.execute(
+            f'CREATE INDEX idx_{table}_{column}_trgm ON "{table}" USING gin ({column} gin_trgm_ops)'
+        )
+        # Prefix matches for queries shorter than a trigram.
+        op.execute(
+            f'CREATE INDEX idx_{table}_{column}_lower_prefix ON "{table}" (lower({column}) varchar_pattern_ops)'
+        )
+
+
+def downgrade() -> None:
+    for table, column in SEARCH_COLUMNS:
+        op.execute(f"DROP INDEX IF EXISTS idx_{table}_{column}_lower_prefix")
+        op.execute(f"DROP INDEX IF EXISTS idx_{table}_{column}_trgm")
@@ -0,0 +1,37 @@
+"""add company-leading task listing indexes
+
+Revision ID: e6a3c9f1b7d4
+Revises: d9b2e7a4c3f5
+Create Date: 2026-10-18 23:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e6a3c9f1b7d4"
+down_revision: Union[str, Sequence[str], None] = "d9b2e7a4c3f5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# GET /task/ filters by company and pages by (sort field, id); the default sort is deadline and
+# task_step / city are the most common filters.
+INDEXES = {
+    "idx_task_company_id_id": ["company_id", "id"],
+    "idx_task_company_deadline_id": ["company_id", "deadline", "id"],
+    "idx_task_company_step_deadline_id": ["company_id", "task_step", "deadline", "id"],
+    "idx_task_company_city_deadline_id": ["company_id", "city", "deadline", "id"],
+    "idx_task_company_name_id": ["company_id", "name", "id"],
+}
+
+
+def upgrade() -> None:
+    for name, columns in INDEXES.items():
+        op.create_index(name, "task", columns)
+
+
+def downgrade() -> None:
+    for name in INDEXES:
+        op.drop_index(name, table_name="task")
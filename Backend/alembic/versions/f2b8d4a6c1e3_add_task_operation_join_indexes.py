@@ -0,0 +1,44 @@
+"""add task_operations / executors / accessed_users join indexes
+
+Revision ID: f2b8d4a6c1e3
+Revises: e6a3c9f1b7d4
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f2b8d4a6c1e3"
+down_revision: Union[str, Sequence[str], None] = "e6a3c9f1b7d4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# The association primary keys are (user_id, task_id); these serve task -> users joins.
+REVERSE_INDEXES = {
+    "idx_accessed_users_task_user": "accessed_users",
+    "idx_executors_task_user": "executors",
+}
+
+
+def upgrade() -> None:
+    duplicates = op.get_bind().execute(sa.text(
+        "SELECT task_id FROM task_operations GROUP BY task_id HAVING count(*) > 1 LIMIT 10"
+    )).scalars().all()
+    if duplicates:
+        raise RuntimeError(
+            f"task_operations has several rows for task ids {duplicates}; merge them before upgrading"
+        )
+
+    op.create_index("uq_task_operations_task_id", "task_operations", ["task_id"], unique=True)
+    for name, table in REVERSE_INDEXES.items():
+        op.create_index(name, table, ["task_id", "user_id"])
+
+
+def downgrade() -> None:
+    for name, table in REVERSE_INDEXES.items():
+        op.drop_index(name, table_name=table)
+    op.drop_index("uq_task_operations_task_id", table_name="task_operations")
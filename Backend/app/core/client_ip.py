@@ -0,0 +1,40 @@
+"""The caller's address behind trusted reverse proxies (TRUSTED_PROXIES)."""
+
+from functools import lru_cache
+from ipaddress import IPv4Network, IPv6Network, ip_address, ip_network
+from typing import Optional, Sequence
+
+from starlette.requests import Request
+
+from app.core.config import settings
+
+
+@lru_cache(maxsize=8)
+def _networks(proxies: tuple[str, ...]) -> tuple[IPv4Network | IPv6Network, ...]:
+    return tuple(ip_network(proxy, strict=False) for proxy in proxies)
+
+
+def _is_trusted(address: str, networks: Sequence[IPv4Network | IPv6Network]) -> bool:
+    try:
+        ip = ip_address(address)
+    except ValueError:
+        return False
+    return any(ip in network for network in networks)
+
+
+def client_ip(request: Request, trusted_proxies: Optional[Sequence[str]] = None) -> Optional[str]:
+    """
+    The peer address, unless the peer is a trusted proxy: then the nearest X-Forwarded-For hop
+    that is not a trusted proxy itself (X-Real-IP when there is no X-Forwarded-For). Hops further
+    left were written by the client and are never believed.
+    """
+    peer = request.client.host if request.client else None
+    networks = _networks(tuple(settings.TRUSTED_PROXIES if trusted_proxies is None else trusted_proxies))
+    if peer is None or not _is_trusted(peer, networks):
+        return peer
+
+    forwarded = [hop.strip() for hop in request.headers.get("x-forwarded-for", "").split(",") if hop.strip()]
+    for hop in reversed(forwarded):
+        if not _is_trusted(hop, networks):
+            return hop
+    return request.headers.get("x-real-ip") or peer
@@ -1,4 +1,4 @@
-from typing import Any
+from typing import Any, Literal, Optional
 
 from pydantic import Field, PostgresDsn, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -14,19 +14,110 @@ class Settings(BaseSettings):
     VERSION: str = "0.0.1"
 
     DB_URL: PostgresDsn
+    DB_POOL_SIZE: int = Field(default=10, ge=1)
+    DB_MAX_OVERFLOW: int = Field(default=20, ge=0)
+    DB_POOL_TIMEOUT: float = Field(default=30.0, gt=0)
+    DB_POOL_RECYCLE: int = Field(default=1800)
+    DB_POOL_PRE_PING: bool = Field(default=True)
+    DB_POOL_SLOW_CHECKOUT_MS: float = Field(default=100.0, ge=0)
+
+    # What lifespan does with the schema: "check" verifies the Alembic revision is at head,
+    # "create_all" creates missing tables (local development), "skip" does nothing.
+    DB_SCHEMA_STARTUP: Literal["check", "create_all", "skip"] = Field(default="check")
+
+    DB_REPLICA_URL: Optional[PostgresDsn] = None
+    DB_REPLICA_MAX_LAG_SECONDS: float = Field(default=5.0, ge=0)
+    DB_REPLICA_LAG_CHECK_INTERVAL_SECONDS: float = Field(default=10.0, gt=0)
+
+    # Warn when one normalized statement runs more than this many times in a request.
+    SQL_N_PLUS_ONE_THRESHOLD: int = Field(default=10, ge=1)
+
+    LOG_LEVEL: str = Field(default="INFO")
+    LOG_FORMAT: Literal["text", "json"] = Field(default="text")
+    LOG_QUEUE_SIZE: int = Field(default=10000, ge=1)
+    LOG_QUEUE_OVERFLOW: Literal["drop_new", "drop_oldest"] = Field(default="drop_new")
+    # Fraction of INFO records kept per logger, e.g. {"app.requests": 0.1}; warnings are never sampled.
+    LOG_SAMPLE_RATES: dict[str, float] = Field(default_factory=dict)
+
+    COMPRESSION_MIN_SIZE: int = Field(default=1024, ge=0)
+    COMPRESSION_GZIP_LEVEL: int = Field(default=6, ge=1, le=9)
+    COMPRESSION_BROTLI_QUALITY: int = Field(default=4, ge=0, le=11)
+    # Bodies at least this large are compressed in a worker thread instead of on the event loop.
+    COMPRESSION_OFFLOAD_SIZE: int = Field(default=256 * 1024, ge=0)
+
+    PROFILING_ENABLED: bool = Field(default=True)
+    PROFILER_MAX_PROFILES: int = Field(default=50, ge=1)
+    PROFILER_TREE_DEPTH: int = Field(default=25, ge=1)
+
+    # Authenticated principals are cached per worker; other workers see role changes after the TTL.
+    PRINCIPAL_CACHE_TTL_SECONDS: float = Field(default=30.0, ge=0)
+    PRINCIPAL_CACHE_MAX_SIZE: int = Field(default=10000, ge=1)
+
+    # Decoded, signature-checked JWTs kept until their exp; 0 disables the cache.
+    TOKEN_CACHE_MAX_SIZE: int = Field(default=10000, ge=0)
+
+    TOKEN_REVOCATION_REFRESH_SECONDS: float = Field(default=5.0, gt=0)
+    TOKEN_REVOCATION_REBUILD_SECONDS: float = Field(default=3600.0, gt=0)
+    TOKEN_REVOCATION_BLOOM_CAPACITY: int = Field(default=100_000, ge=1)
+    TOKEN_REVOCATION_BLOOM_ERROR_RATE: float = Field(default=0.001, gt=0, lt=1)
 
     SECRET_KEY: str = Field(..., min_length=32)
     ALGORITHM: str = Field(default="HS256")
     ACCESS_TOKEN_EXPIRE_MINUTES: int = Field(default=30)
     REFRESH_TOKEN_EXPIRE_DAYS: int = Field(default=30)
 
+    # Changing these rehashes each password on the user's next successful login.
+    ARGON2_TIME_COST: int = Field(default=3, ge=1)
+    ARGON2_MEMORY_COST_KIB: int = Field(default=65536, ge=8)
+    ARGON2_PARALLELISM: int = Field(default=4, ge=1)
+    PASSWORD_HASH_WORKERS: int = Field(default=4, ge=1)
+    PASSWORD_HASH_MAX_PENDING: int = Field(default=64, ge=0)
+
+    # Reverse proxies (IPs or CIDRs, as JSON) whose X-Forwarded-For / X-Real-IP is believed when
+    # rate limiting by client address; requests from anywhere else are keyed by the peer address.
+    TRUSTED_PROXIES: list[str] = Field(default_factory=list)
+    LOGIN_RATE_PER_LOGIN_PER_MINUTE: float = Field(default=5.0, gt=0)
+    LOGIN_BURST_PER_LOGIN: int = Field(default=5, ge=1)
+    LOGIN_RATE_PER_IP_PER_MINUTE: float = Field(default=30.0, gt=0)
+    LOGIN_BURST_PER_IP: int = Field(default=20, ge=1)
+    LOGIN_LIMITER_MAX_KEYS: int = Field(default=100_000, ge=1)
+    # Logins inside password verification at once; unset means every hashing worker plus half of
+    # PASSWORD_HASH_MAX_PENDING, so a login flood still leaves queue room for other endpoints.
+    LOGIN_MAX_CONCURRENT_VERIFICATIONS: Optional[int] = Field(default=None, ge=1)
+    # How long a login waits for a verification slot before it is rejected with 503.
+    LOGIN_VERIFICATION_WAIT_SECONDS: float = Field(default=5.0, gt=0)
+
+    # Positions are cached per worker; changes made through another worker show up after this.
+    POSITION_CACHE_TTL_SECONDS: float = Field(default=300.0, gt=0)
+
+    # Bulk employee import: rows are validated, hashed and inserted USER_IMPORT_BATCH_SIZE at a time.
+    USER_IMPORT_BATCH_SIZE: int = Field(default=500, ge=1)
+    USER_IMPORT_MAX_ROWS: int = Field(default=10_000, ge=1)
+    # Separate processes from the request hashing pool, so an import cannot starve logins.
+    USER_IMPORT_HASH_PROCESSES: int = Field(default=4, ge=1)
+
+    # Where uploaded files go: Cloudinary in production, the local filesystem for tests and dev.
+    STORAGE_BACKEND: Literal["cloudinary", "local"] = Field(default="cloudinary")
+    LOCAL_STORAGE_PATH: str = Field(default="media")
+    LOCAL_STORAGE_URL: str = Field(default="/media")
+    STORAGE_UPLOAD_THREADS: int = Field(default=4, ge=1)
+
+    AVATAR_MAX_BYTES: int = Field(default=5 * 1024 * 1024, ge=1)
+    AVATAR_SIZE_PX: int = Field(default=300, ge=16)
+    # Uploads waiting for a worker; beyond this new uploads are rejected with 503.
+    AVATAR_QUEUE_SIZE: int = Field(default=100, ge=1)
+    AVATAR_WORKERS: int = Field(default=2, ge=1)
+    IMAGE_PROCESSES: int = Field(default=2, ge=1)
+
     CLOUDINARY_CLOUD_NAME: str
     CLOUDINARY_API_KEY: str
     CLOUDINARY_API_SECRET: str
 
-    @field_validator("DB_URL", mode="before")
+    @field_validator("DB_URL", "DB_REPLICA_URL", mode="before")
     @classmethod
     def assemble_db_connection(cls, v: Any) -> Any:
+        if v == "":
+            return None
         if isinstance(v, str) and v.startswith("postgres://"):
             return v.replace("postgres://", "postgres+asyncpg://", 1)
         return v
@@ -1,5 +1,9 @@
-from typing import AsyncGenerator
+import asyncio
+import time
+from pathlib import Path
+from typing import AsyncGenerator, Callable
 
+from sqlalchemy import event, text
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     create_async_engine,
@@ -9,23 +13,95 @@ from sqlalchemy.ext.asyncio import (
 from sqlalchemy.orm import declarative_base
 
 from app.core.config import settings
+from app.core.db_pool import InstrumentedAsyncQueuePool, PoolStats, render_pool_metrics
 from app.core.logging import get_logger
+from app.core.metrics import REGISTRY
+from app.core.query_stats import instrument_engine
 
 logger = get_logger("db")
 
 Base = declarative_base()
 
+# Seconds the replica is behind the primary; 0 when it has replayed everything it received.
+REPLICA_LAG_QUERY = text(
+    """
+    SELECT CASE
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+    END
+    """
+)
+
+
+def _run_on_commit(session) -> None:
+    callbacks = list(session.info["on_commit"])
+    session.info["on_commit"].clear()
+    for callback in callbacks:
+        callback()
+
+
+def _drop_on_commit(session) -> None:
+    session.info["on_commit"].clear()
+
+
+def on_commit(db: AsyncSession, callback: Callable[[], None]) -> None:
+    """Run `callback` once the session's current transaction commits; drop it if it rolls back."""
+    pending = db.info.get("on_commit")
+    if pending is None:
+        pending = db.info["on_commit"] = []
+        event.listen(db.sync_session, "after_commit", _run_on_commit)
+        event.listen(db.sync_session, "after_rollback", _drop_on_commit)
+    pending.append(callback)
+
+
+ALEMBIC_INI = Path(__file__).resolve().parents[2] / "alembic.ini"
+
+
+def _alembic_revisions() -> tuple[set[str], set[str]]:
+    """Head revisions and all known revisions of the migration scripts shipped with this code."""
+    from alembic.config import Config
+    from alembic.script import ScriptDirectory
+
+    script = ScriptDirectory.from_config(Config(str(ALEMBIC_INI)))
+    return set(script.get_heads()), {rev.revision for rev in script.walk_revisions()}
+
+
+def _create_engine(url: str, pool_name: str) -> AsyncEngine:
+    engine = create_async_engine(
+        url,
+        future=True,
+        poolclass=InstrumentedAsyncQueuePool,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+    )
+    engine.pool.stats = PoolStats(pool_name, settings.DB_POOL_SLOW_CHECKOUT_MS)
+    instrument_engine(engine)
+    return engine
+
 
 class DatabaseManager:
     def __init__(self):
-        self.engine: AsyncEngine = create_async_engine(
-            str(settings.DB_URL), future=True
-        )
+        self.engine: AsyncEngine = _create_engine(str(settings.DB_URL), "primary")
 
         self.AsyncSessionLocal: async_sessionmaker[AsyncSession] = async_sessionmaker(
             self.engine, class_=AsyncSession, expire_on_commit=False
         )
 
+        self.replica_engine: AsyncEngine | None = None
+        self.ReplicaSessionLocal: async_sessionmaker[AsyncSession] | None = None
+        if settings.DB_REPLICA_URL:
+            self.replica_engine = _create_engine(str(settings.DB_REPLICA_URL), "replica")
+            self.ReplicaSessionLocal = async_sessionmaker(
+                self.replica_engine, class_=AsyncSession, expire_on_commit=False
+            )
+
+        self._replica_healthy = False
+        self._replica_checked_at = float("-inf")
+        self._replica_check_lock = asyncio.Lock()
+
     async def get_db_session(self) -> AsyncGenerator[AsyncSession, None]:
         async with self.AsyncSessionLocal() as session:
             try:
@@ -38,15 +114,107 @@ class DatabaseManager:
             finally:
                 pass
 
+    async def get_read_db_session(self) -> AsyncGenerator[AsyncSession, None]:
+        """Read-only session: routed to the replica when it is fresh enough, never committed."""
+        session_factory = self.AsyncSessionLocal
+        if await self._replica_available():
+            session_factory = self.ReplicaSessionLocal
+
+        async with session_factory() as session:
+            try:
+                await session.execute(text("SET TRANSACTION READ ONLY"))
+                yield session
+            except Exception as e:
+                logger.error("Read-only DB session failed: %s", e)
+                raise
+            finally:
+                await session.rollback()
+
+    async def _replica_available(self) -> bool:
+        if self.replica_engine is None:
+            return False
+
+        if time.monotonic() - self._replica_checked_at < settings.DB_REPLICA_LAG_CHECK_INTERVAL_SECONDS:
+            return self._replica_healthy
+
+        async with self._replica_check_lock:
+            # Another request may have refreshed the state while we were waiting.
+            if time.monotonic() - self._replica_checked_at < settings.DB_REPLICA_LAG_CHECK_INTERVAL_SECONDS:
+                return self._replica_healthy
+
+            try:
+                async with self.replica_engine.connect() as conn:
+                    lag = float(await conn.scalar(REPLICA_LAG_QUERY) or 0)
+                healthy = lag <= settings.DB_REPLICA_MAX_LAG_SECONDS
+                if not healthy:
+                    logger.warning(
+                        "Replica lag %.1fs exceeds %.1fs, routing reads to primary",
+                        lag,
+                        settings.DB_REPLICA_MAX_LAG_SECONDS,
+                    )
+            except Exception as e:
+                logger.warning("Replica lag check failed, routing reads to primary: %s", e)
+                healthy = False
+
+            if healthy and not self._replica_healthy:
+                logger.info("Replica is healthy, routing reads to replica")
+            self._replica_healthy = healthy
+            self._replica_checked_at = time.monotonic()
+            return healthy
+
+    def pools(self) -> list[InstrumentedAsyncQueuePool]:
+        engines = [self.engine]
+        if self.replica_engine is not None:
+            engines.append(self.replica_engine)
+        return [engine.pool for engine in engines]
+
+    def pool_stats(self) -> list[dict]:
+        return [pool.snapshot() for pool in self.pools()]
+
     async def init_db(self):
         async with self.engine.begin() as conn:
             await conn.run_sync(Base.metadata.create_all)
 
+    async def check_schema(self) -> None:
+        """Fail fast when the database is behind the migrations this code expects."""
+
+        async def current_revisions() -> set[str]:
+            async with self.engine.connect() as conn:
+                result = await conn.execute(text("SELECT version_num FROM alembic_version"))
+                return set(result.scalars().all())
+
+        # Parsing the migration scripts is blocking file I/O; overlap it with the DB round trip.
+        (heads, known), current = await asyncio.gather(
+            asyncio.to_thread(_alembic_revisions), current_revisions()
+        )
+        if current == heads:
+            return
+        if current - known:
+            logger.warning(
+                "Database is at unknown revision(s) %s (code heads: %s); assuming a newer deploy migrated it",
+                sorted(current), sorted(heads),
+            )
+            return
+        raise RuntimeError(
+            f"Database schema is at {sorted(current)}, expected {sorted(heads)}; run `alembic upgrade head`"
+        )
+
+    async def dispose(self) -> None:
+        await self.engine.dispose()
+        if self.replica_engine is not None:
+            await self.replica_engine.dispose()
+
 
 db_manager = DatabaseManager()
 
+REGISTRY.register_collector(lambda: render_pool_metrics(db_manager.pools()))
+
 get_db = db_manager.get_db_session
 
+get_read_db = db_manager.get_read_db_session
+
 init_db = db_manager.init_db
 
+check_schema = db_manager.check_schema
+
 Base = Base
@@ -0,0 +1,146 @@
+import threading
+import time
+from bisect import bisect_left
+from typing import Any
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, PoolProxiedConnection
+
+from app.core.logging import get_logger
+from app.core.metrics import render_sample
+
+logger = get_logger("db.pool")
+
+# Upper bounds (ms) of the checkout wait histogram buckets; the last bucket is +Inf.
+WAIT_BUCKETS_MS: tuple[float, ...] = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+class PoolStats:
+    """Checkout counters and wait-time histogram for a single connection pool."""
+
+    def __init__(self, name: str, slow_checkout_ms: float):
+        self.name = name
+        self.slow_checkout_ms = slow_checkout_ms
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.slow_checkouts = 0
+        self.wait_ms_sum = 0.0
+        self.wait_ms_max = 0.0
+        self.wait_buckets = [0] * (len(WAIT_BUCKETS_MS) + 1)
+
+    def observe_checkout(self, wait_ms: float) -> None:
+        with self._lock:
+            self.checkouts += 1
+            self.wait_ms_sum += wait_ms
+            self.wait_ms_max = max(self.wait_ms_max, wait_ms)
+            self.wait_buckets[bisect_left(WAIT_BUCKETS_MS, wait_ms)] += 1
+            if wait_ms >= self.slow_checkout_ms:
+                self.slow_checkouts += 1
+
+    def observe_timeout(self) -> None:
+        with self._lock:
+            self.timeouts += 1
+
+    def cumulative_buckets(self) -> list[tuple[str, int]]:
+        with self._lock:
+            buckets = list(self.wait_buckets)
+
+        result = []
+        total = 0
+        for bound, count in zip((*WAIT_BUCKETS_MS, float("inf")), buckets):
+            total += count
+            result.append(("+Inf" if bound == float("inf") else f"{bound:g}", total))
+        return result
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool that records how long each checkout waited for a connection."""
+
+    # Assigned by DatabaseManager right after the engine is created.
+    stats: PoolStats = PoolStats("default", slow_checkout_ms=float("inf"))
+
+    def connect(self) -> PoolProxiedConnection:
+        start = time.perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            self.stats.observe_timeout()
+            logger.error(
+                "DB pool '%s' checkout timed out after %.1fms (checked_out=%s overflow=%s)",
+                self.stats.name,
+                (time.perf_counter() - start) * 1000,
+                self.checkedout(),
+                self.overflow(),
+            )
+            raise
+
+        wait_ms = (time.perf_counter() - start) * 1000
+        self.stats.observe_checkout(wait_ms)
+        if wait_ms >= self.stats.slow_checkout_ms:
+            logger.warning(
+                "DB pool '%s' slow checkout: waited %.1fms (checked_out=%s overflow=%s)",
+                self.stats.name,
+                wait_ms,
+                self.checkedout(),
+                self.overflow(),
+            )
+        return connection
+
+    def recreate(self) -> "InstrumentedAsyncQueuePool":
+        # engine.dispose() swaps in a fresh pool; keep the counters across it.
+        new_pool = super().recreate()
+        new_pool.stats = self.stats
+        return new_pool
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "name": self.stats.name,
+            "pool_size": self.size(),
+            "checked_out": self.checkedout(),
+            "checked_in": self.checkedin(),
+            "overflow": max(self.overflow(), 0),
+            "max_overflow": self._max_overflow,
+            "checkouts_total": self.stats.checkouts,
+            "checkout_timeouts_total": self.stats.timeouts,
+            "slow_checkouts_total": self.stats.slow_checkouts,
+            "wait_ms_sum": round(self.stats.wait_ms_sum, 3),
+            "wait_ms_max": round(self.stats.wait_ms_max, 3),
+            "wait_ms_buckets": [
+                {"le": le, "count": count} for le, count in self.stats.cumulative_buckets()
+            ],
+        }
+
+
+def render_pool_metrics(pools: list[InstrumentedAsyncQueuePool]) -> list[str]:
+    """Exposition lines for the pool gauges, counters and checkout wait histogram."""
+    gauges = {
+        "db_pool_size": ("Configured number of persistent connections.", "pool_size"),
+        "db_pool_checked_out": ("Connections currently checked out.", "checked_out"),
+        "db_pool_checked_in": ("Idle connections in the pool.", "checked_in"),
+        "db_pool_overflow": ("Overflow connections currently open.", "overflow"),
+    }
+    counters = {
+        "db_pool_checkouts_total": ("Successful connection checkouts.", "checkouts_total"),
+        "db_pool_checkout_timeouts_total": ("Checkouts that hit the pool timeout.", "checkout_timeouts_total"),
+        "db_pool_slow_checkouts_total": ("Checkouts slower than the warning threshold.", "slow_checkouts_total"),
+    }
+    snapshots = [pool.snapshot() for pool in pools]
+
+    lines: list[str] = []
+    for kind, metrics in (("gauge", gauges), ("counter", counters)):
+        for name, (documentation, field) in metrics.items():
+            lines.append(f"# HELP {name} {documentation}")
+            lines.append(f"# TYPE {name} {kind}")
+            lines.extend(render_sample(name, {"pool": s["name"]}, s[field]) for s in snapshots)
+
+    name = "db_pool_checkout_wait_seconds"
+    lines.append(f"# HELP {name} Time spent waiting for a pooled connection.")
+    lines.append(f"# TYPE {name} histogram")
+    for s in snapshots:
+        for bucket in s["wait_ms_buckets"]:
+            le = bucket["le"] if bucket["le"] == "+Inf" else f"{float(bucket['le']) / 1000:g}"
+            lines.append(render_sample(f"{name}_bucket", {"pool": s["name"], "le": le}, bucket["count"]))
+        lines.append(render_sample(f"{name}_sum", {"pool": s["name"]}, s["wait_ms_sum"] / 1000))
+        lines.append(render_sample(f"{name}_count", {"pool": s["name"]}, s["checkouts_total"]))
+    return lines
@@ -0,0 +1,78 @@
+"""Weak ETags and conditional GET helpers.
+
+ETags are derived from cheap aggregates (row count and max(updated_at) of the rows a response is
+built from, plus membership_version for association tables that have no updated_at) so a 304 can
+be answered before the real query runs and before anything is serialized.
+"""
+
+import hashlib
+from typing import Any, Optional
+
+from fastapi import Request, Response, status
+from sqlalchemy import BigInteger, cast, func, select, true
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# Shared data that changes through the app: always revalidate, but allow the browser to keep a copy.
+REVALIDATE = "private, no-cache"
+# Reference data that rarely changes; a short freshness window saves the round trip entirely.
+SHORT_LIVED = "private, max-age=60, must-revalidate"
+
+
+def aggregate_version(model: Any, *criteria: Any):
+    """`SELECT count(*), max(updated_at)` over the rows matching criteria."""
+    return select(func.count(), func.max(model.updated_at)).select_from(model).where(*criteria)
+
+
+def membership_version(left: Any, right: Any, *criteria: Any):
+    """
+    Fingerprint of an association table, which has no updated_at to compare: the row count plus
+    sums over both key columns, so replacing a member changes it as well as adding or removing one.
+    """
+    return select(
+        func.count(),
+        func.coalesce(func.sum(left), 0),
+        func.coalesce(func.sum(cast(left, BigInteger) * right), 0),
+    ).select_from(left.table).where(*criteria)
+
+
+def combined_version(*aggregates: Any):
+    """One row holding the columns of several single-row version aggregates."""
+    subqueries = [aggregate.subquery() for aggregate in aggregates]
+    joined = subqueries[0]
+    for subquery in subqueries[1:]:
+        joined = joined.join(subquery, true())
+    return select(*subqueries).select_from(joined)
+
+
+async def fetch_version(db: AsyncSession, model: Any, *criteria: Any) -> tuple[Any, ...]:
+    row = (await db.execute(aggregate_version(model, *criteria))).one()
+    return tuple(row)
+
+
+def weak_etag(*parts: Any) -> str:
+    digest = hashlib.blake2b(repr(parts).encode(), digest_size=12).hexdigest()
+    return f'W/"{digest}"'
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    if if_none_match.strip() == "*":
+        return True
+    # Weak comparison: W/"x" and "x" are the same validator.
+    opaque = etag.removeprefix("W/")
+    return any(candidate.strip().removeprefix("W/") == opaque for candidate in if_none_match.split(","))
+
+
+def cache_headers(etag: str, cache_control: str) -> dict[str, str]:
+    return {"ETag": etag, "Cache-Control": cache_control}
+
+
+def not_modified(request: Request, etag: str, cache_control: str) -> Optional[Response]:
+    """304 response when the client's If-None-Match already covers etag, otherwise None."""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and _etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=cache_headers(etag, cache_control))
+    return None
+
+
+def set_cache_headers(response: Response, etag: str, cache_control: str) -> None:
+    response.headers.update(cache_headers(etag, cache_control))
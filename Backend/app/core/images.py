@@ -0,0 +1,66 @@
+"""Image thumbnailing in a process pool.
+
+Decoding and resizing an upload is CPU-bound and holds the GIL, so it runs in separate
+processes. Pillow is optional: without it images are stored as uploaded.
+"""
+
+import asyncio
+import io
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+try:
+    from PIL import Image, ImageOps, UnidentifiedImageError
+except ImportError:  # pragma: no cover - optional dependency
+    Image = None
+
+THUMBNAIL_CONTENT_TYPE = "image/webp"
+# Decompression-bomb guard: refuse images with more pixels than this.
+MAX_PIXELS = 40_000_000
+
+
+class InvalidImageError(ValueError):
+    pass
+
+
+def make_thumbnail(data: bytes, size: int) -> bytes:
+    """Square `size`x`size` WebP cropped around the centre, honouring EXIF orientation."""
+    Image.MAX_IMAGE_PIXELS = MAX_PIXELS
+    try:
+        with Image.open(io.BytesIO(data)) as image:
+            image = ImageOps.exif_transpose(image)
+            image = ImageOps.fit(image.convert("RGB"), (size, size), method=Image.Resampling.LANCZOS)
+    except (UnidentifiedImageError, Image.DecompressionBombError, OSError) as e:
+        raise InvalidImageError(str(e)) from e
+
+    out = io.BytesIO()
+    image.save(out, format="WEBP", quality=85)
+    return out.getvalue()
+
+
+class ImageProcessor:
+    def __init__(self, processes: int):
+        self.processes = processes
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    @property
+    def available(self) -> bool:
+        return Image is not None
+
+    async def thumbnail(self, data: bytes, content_type: str, size: int) -> tuple[bytes, str]:
+        """(image bytes, content type) ready to store; the original upload when Pillow is missing."""
+        if not self.available:
+            return data, content_type
+        if self._pool is None:
+            # spawn: workers only import this module, and never inherit the server's threads.
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.processes, mp_context=multiprocessing.get_context("spawn")
+            )
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._pool, make_thumbnail, data, size), THUMBNAIL_CONTENT_TYPE
+
+    def shutdown(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
@@ -1,23 +1,149 @@
+import atexit
+import json
 import logging
+import queue
+import random
 import sys
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
 
+from app.core.metrics import REGISTRY
 
-def setup_logging() -> None:
-    fmt = logging.Formatter(
+LOG_RECORDS_DROPPED = REGISTRY.counter(
+    "log_records_dropped_total",
+    "Log records discarded because the logging queue was full.",
+    ("policy",),
+)
+
+_listener: Optional[QueueListener] = None
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line, for log shippers that parse structured output."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "ts": datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            payload["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(payload, ensure_ascii=False)
+
+
+class SamplingFilter(logging.Filter):
+    """Keeps only a fraction of INFO/DEBUG records for the configured loggers (and their children).
+
+    Warnings and errors always pass.
+    """
+
+    def __init__(self, rates: dict[str, float]):
+        super().__init__()
+        self.rates = rates
+
+    def _rate(self, name: str) -> float:
+        while name:
+            if name in self.rates:
+                return self.rates[name]
+            name = name.rpartition(".")[0]
+        return 1.0
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING:
+            return True
+        rate = self._rate(record.name)
+        return rate >= 1.0 or random.random() < rate
+
+
+class BoundedQueueHandler(QueueHandler):
+    """QueueHandler that never blocks the caller: when the queue is full a record is dropped.
+
+    drop_new discards the incoming record, drop_oldest evicts the oldest queued one to make room.
+    """
+
+    def __init__(self, log_queue: queue.Queue, overflow: str = "drop_new"):
+        super().__init__(log_queue)
+        self.overflow = overflow
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+            return
+        except queue.Full:
+            pass
+
+        if self.overflow == "drop_oldest":
+            try:
+                self.queue.get_nowait()
+                self.queue.task_done()
+            except queue.Empty:
+                pass
+            try:
+                self.queue.put_nowait(record)
+            except queue.Full:
+                pass
+        LOG_RECORDS_DROPPED.inc(policy=self.overflow)
+
+
+def _build_formatter(log_format: str) -> logging.Formatter:
+    if log_format == "json":
+        return JsonFormatter()
+    return logging.Formatter(
         fmt="%(asctime)s | %(levelname)-8s | %(name)s | %(message)s",
         datefmt="%Y-%m-%d %H:%M:%S",
     )
 
-    handler = logging.StreamHandler(sys.stdout)
-    handler.setFormatter(fmt)
+
+def setup_logging(
+    level: str = "INFO",
+    log_format: str = "text",
+    queue_size: int = 10000,
+    overflow: str = "drop_new",
+    sample_rates: Optional[dict[str, float]] = None,
+) -> None:
+    """Route all records through a bounded in-memory queue; a listener thread does the actual I/O.
+
+    The event loop only pays for putting a record on the queue, so a slow stdout pipe can no
+    longer stall request handling.
+    """
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(_build_formatter(log_format))
+
+    log_queue: queue.Queue = queue.Queue(maxsize=queue_size)
+    queue_handler = BoundedQueueHandler(log_queue, overflow=overflow)
+    if sample_rates:
+        queue_handler.addFilter(SamplingFilter(sample_rates))
 
     root = logging.getLogger()
-    root.setLevel(logging.INFO)
-    root.addHandler(handler)
+    root.setLevel(level)
+    for handler in list(root.handlers):
+        if isinstance(handler, BoundedQueueHandler):
+            root.removeHandler(handler)
+    root.addHandler(queue_handler)
+
+    _listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+    atexit.unregister(shutdown_logging)
+    atexit.register(shutdown_logging)
 
     logging.getLogger("uvicorn.access").handlers = []
     logging.getLogger("uvicorn.access").propagate = True
 
 
+def shutdown_logging() -> None:
+    """Flush queued records and stop the listener thread."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
 def get_logger(name: str) -> logging.Logger:
-    return logging.getLogger(name)
\ No newline at end of file
+    return logging.getLogger(name)
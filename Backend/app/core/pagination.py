@@ -0,0 +1,108 @@
+import base64
+import json
+from datetime import date, datetime
+from typing import Any, Literal, Optional, Sequence
+
+from fastapi import HTTPException, status
+from sqlalchemy import Select, and_, asc, desc, or_, tuple_
+from sqlalchemy.orm import InstrumentedAttribute
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+SortOrder = Literal["asc", "desc"]
+
+
+def _to_json(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+
+def _from_json(column: InstrumentedAttribute, value: Any) -> Any:
+    if value is None:
+        return None
+    python_type = column.type.python_type
+    if python_type is datetime:
+        return datetime.fromisoformat(value)
+    if python_type is date:
+        return date.fromisoformat(value)
+    return python_type(value)
+
+
+def encode_cursor(sort_field: str, order: SortOrder, value: Any, row_id: int) -> str:
+    payload = json.dumps({"f": sort_field, "o": order, "v": _to_json(value), "id": row_id}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def _invalid_cursor() -> HTTPException:
+    return HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Некорректный курсор")
+
+
+def decode_cursor(cursor: str, sort_field: str, order: SortOrder, column: InstrumentedAttribute) -> tuple[Any, int]:
+    """(sort value, id) stored in the cursor; it must come from a listing with the same sort."""
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        if payload["f"] != sort_field or payload["o"] != order:
+            raise ValueError("cursor belongs to another sort")
+        return _from_json(column, payload["v"]), int(payload["id"])
+    except (ValueError, TypeError, KeyError):
+        raise _invalid_cursor()
+
+
+def keyset_page(
+    query: Select,
+    sort_column: InstrumentedAttribute,
+    id_column: InstrumentedAttribute,
+    order: SortOrder,
+    cursor: Optional[tuple[Any, int]],
+    limit: int,
+) -> Select:
+    """Order by (sort_column, id) and return the `limit + 1` rows after `cursor`.
+
+    The extra row tells whether another page exists (see `next_cursor`). NULL sort values
+    are placed last for ascending and first for descending order, as PostgreSQL does by default.
+    """
+    descending = order == "desc"
+    direction = desc if descending else asc
+    if sort_column is id_column:
+        query = query.order_by(direction(id_column))
+        if cursor is not None:
+            query = query.where(id_column < cursor[1] if descending else id_column > cursor[1])
+        return query.limit(limit + 1)
+
+    sort_key = direction(sort_column)
+    if sort_column.expression.nullable:
+        sort_key = sort_key.nulls_first() if descending else sort_key.nulls_last()
+    query = query.order_by(sort_key, direction(id_column))
+
+    if cursor is not None:
+        value, last_id = cursor
+        after_id = id_column < last_id if descending else id_column > last_id
+        if value is None:
+            condition = and_(sort_column.is_(None), after_id)
+            if descending:
+                condition = or_(condition, sort_column.is_not(None))
+        else:
+            row = tuple_(sort_column, id_column)
+            condition = row < (value, last_id) if descending else row > (value, last_id)
+            if sort_column.expression.nullable and not descending:
+                condition = or_(condition, sort_column.is_(None))
+        query = query.where(condition)
+
+    return query.limit(limit + 1)
+
+
+def next_cursor(
+    rows: Sequence[Any], sort_field: str, order: SortOrder, limit: int
+) -> tuple[list[Any], Optional[str]]:
+    """Trim the look-ahead row from a keyset_page result and build the cursor for the next page."""
+    if len(rows) <= limit:
+        return list(rows), None
+    page = list(rows[:limit])
+    last = page[-1]
+    return page, encode_cursor(sort_field, order, getattr(last, sort_field), last.id)
+
+
+def cursor_headers(cursor: Optional[str]) -> dict[str, str]:
+    # The list bodies stay plain arrays for existing clients; the next page travels in a header.
+    return {NEXT_CURSOR_HEADER: cursor} if cursor else {}
@@ -0,0 +1,142 @@
+import asyncio
+import cProfile
+import io
+import pstats
+import time
+import uuid
+from collections import deque
+from datetime import datetime, UTC
+from typing import Any, Optional
+
+from app.core import query_stats
+from app.core.config import settings
+
+PROFILE_HEADER = "X-Profile"
+PROFILE_QUERY_PARAM = "_profile"
+
+# Functions whose cumulative time is reported as response serialization.
+SERIALIZATION_FUNCTIONS = {
+    ("fastapi/routing.py", "serialize_response"),
+    ("starlette/responses.py", "render"),
+    ("fastapi/responses.py", "render"),
+}
+
+FunctionKey = tuple[str, int, str]
+
+
+def _label(func: FunctionKey) -> str:
+    filename, lineno, name = func
+    if filename == "~":
+        return name
+    return f"{filename.rsplit('/app/', 1)[-1]}:{lineno}({name})"
+
+
+def _serialization_ms(stats: pstats.Stats) -> float:
+    total = 0.0
+    for (filename, _lineno, name), (_cc, _nc, _tt, ct, _callers) in stats.stats.items():  # type: ignore[attr-defined]
+        if any(filename.endswith(path) and name == func for path, func in SERIALIZATION_FUNCTIONS):
+            total += ct
+    return total * 1000
+
+
+def _call_tree(stats: pstats.Stats, max_depth: int, min_share: float) -> list[dict[str, Any]]:
+    """Callee tree built from cProfile caller edges, pruned to branches above min_share of wall time."""
+    raw = stats.stats  # type: ignore[attr-defined]
+    callees: dict[FunctionKey, list[tuple[FunctionKey, int, float, float]]] = {}
+    for func, (_cc, _nc, _tt, _ct, callers) in raw.items():
+        for caller, (_ccc, ncalls, tottime, cumtime) in callers.items():
+            callees.setdefault(caller, []).append((func, ncalls, tottime, cumtime))
+
+    roots = [func for func, (*_, callers) in raw.items() if not callers]
+    total = sum(raw[func][3] for func in roots) or stats.total_tt or 1.0  # type: ignore[attr-defined]
+
+    def build(func: FunctionKey, ncalls: int, tottime: float, cumtime: float, depth: int, path: set) -> dict:
+        node = {
+            "function": _label(func),
+            "calls": ncalls,
+            "own_ms": round(tottime * 1000, 3),
+            "cumulative_ms": round(cumtime * 1000, 3),
+            "children": [],
+        }
+        if depth >= max_depth:
+            return node
+        for child, child_calls, child_tt, child_ct in sorted(callees.get(func, []), key=lambda c: -c[3]):
+            if child in path or child_ct / total < min_share:
+                continue
+            node["children"].append(build(child, child_calls, child_tt, child_ct, depth + 1, path | {child}))
+        return node
+
+    trees = []
+    for func in sorted(roots, key=lambda f: -raw[f][3]):
+        _cc, nc, tt, ct, _callers = raw[func]
+        if ct / total >= min_share:
+            trees.append(build(func, nc, tt, ct, 0, {func}))
+    return trees
+
+
+class RequestProfiler:
+    """Profiles single requests with cProfile and keeps the most recent results in memory.
+
+    cProfile hooks the whole event-loop thread, so only one request is profiled at a time and
+    concurrent requests running on the loop during that window show up in the tree too.
+    """
+
+    def __init__(self, max_profiles: int):
+        self._profiles: deque[dict[str, Any]] = deque(maxlen=max_profiles)
+        self._lock = asyncio.Lock()
+
+    @property
+    def busy(self) -> bool:
+        return self._lock.locked()
+
+    async def profile(self, call_next, request) -> tuple[Any, Optional[dict[str, Any]]]:
+        if self._lock.locked():
+            return await call_next(request), None
+
+        async with self._lock:
+            profiler = cProfile.Profile()
+            db_stats = query_stats.current_stats()
+            db_count_before = db_stats.count if db_stats else 0
+            db_ms_before = db_stats.total_ms if db_stats else 0.0
+
+            wall_start = time.perf_counter()
+            cpu_start = time.thread_time()
+            profiler.enable()
+            try:
+                response = await call_next(request)
+            finally:
+                profiler.disable()
+            cpu_ms = (time.thread_time() - cpu_start) * 1000
+            wall_ms = (time.perf_counter() - wall_start) * 1000
+
+        stats = pstats.Stats(profiler)
+        text = io.StringIO()
+        pstats.Stats(profiler, stream=text).sort_stats("cumulative").print_stats(40)
+
+        route = request.scope.get("route")
+        result = {
+            "id": uuid.uuid4().hex[:12],
+            "created_at": datetime.now(UTC),
+            "method": request.method,
+            "path": request.url.path,
+            "route": getattr(route, "path", None),
+            "status_code": response.status_code,
+            "wall_ms": round(wall_ms, 3),
+            "cpu_ms": round(cpu_ms, 3),
+            "db_queries": (db_stats.count - db_count_before) if db_stats else 0,
+            "db_ms": round((db_stats.total_ms - db_ms_before) if db_stats else 0.0, 3),
+            "serialization_ms": round(_serialization_ms(stats), 3),
+            "call_tree": _call_tree(stats, max_depth=settings.PROFILER_TREE_DEPTH, min_share=0.01),
+            "text": text.getvalue(),
+        }
+        self._profiles.append(result)
+        return response, result
+
+    def recent(self) -> list[dict[str, Any]]:
+        return list(reversed(self._profiles))
+
+    def get(self, profile_id: str) -> Optional[dict[str, Any]]:
+        return next((p for p in self._profiles if p["id"] == profile_id), None)
+
+
+profiler = RequestProfiler(max_profiles=settings.PROFILER_MAX_PROFILES)
@@ -0,0 +1,79 @@
+import re
+import time
+from collections import Counter
+from contextvars import ContextVar, Token
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+_LITERAL_RE = re.compile(r"('(?:[^']|'')*'|\$\d+|%\(\w+\)s|\b\d+(?:\.\d+)?\b)")
+_IN_LIST_RE = re.compile(r"\bIN\s*\((?:\s*\?\s*,?)+\)", re.IGNORECASE)
+_POSTCOMPILE_RE = re.compile(r"\(__\[POSTCOMPILE_\w+\]\)")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalize_statement(statement: str) -> str:
+    """Reduce a SQL statement to its shape so repeated executions can be grouped."""
+    statement = _POSTCOMPILE_RE.sub("(?)", statement)
+    statement = _LITERAL_RE.sub("?", statement)
+    statement = _IN_LIST_RE.sub("IN (?)", statement)
+    return _WHITESPACE_RE.sub(" ", statement).strip()
+
+
+class RequestQueryStats:
+    """Statements executed while serving one request."""
+
+    def __init__(self):
+        self.count = 0
+        self.total_ms = 0.0
+        self.statements: Counter[str] = Counter()
+
+    def observe(self, statement: str, duration_ms: float) -> None:
+        self.count += 1
+        self.total_ms += duration_ms
+        self.statements[normalize_statement(statement)] += 1
+
+    def repeated_statements(self, threshold: int) -> list[tuple[str, int]]:
+        return [(sql, n) for sql, n in self.statements.most_common() if n > threshold]
+
+    def server_timing(self, total_ms: float) -> str:
+        return (
+            f'db;dur={self.total_ms:.1f};desc="{self.count} queries", '
+            f"app;dur={max(total_ms - self.total_ms, 0.0):.1f}, "
+            f"total;dur={total_ms:.1f}"
+        )
+
+
+_current_stats: ContextVar[RequestQueryStats | None] = ContextVar("request_query_stats", default=None)
+
+
+def begin_request() -> tuple[RequestQueryStats, Token]:
+    stats = RequestQueryStats()
+    return stats, _current_stats.set(stats)
+
+
+def end_request(token: Token) -> None:
+    _current_stats.reset(token)
+
+
+def current_stats() -> RequestQueryStats | None:
+    return _current_stats.get()
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    # Kept on the execution context rather than a per-connection stack: a statement that fails
+    # never reaches after_cursor_execute, and errors raised before this hook (connect, compile)
+    # must not disturb the timing of any other statement.
+    context._query_start_time = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    start = getattr(context, "_query_start_time", None)
+    stats = _current_stats.get()
+    if start is not None and stats is not None:
+        stats.observe(statement, (time.perf_counter() - start) * 1000)
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    event.listen(engine.sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine.sync_engine, "after_cursor_execute", _after_cursor_execute)
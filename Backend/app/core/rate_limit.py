@@ -0,0 +1,38 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Hashable
+
+
+class TokenBucketLimiter:
+    """Token buckets per key: `burst` tokens, refilled at `rate_per_second`.
+
+    Only the `max_keys` most recently used keys are tracked; an evicted key simply starts
+    again with a full bucket.
+    """
+
+    def __init__(self, rate_per_second: float, burst: int, max_keys: int = 100_000):
+        self.rate = rate_per_second
+        self.burst = burst
+        self.max_keys = max_keys
+        self._buckets: OrderedDict[Hashable, tuple[float, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def acquire(self, key: Hashable) -> float:
+        """Take one token; returns 0 when allowed, otherwise seconds until a token is available."""
+        now = time.monotonic()
+        with self._lock:
+            tokens, updated_at = self._buckets.get(key, (float(self.burst), now))
+            tokens = min(float(self.burst), tokens + (now - updated_at) * self.rate)
+
+            if tokens >= 1.0:
+                self._buckets[key] = (tokens - 1.0, now)
+                retry_after = 0.0
+            else:
+                self._buckets[key] = (tokens, now)
+                retry_after = (1.0 - tokens) / self.rate if self.rate > 0 else float("inf")
+
+            self._buckets.move_to_end(key)
+            while len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+            return retry_after
@@ -0,0 +1,120 @@
+"""File storage backends.
+
+Callers go through `get_storage()` and never talk to a vendor SDK directly, so tests and local
+development can use the filesystem (STORAGE_BACKEND=local) while production uses Cloudinary.
+Blocking SDK and disk calls run on a small dedicated thread pool, not the default executor.
+"""
+
+import asyncio
+import mimetypes
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from types import ModuleType
+from typing import Callable, Optional, TypeVar
+
+from app.core.config import settings
+
+T = TypeVar("T")
+
+
+class StorageBackend(ABC):
+    def __init__(self, threads: int):
+        self.threads = threads
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    async def _run(self, fn: Callable[..., T], *args) -> T:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.threads, thread_name_prefix="storage")
+        return await asyncio.get_running_loop().run_in_executor(self._executor, fn, *args)
+
+    @abstractmethod
+    async def put(self, key: str, data: bytes, content_type: str, crop_size: Optional[int] = None) -> str:
+        """
+        Store `data` under `key` (overwriting) and return its public URL. With crop_size the
+        backend crops the image to that square itself, if it can.
+        """
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        """Remove `key`; a missing key is not an error."""
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+class LocalStorage(StorageBackend):
+    """Files under `root`, served by the app at `base_url` (see create_app)."""
+
+    def __init__(self, root: str, base_url: str, threads: int = 1):
+        super().__init__(threads)
+        self.root = Path(root)
+        self.base_url = base_url.rstrip("/")
+
+    def _write(self, name: str, data: bytes) -> None:
+        path = self.root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(path.name + ".tmp")
+        tmp.write_bytes(data)
+        tmp.replace(path)
+
+    def _remove(self, key: str) -> None:
+        path = self.root / key
+        for stored in path.parent.glob(f"{path.name}.*"):
+            stored.unlink(missing_ok=True)
+
+    async def put(self, key: str, data: bytes, content_type: str, crop_size: Optional[int] = None) -> str:
+        # Keys carry no extension (as with Cloudinary public ids); the file gets one so it is served
+        # with the right content type.
+        name = key + (mimetypes.guess_extension(content_type) or "")
+        await self._run(self._remove, key)
+        await self._run(self._write, name, data)
+        # Same key on every upload: the version parameter keeps browsers from showing the old file.
+        return f"{self.base_url}/{name}?v={int(time.time())}"
+
+    async def delete(self, key: str) -> None:
+        await self._run(self._remove, key)
+
+
+class CloudinaryStorage(StorageBackend):
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def _uploader() -> ModuleType:
+        """Import and configure the Cloudinary SDK on first use instead of at app startup."""
+        import cloudinary
+        import cloudinary.uploader
+
+        cloudinary.config(
+            cloud_name=settings.CLOUDINARY_CLOUD_NAME,
+            api_key=settings.CLOUDINARY_API_KEY,
+            api_secret=settings.CLOUDINARY_API_SECRET,
+            secure=True,
+        )
+        return cloudinary.uploader
+
+    async def put(self, key: str, data: bytes, content_type: str, crop_size: Optional[int] = None) -> str:
+        transformation = [{"quality": "auto"}, {"fetch_format": "auto"}]
+        if crop_size:
+            transformation.insert(0, {"width": crop_size, "height": crop_size, "crop": "fill", "gravity": "face"})
+        result = await self._run(lambda: self._uploader().upload(
+            data,
+            public_id=key,
+            overwrite=True,
+            resource_type="image",
+            transformation=transformation,
+        ))
+        return result["secure_url"]
+
+    async def delete(self, key: str) -> None:
+        await self._run(lambda: self._uploader().destroy(key))
+
+
+@lru_cache(maxsize=1)
+def get_storage() -> StorageBackend:
+    if settings.STORAGE_BACKEND == "local":
+        return LocalStorage(settings.LOCAL_STORAGE_PATH, settings.LOCAL_STORAGE_URL, settings.STORAGE_UPLOAD_THREADS)
+    return CloudinaryStorage(settings.STORAGE_UPLOAD_THREADS)
@@ -2,14 +2,29 @@ import time
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, Request
+from fastapi.responses import ORJSONResponse, PlainTextResponse
+from sqlalchemy.orm.exc import StaleDataError
 from starlette.middleware.cors import CORSMiddleware
+from starlette.staticfiles import StaticFiles
 
+from app.core import metrics, profiling, query_stats
+from app.core.compression import CompressionMiddleware
 from app.core.config import settings
-from app.core.db import init_db
+from app.core.db import check_schema, db_manager, init_db
+from app.core.pagination import NEXT_CURSOR_HEADER
+from app.core.security import password_hasher
+from app.core.storage import get_storage
 from app.core.logging import setup_logging, get_logger
 
-setup_logging()
+setup_logging(
+    level=settings.LOG_LEVEL,
+    log_format=settings.LOG_FORMAT,
+    queue_size=settings.LOG_QUEUE_SIZE,
+    overflow=settings.LOG_QUEUE_OVERFLOW,
+    sample_rates=settings.LOG_SAMPLE_RATES,
+)
 logger = get_logger("app")
+request_logger = get_logger("app.requests")
 from app.modules.statistics.api.task_points_history import task_points_history_service
 from app.modules.statistics.models import user_statistic, company_statistic
 
@@ -23,21 +38,52 @@ from app.modules.statistics.models.user_statistic import UserStatistic  # noqa:
 from app.modules.statistics.models.company_statistic import CompanyStatistic  # noqa: F401
 from app.modules.statistics.models.task_point_history import TaskPointHistory  # noqa: F401
 from app.modules.users.models.user import User  # noqa: F401
+from app.modules.auth.model.revoked_token import RevokedToken  # noqa: F401
 
 from app.modules.auth.api import auth
+from app.modules.auth.service.revocation import revocation_list
+from app.modules.base_module.dependencies import get_request_role
+from app.modules.base_module.enums import Role
 from app.modules.company.api import company
+from app.modules.monitoring.api import monitoring
+from app.modules.search.api import search
 from app.modules.task.api import task
 from app.modules.users.api import user, position
+from app.modules.users.services.avatar import avatar_pipeline
+from app.modules.users.services.position_cache import position_cache
+from app.modules.users.services.user_import import shutdown_hash_pool
 from app.modules.statistics.api import difficulty_config, task_points_history, user_statistics, company_statistics
 
 
+def _route_path(request: Request) -> str:
+    """Route template (e.g. /api/v1/task/{task_id}) so logs and metrics do not explode per id."""
+    route = request.scope.get("route")
+    return getattr(route, "path", None) or request.url.path
+
+
 @asynccontextmanager
 async def lifespan(_app: FastAPI):
     logger.info("Starting up %s v%s", settings.PROJECT_NAME, settings.VERSION)
-    await init_db()
-    logger.info("Database initialized")
+    if settings.DB_SCHEMA_STARTUP == "create_all":
+        await init_db()
+        logger.info("Database initialized")
+    elif settings.DB_SCHEMA_STARTUP == "check":
+        await check_schema()
+        logger.info("Database schema is at head")
+    await revocation_list.start()
+    try:
+        await position_cache.warm()
+    except Exception as e:
+        logger.error("Position cache warm-up failed, loading on first use: %s", e)
+    avatar_pipeline.start()
     yield
     logger.info("Shutting down")
+    await revocation_list.stop()
+    await avatar_pipeline.stop()
+    get_storage().shutdown()
+    password_hasher.shutdown()
+    shutdown_hash_pool()
+    await db_manager.dispose()
 
 
 def create_app() -> FastAPI:
@@ -46,6 +92,7 @@ def create_app() -> FastAPI:
         version=settings.VERSION,
         debug=settings.DEBUG,
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
     )
 
     app.add_middleware(
@@ -54,6 +101,15 @@ def create_app() -> FastAPI:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*" ""],
+        expose_headers=[NEXT_CURSOR_HEADER],
+    )
+    # Added before the @app.middleware functions so it sits inside them and sees whole bodies.
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.COMPRESSION_MIN_SIZE,
+        gzip_level=settings.COMPRESSION_GZIP_LEVEL,
+        brotli_quality=settings.COMPRESSION_BROTLI_QUALITY,
+        offload_size=settings.COMPRESSION_OFFLOAD_SIZE,
     )
 
     app.include_router(auth.router, prefix="/api/v1")
@@ -65,21 +121,91 @@ def create_app() -> FastAPI:
     app.include_router(task_points_history.router, prefix="/api/v1")
     app.include_router(user_statistics.router, prefix="/api/v1")
     app.include_router(company_statistics.router, prefix="/api/v1")
+    app.include_router(search.router, prefix="/api/v1")
+    app.include_router(monitoring.router, prefix="/api/v1")
+
+    if settings.STORAGE_BACKEND == "local":
+        app.mount(
+            settings.LOCAL_STORAGE_URL,
+            StaticFiles(directory=settings.LOCAL_STORAGE_PATH, check_dir=False),
+            name="media",
+        )
+
+    @app.exception_handler(StaleDataError)
+    async def concurrent_update(request: Request, exc: StaleDataError):
+        # A versioned row (Task.version) was changed by another request between our read and write.
+        logger.warning("Concurrent update rejected in %s %s: %s", request.method, _route_path(request), exc)
+        return ORJSONResponse(
+            status_code=409, content={"detail": "Данные были изменены другим запросом, повторите попытку"}
+        )
+
+    @app.middleware("http")
+    async def profile_requests(request: Request, call_next):
+        # Registered before log_requests so it runs inside it and sees the request's SQL stats.
+        wants_profile = (
+            request.headers.get(profiling.PROFILE_HEADER) == "1"
+            or request.query_params.get(profiling.PROFILE_QUERY_PARAM) == "1"
+        )
+        if not (settings.PROFILING_ENABLED and wants_profile):
+            return await call_next(request)
+
+        if await get_request_role(request) != Role.ADMIN:
+            return await call_next(request)
+
+        response, profile = await profiling.profiler.profile(call_next, request)
+        if profile is None:
+            response.headers["X-Profile-Status"] = "busy"
+        else:
+            response.headers["X-Profile-Id"] = profile["id"]
+        return response
 
     @app.middleware("http")
     async def log_requests(request: Request, call_next):
         start = time.perf_counter()
-        response = await call_next(request)
+        stats, token = query_stats.begin_request()
+        try:
+            response = await call_next(request)
+        finally:
+            query_stats.end_request(token)
         duration_ms = (time.perf_counter() - start) * 1000
-        logger.info(
-            "%s %s -> %s (%.1fms)",
+        response.headers["Server-Timing"] = stats.server_timing(duration_ms)
+        request_logger.info(
+            "%s %s -> %s (%.1fms, db: %d queries %.1fms)",
             request.method,
             request.url.path,
             response.status_code,
             duration_ms,
+            stats.count,
+            stats.total_ms,
         )
+        for statement, executions in stats.repeated_statements(settings.SQL_N_PLUS_ONE_THRESHOLD):
+            logger.warning(
+                "Possible N+1 in %s %s: statement executed %d times: %s",
+                request.method,
+                _route_path(request),
+                executions,
+                statement[:300],
+            )
         return response
 
+    @app.middleware("http")
+    async def collect_metrics(request: Request, call_next):
+        start = time.perf_counter()
+        status_code = 500
+        metrics.HTTP_REQUESTS_IN_FLIGHT.inc(method=request.method)
+        try:
+            response = await call_next(request)
+            status_code = response.status_code
+            return response
+        finally:
+            metrics.HTTP_REQUESTS_IN_FLIGHT.dec(method=request.method)
+            # Unmatched paths share one label so scanners cannot blow up cardinality.
+            route = _route_path(request) if "route" in request.scope else "unmatched"
+            metrics.HTTP_REQUEST_DURATION.observe(
+                time.perf_counter() - start, method=request.method, route=route
+            )
+            metrics.HTTP_REQUESTS.inc(method=request.method, route=route, status=str(status_code))
+
     return app
 
 
@@ -89,3 +215,8 @@ app = create_app()
 @app.get("/")
 async def health_check():
     return {"status": "ok", "version": settings.VERSION}
+
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics_endpoint() -> PlainTextResponse:
+    return PlainTextResponse(metrics.REGISTRY.render(), media_type=metrics.CONTENT_TYPE)
@@ -1,14 +1,17 @@
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from fastapi.security import HTTPAuthorizationCredentials
 from sqlalchemy import select  # ← уже есть
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.client_ip import client_ip
 from app.core.db import get_db
-from app.core.security import hash_password  # ← добавь эту строку
+from app.core.security import password_hasher
 from app.modules.auth.service.auth import AuthService, security
-from app.modules.auth.schemas.auth import Token, LoginRequest, RefreshRequest, RegisterCompanyRequest
+from app.modules.auth.service.login_guard import login_guard
+from app.modules.auth.service.revocation import revoke_token
+from app.modules.auth.schemas.auth import Token, LoginRequest, LogoutRequest, RefreshRequest, RegisterCompanyRequest
 from app.modules.users.services.user import UserService
 from app.modules.users.schemas.user import UserResponse
 from app.modules.users.models.user import User  # ← добавь
@@ -31,7 +34,8 @@ UserServiceDep = Annotated[UserService, Depends(get_user_service)]
 
 
 @router.post("/login", response_model=Token)
-async def login(credentials: LoginRequest, service: AuthServiceDep):
+async def login(credentials: LoginRequest, request: Request, service: AuthServiceDep):
+    login_guard.admit(credentials.login, client_ip(request))
     user = await service.authenticate_user(credentials.login, credentials.password)
 
     if not user:
@@ -77,6 +81,26 @@ async def refresh_token(
     )
 
 
+@router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
+async def logout(
+    service: AuthServiceDep,
+    credentials: Annotated[HTTPAuthorizationCredentials, Depends(security)],
+    logout_data: LogoutRequest | None = None,
+):
+    access_data = service.verify_token(credentials.credentials, "access")
+    if not access_data:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Невалидный токен или токен истёк",
+        )
+    revoke_token(service.db, access_data)
+
+    if logout_data and logout_data.refresh_token:
+        refresh_data = service.verify_token(logout_data.refresh_token, "refresh")
+        if refresh_data and refresh_data.sub == access_data.sub:
+            revoke_token(service.db, refresh_data)
+
+
 @router.get("/me", response_model=UserResponse)
 async def get_me(
     service: AuthServiceDep,
@@ -101,7 +125,7 @@ async def register_company(
     # 2. Создать владельца БЕЗ company_id
     user = User(
         login=data.login,
-        hashed_password=hash_password(data.password),
+        hashed_password=await password_hasher.hash(data.password),
         first_name=data.first_name,
         last_name=data.last_name,
         date_of_birth=data.date_of_birth,
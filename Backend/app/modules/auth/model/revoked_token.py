@@ -0,0 +1,31 @@
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.db import Base
+
+
+class RevokedToken(Base):
+    """A revoked token (jti set) or a cut-off for all of a user's tokens (not_before set)."""
+
+    __tablename__ = "revoked_token"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    jti: Mapped[Optional[str]] = mapped_column(String(64), nullable=True, unique=True)
+    user_id: Mapped[Optional[int]] = mapped_column(
+        ForeignKey("user.id", ondelete="CASCADE"), nullable=True
+    )
+    # Tokens of user_id issued before this moment are rejected.
+    not_before: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    # After this the revoked token(s) would have expired anyway and the row can be dropped.
+    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+
+    __table_args__ = (
+        Index("idx_revoked_token_created_at", "created_at"),
+        Index("idx_revoked_token_expires_at", "expires_at"),
+    )
@@ -1,8 +1,9 @@
 from datetime import datetime, date
-from typing import Annotated
+from typing import Annotated, Optional
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
+from app.modules.base_module.enums import Role
 from app.modules.users.schemas.user import validate_strong_password
 
 
@@ -16,6 +17,20 @@ class TokenPayload(BaseModel):
     sub: str  # User ID as string (JWT standard requires string)
     exp: int  # Unix timestamp
     type: str
+    # Missing in tokens issued before revocation support.
+    jti: Optional[str] = None
+    iat: Optional[int] = None
+
+
+class Principal(BaseModel):
+    """The authenticated caller as seen by route dependencies; cached between requests."""
+
+    model_config = ConfigDict(frozen=True)
+
+    id: int
+    role: Role
+    company_id: Optional[int] = None
+    head_of_group: bool = False
 
 
 class LoginRequest(BaseModel):
@@ -27,6 +42,10 @@ class RefreshRequest(BaseModel):
     refresh_token: str
 
 
+class LogoutRequest(BaseModel):
+    refresh_token: Optional[str] = None
+
+
 class RegisterCompanyRequest(BaseModel):
     company_name: str
     company_description: str | None = None
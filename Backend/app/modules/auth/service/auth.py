@@ -1,3 +1,6 @@
+import hashlib
+import time
+import uuid
 from datetime import datetime, timedelta, UTC
 from typing import Optional
 
@@ -8,10 +11,16 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from app.core.cache import TTLCache
 from app.core.config import settings
 from app.core.logging import get_logger
-from app.core.security import verify_password
-from app.modules.auth.schemas.auth import TokenPayload
+from app.core.metrics import REGISTRY
+from app.core.security import password_hasher
+from app.modules.auth.schemas.auth import Principal, TokenPayload
+from app.modules.auth.service.login_guard import login_guard
+from app.modules.auth.service.principal_cache import principal_cache
+from app.modules.auth.service.revocation import revocation_list
+from app.modules.users.models.position import Position
 from app.modules.users.models.user import User
 
 logger = get_logger("auth")
@@ -19,17 +28,30 @@ logger = get_logger("auth")
 
 security = HTTPBearer()
 
+TOKEN_CACHE_LOOKUPS = REGISTRY.counter(
+    "token_cache_lookups_total",
+    "Verified-token cache lookups by result.",
+    ("result",),
+)
+
+# sha256(token) -> payload of a token whose signature was already verified; entries expire at exp.
+_verified_tokens: TTLCache[bytes, TokenPayload] = TTLCache(
+    maxsize=max(settings.TOKEN_CACHE_MAX_SIZE, 1), ttl=0
+)
+
 
 class AuthService:
     def __init__(self, db: AsyncSession):
         self.db = db
 
     def create_access_token(self, user_id: int) -> str:
-        expire = datetime.now(UTC) + timedelta(
+        now = datetime.now(UTC)
+        expire = now + timedelta(
             minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES
         )
         payload = TokenPayload(
-            sub=str(user_id), exp=int(expire.timestamp()), type="access"
+            sub=str(user_id), exp=int(expire.timestamp()), type="access",
+            jti=uuid.uuid4().hex, iat=int(now.timestamp()),
         )
         return jwt.encode(
             payload.model_dump(), settings.SECRET_KEY, algorithm=settings.ALGORITHM
@@ -37,49 +59,81 @@ class AuthService:
 
     def create_refresh_token(self, user_id: int) -> str:
         """Создать refresh токен"""
-        expire = datetime.now(UTC) + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
+        now = datetime.now(UTC)
+        expire = now + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
         payload = TokenPayload(
-            sub=str(user_id), exp=int(expire.timestamp()), type="refresh"
+            sub=str(user_id), exp=int(expire.timestamp()), type="refresh",
+            jti=uuid.uuid4().hex, iat=int(now.timestamp()),
         )
         return jwt.encode(
             payload.model_dump(), settings.SECRET_KEY, algorithm=settings.ALGORITHM
         )
 
     def verify_token(self, token: str, token_type: str) -> Optional[TokenPayload]:
+        token_data = self._decode_token(token)
+        if token_data is None:
+            return None
+
+        if token_data.type != token_type:
+            logger.warning("Token type mismatch: expected=%s got=%s", token_type, token_data.type)
+            return None
+
+        if revocation_list.is_revoked(token_data):
+            logger.warning("Revoked %s token presented for user id=%s", token_type, token_data.sub)
+            return None
+
+        return token_data
+
+    @staticmethod
+    def _decode_token(token: str) -> Optional[TokenPayload]:
+        use_cache = settings.TOKEN_CACHE_MAX_SIZE > 0
+        if use_cache:
+            key = hashlib.sha256(token.encode()).digest()
+            cached = _verified_tokens.get(key)
+            if cached is not None:
+                TOKEN_CACHE_LOOKUPS.inc(result="hit")
+                return cached
+            TOKEN_CACHE_LOOKUPS.inc(result="miss")
+
         try:
             payload = jwt.decode(
                 token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
             )
             token_data = TokenPayload(**payload)
-
-            if token_data.type != token_type:
-                logger.warning("Token type mismatch: expected=%s got=%s", token_type, token_data.type)
-                return None
-
-            return token_data
         except JWTError as e:
             logger.warning("Token verification failed: %s", e)
             return None
 
+        if use_cache:
+            ttl = token_data.exp - time.time()
+            if ttl > 0:
+                _verified_tokens.set(key, token_data, ttl=ttl)
+        return token_data
+
     async def authenticate_user(self, login: str, password: str) -> Optional[User]:
         result = await self.db.execute(select(User).where(User.login == login))
         user = result.scalar_one_or_none()
 
         if not user:
             logger.warning("Login attempt with unknown login: %s", login)
+            await login_guard.unknown_login_delay()
             return None
 
-        if not verify_password(password, user.hashed_password):
+        async with login_guard.verification():
+            valid, new_hash = await password_hasher.verify_and_update(password, user.hashed_password)
+        if not valid:
             logger.warning("Invalid password for user id=%s login=%s", user.id, login)
             return None
 
+        if new_hash:
+            user.hashed_password = new_hash
+            logger.info("Password rehashed with current parameters for user id=%s", user.id)
+
         logger.info("User authenticated: id=%s login=%s", user.id, login)
         return user
 
-    async def get_current_user(self, credentials: HTTPAuthorizationCredentials) -> User:
-        token = credentials.credentials
-
-        token_data = self.verify_token(token, "access")
+    def _verify_access_token(self, credentials: HTTPAuthorizationCredentials) -> TokenPayload:
+        token_data = self.verify_token(credentials.credentials, "access")
         if not token_data:
             logger.warning("Unauthorized request: invalid or expired access token")
             raise HTTPException(
@@ -87,6 +141,44 @@ class AuthService:
                 detail="Невалидный токен или токен истёк",
                 headers={"WWW-Authenticate": "Bearer"},
             )
+        return token_data
+
+    async def load_principal(self, user_id: int) -> Optional[Principal]:
+        principal = principal_cache.get(user_id)
+        if principal is not None:
+            return principal
+
+        row = (await self.db.execute(
+            select(User.id, User.role, User.company_id, Position.head_of_group)
+            .outerjoin(Position, Position.id == User.position_id)
+            .where(User.id == user_id)
+        )).one_or_none()
+        if row is None:
+            return None
+
+        principal = Principal(
+            id=row.id,
+            role=row.role,
+            company_id=row.company_id,
+            head_of_group=bool(row.head_of_group),
+        )
+        principal_cache.set(user_id, principal)
+        return principal
+
+    async def get_current_principal(self, credentials: HTTPAuthorizationCredentials) -> Principal:
+        token_data = self._verify_access_token(credentials)
+
+        principal = await self.load_principal(int(token_data.sub))
+        if principal is None:
+            logger.warning("Token references non-existent user id=%s", token_data.sub)
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Пользователь не найден",
+            )
+        return principal
+
+    async def get_current_user(self, credentials: HTTPAuthorizationCredentials) -> User:
+        token_data = self._verify_access_token(credentials)
 
         result = await self.db.execute(
             select(User)
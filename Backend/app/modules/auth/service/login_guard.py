@@ -0,0 +1,110 @@
+import asyncio
+import math
+import random
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+from fastapi import HTTPException, status
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.core.metrics import REGISTRY
+from app.core.rate_limit import TokenBucketLimiter
+
+logger = get_logger("auth")
+
+LOGIN_REJECTIONS = REGISTRY.counter(
+    "login_rejections_total",
+    "Login attempts rejected before password verification.",
+    ("reason",),
+)
+
+
+class LoginGuard:
+    """Admission control for /auth/login so login floods cannot eat the Argon2 capacity.
+
+    - token buckets per login and per client IP;
+    - a cap on concurrent login verifications (the rest of the hashing pool stays available
+      for other endpoints); logins over the cap queue for a slot and get 503 only if none frees
+      up within LOGIN_VERIFICATION_WAIT_SECONDS;
+    - unknown logins take a verification slot and hold it for roughly as long as a real
+      verification takes instead of hashing a dummy password, so they cost no CPU but neither
+      their timing nor their 503s reveal that the login does not exist.
+    """
+
+    def __init__(self):
+        self.per_login = TokenBucketLimiter(
+            rate_per_second=settings.LOGIN_RATE_PER_LOGIN_PER_MINUTE / 60,
+            burst=settings.LOGIN_BURST_PER_LOGIN,
+            max_keys=settings.LOGIN_LIMITER_MAX_KEYS,
+        )
+        self.per_ip = TokenBucketLimiter(
+            rate_per_second=settings.LOGIN_RATE_PER_IP_PER_MINUTE / 60,
+            burst=settings.LOGIN_BURST_PER_IP,
+            max_keys=settings.LOGIN_LIMITER_MAX_KEYS,
+        )
+        self._verifications = asyncio.Semaphore(
+            settings.LOGIN_MAX_CONCURRENT_VERIFICATIONS
+            or settings.PASSWORD_HASH_WORKERS + settings.PASSWORD_HASH_MAX_PENDING // 2
+        )
+        self._wait_seconds = settings.LOGIN_VERIFICATION_WAIT_SECONDS
+        # Exponentially weighted average of real verification time, in seconds.
+        self._verify_seconds = 0.1
+
+    @staticmethod
+    def _reject(reason: str, retry_after: float, detail: str, status_code: int) -> HTTPException:
+        LOGIN_REJECTIONS.inc(reason=reason)
+        return HTTPException(
+            status_code=status_code,
+            detail=detail,
+            headers={"Retry-After": str(max(1, math.ceil(retry_after)))},
+        )
+
+    def admit(self, login: str, client_ip: str | None) -> None:
+        retry_after = self.per_ip.acquire(client_ip or "unknown")
+        if retry_after:
+            logger.warning("Login throttled for ip=%s", client_ip)
+            raise self._reject(
+                "ip", retry_after, "Слишком много попыток входа, повторите позже",
+                status.HTTP_429_TOO_MANY_REQUESTS,
+            )
+
+        retry_after = self.per_login.acquire(login.lower())
+        if retry_after:
+            logger.warning("Login throttled for login=%s", login)
+            raise self._reject(
+                "login", retry_after, "Слишком много попыток входа, повторите позже",
+                status.HTTP_429_TOO_MANY_REQUESTS,
+            )
+
+    @asynccontextmanager
+    async def _slot(self) -> AsyncIterator[None]:
+        try:
+            await asyncio.wait_for(self._verifications.acquire(), self._wait_seconds)
+        except asyncio.TimeoutError:
+            logger.warning("No login verification slot within %.1fs, rejecting request", self._wait_seconds)
+            raise self._reject(
+                "capacity", 1, "Сервер перегружен, повторите попытку позже",
+                status.HTTP_503_SERVICE_UNAVAILABLE,
+            )
+
+        try:
+            yield
+        finally:
+            self._verifications.release()
+
+    @asynccontextmanager
+    async def verification(self) -> AsyncIterator[None]:
+        async with self._slot():
+            start = time.perf_counter()
+            yield
+            self._verify_seconds = 0.8 * self._verify_seconds + 0.2 * (time.perf_counter() - start)
+
+    async def unknown_login_delay(self) -> None:
+        # Same slot and timeout as a real verification, so under load an unknown login gets the
+        # same 503 a known one would instead of a quick 401.
+        async with self._slot():
+            await asyncio.sleep(self._verify_seconds * random.uniform(0.9, 1.1))
+
+login_guard = LoginGuard()
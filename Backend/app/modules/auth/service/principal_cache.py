@@ -0,0 +1,26 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.db import on_commit
+from app.modules.auth.schemas.auth import Principal
+
+principal_cache: TTLCache[int, Principal] = TTLCache(
+    maxsize=settings.PRINCIPAL_CACHE_MAX_SIZE,
+    ttl=settings.PRINCIPAL_CACHE_TTL_SECONDS,
+)
+
+
+def invalidate_principal(db: AsyncSession, user_id: int) -> None:
+    """Drop the cached principal now and again once the transaction commits.
+
+    The second pop covers a concurrent request that re-cached the pre-commit row in between.
+    """
+    principal_cache.pop(user_id)
+    on_commit(db, lambda: principal_cache.pop(user_id))
+
+
+def invalidate_all_principals(db: AsyncSession) -> None:
+    """For changes that affect many users at once (positions, company removal)."""
+    principal_cache.clear()
+    on_commit(db, principal_cache.clear)
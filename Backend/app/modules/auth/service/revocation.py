@@ -0,0 +1,149 @@
+import asyncio
+import math
+import time
+from datetime import datetime, timedelta, UTC
+from typing import Iterable, Optional
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.bloom import BloomFilter
+from app.core.config import settings
+from app.core.db import db_manager, on_commit
+from app.core.logging import get_logger
+from app.modules.auth.model.revoked_token import RevokedToken
+from app.modules.auth.schemas.auth import TokenPayload
+
+logger = get_logger("auth.revocation")
+
+# Rows are picked up by created_at; re-read a little behind the high-water mark so rows from
+# transactions that committed late are not missed (applying a row twice is harmless).
+REFRESH_OVERLAP = timedelta(seconds=30)
+
+
+class RevocationList:
+    """In-process mirror of the revoked_token table.
+
+    Checking a token never touches the database: a Bloom filter answers "definitely not
+    revoked" for almost every jti, the exact set confirms the rare positive, and per-user
+    cut-offs handle "revoke everything issued before now". A background task pulls new rows
+    every TOKEN_REVOCATION_REFRESH_SECONDS and periodically rebuilds the filter without
+    expired entries.
+    """
+
+    def __init__(self, capacity: int, error_rate: float):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self._bloom = BloomFilter(capacity, error_rate)
+        self._jtis: set[str] = set()
+        self._user_cutoffs: dict[int, int] = {}
+        self._high_water: Optional[datetime] = None
+        self._last_rebuild = 0.0
+        self._task: Optional[asyncio.Task] = None
+
+    def add_jti(self, jti: str) -> None:
+        self._bloom.add(jti)
+        self._jtis.add(jti)
+
+    def add_user_cutoff(self, user_id: int, not_before: datetime) -> None:
+        # Round up: a token issued in the same second as the revocation is treated as revoked.
+        cutoff = math.ceil(not_before.timestamp())
+        self._user_cutoffs[user_id] = max(cutoff, self._user_cutoffs.get(user_id, 0))
+
+    def is_revoked(self, payload: TokenPayload) -> bool:
+        cutoff = self._user_cutoffs.get(int(payload.sub))
+        if cutoff is not None and (payload.iat is None or payload.iat < cutoff):
+            return True
+        jti = payload.jti
+        return jti is not None and jti in self._bloom and jti in self._jtis
+
+    def _apply(self, rows: Iterable[RevokedToken]) -> None:
+        for row in rows:
+            if row.jti:
+                self.add_jti(row.jti)
+            if row.user_id is not None and row.not_before is not None:
+                self.add_user_cutoff(row.user_id, row.not_before)
+            if self._high_water is None or row.created_at > self._high_water:
+                self._high_water = row.created_at
+
+    async def refresh(self) -> None:
+        query = select(RevokedToken).where(RevokedToken.expires_at > func.now())
+        if self._high_water is not None:
+            query = query.where(RevokedToken.created_at > self._high_water - REFRESH_OVERLAP)
+        async with db_manager.AsyncSessionLocal() as session:
+            rows = (await session.execute(query)).scalars().all()
+        self._apply(rows)
+
+    async def rebuild(self) -> None:
+        """Drop expired rows and reload everything into fresh structures."""
+        async with db_manager.AsyncSessionLocal() as session:
+            await session.execute(delete(RevokedToken).where(RevokedToken.expires_at <= func.now()))
+            await session.commit()
+            rows = (await session.execute(select(RevokedToken))).scalars().all()
+
+        fresh = RevocationList(max(self.capacity, 2 * len(rows)), self.error_rate)
+        fresh._apply(rows)
+        # Swap whole structures so concurrent checks never see a half-built filter.
+        self._bloom, self._jtis, self._user_cutoffs = fresh._bloom, fresh._jtis, fresh._user_cutoffs
+        self._high_water = fresh._high_water or self._high_water
+        self._last_rebuild = time.monotonic()
+        logger.info("Revocation list rebuilt: %d tokens, %d user cut-offs", len(self._jtis), len(self._user_cutoffs))
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(settings.TOKEN_REVOCATION_REFRESH_SECONDS)
+            try:
+                if time.monotonic() - self._last_rebuild >= settings.TOKEN_REVOCATION_REBUILD_SECONDS:
+                    await self.rebuild()
+                else:
+                    await self.refresh()
+            except Exception as e:
+                logger.error("Revocation list refresh failed: %s", e)
+
+    async def start(self) -> None:
+        try:
+            await self.rebuild()
+        except Exception as e:
+            logger.error("Initial revocation list load failed, retrying in background: %s", e)
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+revocation_list = RevocationList(
+    capacity=settings.TOKEN_REVOCATION_BLOOM_CAPACITY,
+    error_rate=settings.TOKEN_REVOCATION_BLOOM_ERROR_RATE,
+)
+
+
+def revoke_token(db: AsyncSession, payload: TokenPayload) -> None:
+    """Persist a single token's revocation; this worker applies it as soon as the transaction commits."""
+    if payload.jti is None:
+        # Tokens issued before jti existed can only be revoked together with the rest of the user's.
+        revoke_user_tokens(db, int(payload.sub))
+        return
+
+    db.add(RevokedToken(
+        jti=payload.jti,
+        user_id=int(payload.sub),
+        expires_at=datetime.fromtimestamp(payload.exp, UTC),
+    ))
+    on_commit(db, lambda: revocation_list.add_jti(payload.jti))
+
+
+def revoke_user_tokens(db: AsyncSession, user_id: int) -> None:
+    """Reject every token of user_id issued up to now (refresh tokens included)."""
+    now = datetime.now(UTC)
+    db.add(RevokedToken(
+        user_id=user_id,
+        not_before=now,
+        expires_at=now + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS),
+    ))
+    on_commit(db, lambda: revocation_list.add_user_cutoff(user_id, now))
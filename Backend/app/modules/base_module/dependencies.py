@@ -1,14 +1,14 @@
-from typing import Annotated
+from typing import Annotated, Optional
 
-from fastapi import Depends, status, HTTPException
+from fastapi import Depends, status, HTTPException, Request
 from fastapi.security import HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.db import get_db
+from app.core.db import get_db, db_manager
 from app.core.logging import get_logger
 from app.modules.base_module.enums import Role
+from app.modules.auth.schemas.auth import Principal
 from app.modules.auth.service.auth import security, AuthService
-from app.modules.users.models.user import User
 
 logger = get_logger("access")
 
@@ -16,15 +16,30 @@ logger = get_logger("access")
 async def get_current_user(
         credentials: Annotated[HTTPAuthorizationCredentials, Depends(security)],
         db: Annotated[AsyncSession, Depends(get_db)]
-):
+) -> Principal:
     auth_service = AuthService(db)
-    return await auth_service.get_current_user(credentials)
+    return await auth_service.get_current_principal(credentials)
 
 
-CurrentUser = Annotated[User, Depends(get_current_user)]
+CurrentUser = Annotated[Principal, Depends(get_current_user)]
+
+
+async def get_request_role(request: Request) -> Optional[Role]:
+    """Resolve the bearer token owner's role outside of route dependencies (for middleware)."""
+    scheme, _, token = request.headers.get("Authorization", "").partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return None
+
+    async with db_manager.AsyncSessionLocal() as session:
+        auth_service = AuthService(session)
+        token_data = auth_service.verify_token(token, "access")
+        if not token_data:
+            return None
+        principal = await auth_service.load_principal(int(token_data.sub))
+        return principal.role if principal else None
 
 def require_role(*allowed_roles: Role):
-    async def role_checker(current_user: CurrentUser) -> User:
+    async def role_checker(current_user: CurrentUser) -> Principal:
         if current_user.role not in allowed_roles:
             logger.warning(
                 "Access denied: user_id=%s role=%s required=%s",
@@ -60,3 +60,8 @@ class Priority(StrEnum):
     CRITICAL = "critical"
 
 
+class JobStatus(StrEnum):
+    PENDING = "pending"
+    PROCESSING = "processing"
+    DONE = "done"
+    FAILED = "failed"
@@ -1,9 +1,11 @@
 from typing import Annotated, List, Optional, Literal
 
-from fastapi import APIRouter, Depends, Query, HTTPException, status
+from fastapi import APIRouter, Depends, Query, HTTPException, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.db import get_db
+from app.core.db import get_db, get_read_db
+from app.core.http_cache import REVALIDATE, not_modified, set_cache_headers, weak_etag
+from app.modules.auth.schemas.auth import Principal
 from app.modules.base_module.dependencies import require_role, get_current_user
 from app.modules.base_module.enums import Role
 from app.modules.company.schemas.company import (
@@ -15,7 +17,6 @@ from app.modules.company.schemas.company import (
     CompanyOverviewResponse,
 )
 from app.modules.company.service.company import CompanyService
-from app.modules.users.models.user import User
 
 router = APIRouter(prefix="/company", tags=["Company"])
 
@@ -24,7 +25,12 @@ def get_company_service(db: Annotated[AsyncSession, Depends(get_db)]) -> Company
     return CompanyService(db)
 
 
+def get_company_read_service(db: Annotated[AsyncSession, Depends(get_read_db)]) -> CompanyService:
+    return CompanyService(db)
+
+
 ServiceDep = Annotated[CompanyService, Depends(get_company_service)]
+ReadServiceDep = Annotated[CompanyService, Depends(get_company_read_service)]
 
 
 @router.post(
@@ -33,14 +39,14 @@ ServiceDep = Annotated[CompanyService, Depends(get_company_service)]
 async def create_company(
     company_in: CompanyCreate,
     service: ServiceDep,
-    _current_user: Annotated[User, Depends(require_role(Role.ADMIN, Role.SUPERVISOR))],
+    _current_user: Annotated[Principal, Depends(require_role(Role.ADMIN, Role.SUPERVISOR))],
 ) -> CompanyResponse:
     return await service.create(company_in)
 
 
 @router.get("/", response_model=List[CompanyResponse])
 async def get_all_companies(
-    service: ServiceDep,
+    service: ReadServiceDep,
     search: Optional[str] = None,
     sort_field: Literal["id", "name", "date_established"] = Query("name"),
     sort_order: Literal["asc", "desc"] = Query("asc"),
@@ -58,8 +64,8 @@ async def get_all_companies(
 
 @router.get("/my-company/overview", response_model=CompanyOverviewResponse)
 async def get_my_company_overview(
-    service: ServiceDep,
-    current_user: Annotated[User, Depends(get_current_user)],
+    service: ReadServiceDep,
+    current_user: Annotated[Principal, Depends(get_current_user)],
     days: int = Query(30, ge=7, le=365),
 ) -> CompanyOverviewResponse:
     company_overview = await service.get_my_company_overview(current_user.id, days=days)
@@ -71,13 +77,19 @@ async def get_my_company_overview(
 
 
 @router.get("/{company_id}", response_model=CompanyResponse)
-async def get_company(company_id: int, service: ServiceDep) -> CompanyResponse:
+async def get_company(
+    company_id: int, request: Request, response: Response, service: ReadServiceDep
+) -> CompanyResponse:
     company = await service.get_by_id(company_id)
     if not company:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Компания не найдено"
         )
 
+    etag = weak_etag(company.id, company.updated_at)
+    if cached := not_modified(request, etag, REVALIDATE):
+        return cached
+    set_cache_headers(response, etag, REVALIDATE)
     return company
 
 
@@ -86,7 +98,7 @@ async def update_company(
     company_in: CompanyUpdate,
     company_id: int,
     service: ServiceDep,
-    _current_user: Annotated[User, Depends(require_role(Role.ADMIN, Role.SUPERVISOR))],
+    _current_user: Annotated[Principal, Depends(require_role(Role.ADMIN, Role.SUPERVISOR))],
 ) -> CompanyResponse:
     company = await service.update(company_in, company_id)
     if not company:
@@ -101,7 +113,7 @@ async def update_company(
 async def delete_company(
     company_id: int,
     service: ServiceDep,
-    _current_user: Annotated[User, Depends(require_role(Role.ADMIN, Role.SUPERVISOR))],
+    _current_user: Annotated[Principal, Depends(require_role(Role.ADMIN, Role.SUPERVISOR))],
 ):
     success = await service.delete(company_id)
     if not success:
@@ -4,6 +4,7 @@ from typing import Optional
 from sqlalchemy import select, desc, asc, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.modules.auth.service.principal_cache import invalidate_all_principals
 from app.modules.base_module.enums import TaskStep
 from app.modules.company.model.company import Company
 from app.modules.company.schemas.company import (
@@ -17,6 +18,7 @@ from app.modules.company.schemas.company import (
     CompanySort,
     CompanyUpdate,
 )
+from app.modules.search.service.search import contains_any
 from app.modules.task.model.task import Task
 from app.modules.users.models.position import Position
 from app.modules.users.models.user import User
@@ -54,8 +56,7 @@ class CompanyService:
         query = select(Company)
 
         if filters.search:
-            search_pattern = f"%{filters.search}%"
-            query = query.where(Company.name.ilike(search_pattern))
+            query = query.where(contains_any((Company.name,), filters.search))
 
         order_func = desc if sort.order == "desc" else asc
         query = query.order_by(order_func(getattr(Company, sort.field)))
@@ -87,6 +88,7 @@ class CompanyService:
             return False
 
         await self.db.delete(company)
+        invalidate_all_principals(self.db)
         return True
 
     async def get_my_company_overview(self, user_id: int, days: int = 30) -> Optional[CompanyOverviewResponse]:
@@ -0,0 +1,36 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, HTTPException, status
+
+from app.core.db import db_manager
+from app.core.profiling import profiler
+from app.modules.auth.schemas.auth import Principal
+from app.modules.base_module.dependencies import require_role
+from app.modules.base_module.enums import Role
+from app.modules.monitoring.schemas.monitoring import (
+    PoolStatsResponse,
+    ProfileResponse,
+    ProfileSummary,
+)
+
+router = APIRouter(prefix="/internal", tags=["Internal"])
+
+AdminDep = Annotated[Principal, Depends(require_role(Role.ADMIN))]
+
+
+@router.get("/db-pool", response_model=list[PoolStatsResponse])
+async def get_db_pool_stats(_current_user: AdminDep) -> list[PoolStatsResponse]:
+    return db_manager.pool_stats()
+
+
+@router.get("/profiles", response_model=list[ProfileSummary])
+async def get_profiles(_current_user: AdminDep) -> list[ProfileSummary]:
+    return profiler.recent()
+
+
+@router.get("/profiles/{profile_id}", response_model=ProfileResponse)
+async def get_profile(profile_id: str, _current_user: AdminDep) -> ProfileResponse:
+    profile = profiler.get(profile_id)
+    if not profile:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Профиль не найден")
+    return profile
@@ -0,0 +1,51 @@
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class WaitBucket(BaseModel):
+    le: str
+    count: int
+
+
+class PoolStatsResponse(BaseModel):
+    name: str
+    pool_size: int
+    checked_out: int
+    checked_in: int
+    overflow: int
+    max_overflow: int
+    checkouts_total: int
+    checkout_timeouts_total: int
+    slow_checkouts_total: int
+    wait_ms_sum: float
+    wait_ms_max: float
+    wait_ms_buckets: list[WaitBucket]
+
+
+class CallTreeNode(BaseModel):
+    function: str
+    calls: int
+    own_ms: float
+    cumulative_ms: float
+    children: list["CallTreeNode"] = []
+
+
+class ProfileSummary(BaseModel):
+    id: str
+    created_at: datetime
+    method: str
+    path: str
+    route: Optional[str] = None
+    status_code: int
+    wall_ms: float
+    cpu_ms: float
+    db_queries: int
+    db_ms: float
+    serialization_ms: float
+
+
+class ProfileResponse(ProfileSummary):
+    call_tree: list[CallTreeNode]
+    text: str
@@ -0,0 +1,59 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.db import get_read_db
+from app.core.serialization import orm_list_response
+from app.modules.auth.schemas.auth import Principal
+from app.modules.base_module.dependencies import get_current_user
+from app.modules.search.schemas.search import CompanySuggestion, UserSuggestion
+from app.modules.search.service.search import SearchService
+from app.modules.task.schemas.task import TaskResponse
+
+router = APIRouter(prefix="/search", tags=["Search"])
+
+
+def get_search_service(db: Annotated[AsyncSession, Depends(get_read_db)]) -> SearchService:
+    return SearchService(db)
+
+
+ReadServiceDep = Annotated[SearchService, Depends(get_search_service)]
+SearchQuery = Annotated[str, Query(min_length=1, max_length=100)]
+
+
+@router.get("/users", response_model=list[UserSuggestion])
+async def suggest_users(
+    q: SearchQuery,
+    service: ReadServiceDep,
+    current_user: Annotated[Principal, Depends(get_current_user)],
+    limit: int = Query(10, ge=1, le=50),
+) -> list[UserSuggestion]:
+    # Employees are only ever looked up within the caller's own company.
+    if current_user.company_id is None:
+        return []
+    return await service.suggest_users(q.strip(), current_user.company_id, limit)
+
+
+@router.get("/companies", response_model=list[CompanySuggestion])
+async def suggest_companies(
+    q: SearchQuery,
+    service: ReadServiceDep,
+    _current_user: Annotated[Principal, Depends(get_current_user)],
+    limit: int = Query(10, ge=1, le=50),
+) -> list[CompanySuggestion]:
+    return await service.suggest_companies(q.strip(), limit)
+
+
+@router.get("/tasks", response_model=list[TaskResponse])
+async def search_tasks(
+    q: SearchQuery,
+    service: ReadServiceDep,
+    current_user: Annotated[Principal, Depends(get_current_user)],
+    limit: int = Query(20, ge=1, le=100),
+) -> list[TaskResponse]:
+    # Words of `q` are matched as prefixes in the name and description of the caller's company tasks.
+    if current_user.company_id is None:
+        return []
+    tasks = await service.search_tasks(q, current_user.company_id, limit)
+    return orm_list_response(tasks, TaskResponse)
@@ -0,0 +1,15 @@
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class UserSuggestion(BaseModel):
+    id: int
+    name: str
+    avatar_url: Optional[str] = None
+
+
+class CompanySuggestion(BaseModel):
+    id: int
+    name: str
+    avatar_url: Optional[str] = None
@@ -0,0 +1,146 @@
+import re
+from typing import Optional, Sequence
+
+from sqlalchemy import ColumnElement, func, literal_column, or_, select
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
+
+from app.modules.company.model.company import Company
+from app.modules.search.schemas.search import CompanySuggestion, UserSuggestion
+from app.modules.task.model.task import Task
+from app.modules.users.models.user import User
+
+# pg_trgm cannot narrow a search shorter than one trigram; such queries take the prefix path.
+MIN_TRIGRAM_LENGTH = 3
+
+# Generated column (weighted name + description) added to the task table by migration a5c1e8f3d7b2
+# or, under create_all, by TASK_POSTGRESQL_DDL; it is not mapped on Task so that it never travels
+# with the rows.
+TASK_SEARCH_VECTOR = literal_column("task.search_vector", TSVECTOR)
+# The 'simple' configuration only lowercases: no stemming, so prefixes of Russian and Kazakh
+# words match as typed.
+TEXT_SEARCH_CONFIG = "simple"
+MAX_QUERY_TERMS = 8
+_TERM_RE = re.compile(r"[^\W_]+")
+
+USER_SEARCH_COLUMNS = (User.last_name, User.first_name, User.login)
+
+
+def escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def contains_any(columns: Sequence[InstrumentedAttribute], query: str) -> ColumnElement[bool]:
+    """Case-insensitive substring match; served by the trigram GIN indexes on these columns."""
+    pattern = f"%{escape_like(query)}%"
+    return or_(*(column.ilike(pattern, escape="\\") for column in columns))
+
+
+def prefix_any(columns: Sequence[InstrumentedAttribute], query: str) -> ColumnElement[bool]:
+    """Case-insensitive prefix match; served by the lower(column) varchar_pattern_ops indexes."""
+    pattern = f"{escape_like(query.lower())}%"
+    return or_(*(func.lower(column).like(pattern, escape="\\") for column in columns))
+
+
+def fuzzy_any(columns: Sequence[InstrumentedAttribute], query: str) -> ColumnElement[bool]:
+    """Substring or trigram-similar (the pg_trgm `%` operator) in any of the columns, so typos still match."""
+    return or_(contains_any(columns, query), *(column.op("%")(query) for column in columns))
+
+
+def similarity_rank(columns: Sequence[InstrumentedAttribute], query: str) -> ColumnElement[float]:
+    return func.greatest(*(func.similarity(column, query) for column in columns))
+
+
+def prefix_tsquery(query: str) -> Optional[str]:
+    """Every word of the query as a prefix term, ANDed: "монтаж каб" -> "монтаж:* & каб:*".
+
+    Only letters and digits get through, so user input can never inject tsquery operators.
+    """
+    terms = _TERM_RE.findall(query.lower())[:MAX_QUERY_TERMS]
+    if not terms:
+        return None
+    return " & ".join(f"{term}:*" for term in terms)
+
+
+def _tsquery(tsquery: str):
+    return func.to_tsquery(TEXT_SEARCH_CONFIG, tsquery)
+
+
+def task_text_match(query: str) -> ColumnElement[bool]:
+    """
+    Word prefixes in the task name or description (idx_task_company_search_vector), or a
+    substring of the name (idx_task_name_trgm), so parts of words ("таж" -> "монтаж") and
+    queries without any word still find what the old name ILIKE filter did.
+    """
+    name_match = contains_any((Task.name,), query)
+    tsquery = prefix_tsquery(query)
+    if tsquery is None:
+        return name_match
+    return or_(TASK_SEARCH_VECTOR.op("@@")(_tsquery(tsquery)), name_match)
+
+
+def task_search_query(tsquery: str, company_id: int, limit: int):
+    # Name hits carry weight A and description hits weight B, so they rank first.
+    rank = func.ts_rank(TASK_SEARCH_VECTOR, _tsquery(tsquery))
+    return (
+        select(Task)
+        .where(Task.company_id == company_id, TASK_SEARCH_VECTOR.op("@@")(_tsquery(tsquery)))
+        .order_by(rank.desc(), Task.id)
+        .limit(limit)
+    )
+
+
+def user_suggestions_query(query: str, company_id: int, limit: int):
+    statement = select(User.id, User.first_name, User.last_name, User.avatar_url).where(User.company_id == company_id)
+    if len(query) < MIN_TRIGRAM_LENGTH:
+        return (
+            statement.where(prefix_any(USER_SEARCH_COLUMNS, query))
+            .order_by(User.last_name, User.first_name, User.id)
+            .limit(limit)
+        )
+    return (
+        statement.where(fuzzy_any(USER_SEARCH_COLUMNS, query))
+        .order_by(similarity_rank(USER_SEARCH_COLUMNS, query).desc(), User.id)
+        .limit(limit)
+    )
+
+
+def company_suggestions_query(query: str, limit: int):
+    statement = select(Company.id, Company.name, Company.logo)
+    if len(query) < MIN_TRIGRAM_LENGTH:
+        return statement.where(prefix_any((Company.name,), query)).order_by(Company.name, Company.id).limit(limit)
+    return (
+        statement.where(fuzzy_any((Company.name,), query))
+        .order_by(func.similarity(Company.name, query).desc(), Company.id)
+        .limit(limit)
+    )
+
+
+class SearchService:
+    """Typeahead lookups (only the columns a picker shows) and ranked task search, best matches first."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def suggest_users(self, query: str, company_id: int, limit: int = 10) -> list[UserSuggestion]:
+        if not query:
+            return []
+        result = await self.db.execute(user_suggestions_query(query, company_id, limit))
+        return [
+            UserSuggestion(id=row.id, name=f"{row.first_name} {row.last_name}", avatar_url=row.avatar_url)
+            for row in result
+        ]
+
+    async def suggest_companies(self, query: str, limit: int = 10) -> list[CompanySuggestion]:
+        if not query:
+            return []
+        result = await self.db.execute(company_suggestions_query(query, limit))
+        return [CompanySuggestion(id=row.id, name=row.name, avatar_url=row.logo) for row in result]
+
+    async def search_tasks(self, query: str, company_id: int, limit: int = 20) -> list[Task]:
+        tsquery = prefix_tsquery(query)
+        if tsquery is None:
+            return []
+        result = await self.db.execute(task_search_query(tsquery, company_id, limit))
+        return list(result.scalars().all())
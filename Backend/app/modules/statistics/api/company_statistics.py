@@ -1,16 +1,17 @@
 from datetime import date
 from typing import Literal, Annotated
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.db import get_db
+from app.core.db import get_read_db
+from app.core.http_cache import REVALIDATE, not_modified, set_cache_headers, weak_etag
 from app.modules.statistics.schemas.leaderbord import LeaderBoardEntity
 from app.modules.statistics.services.user_statistics import UserStatisticsService
 
 router = APIRouter(prefix="/company_statistics", tags=["Company Statistics"])
 
-def get_statistics_service(db: Annotated[AsyncSession, Depends(get_db)]) -> UserStatisticsService:
+def get_statistics_service(db: Annotated[AsyncSession, Depends(get_read_db)]) -> UserStatisticsService:
     return UserStatisticsService(db)
 
 
@@ -22,6 +23,8 @@ UserServiceDep = Annotated[UserStatisticsService, Depends(get_statistics_service
 @router.get("/leaderboard/{company_id}")
 async def get_leaderboard(
         company_id: int,
+        request: Request,
+        response: Response,
         service: UserServiceDep,
         sort_field: Literal["total_points", "success_rate"] = "total_points",
         sort_order: Literal["asc", "desc"] = "desc",
@@ -29,6 +32,10 @@ async def get_leaderboard(
         position_id: int | None = None,
         limit: int | None = None,
 ) -> list[LeaderBoardEntity]:
+    etag = weak_etag(await service.get_leaderboard_version(company_id), request.url.query)
+    if cached := not_modified(request, etag, REVALIDATE):
+        return cached
+    set_cache_headers(response, etag, REVALIDATE)
     return await service.get_leaderboard(
         company_id,  sort_field, sort_order, min_success_rate, position_id, limit
     )
\ No newline at end of file
@@ -1,10 +1,12 @@
 from typing import Annotated
 
-from fastapi import APIRouter, status
+from fastapi import APIRouter, Request, Response, status
 from fastapi.params import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.db import get_db
+from app.core.db import get_db, get_read_db
+from app.core.http_cache import SHORT_LIVED, not_modified, set_cache_headers, weak_etag
+from app.modules.auth.schemas.auth import Principal
 from app.modules.base_module.dependencies import get_current_user, require_role
 from app.modules.base_module.enums import Role
 from app.modules.statistics.schemas.difficulty_config import (
@@ -13,7 +15,6 @@ from app.modules.statistics.schemas.difficulty_config import (
     DifficultyConfigUpdate,
 )
 from app.modules.statistics.services.difficulty_config import DifficultyConfigService
-from app.modules.users.models.user import User
 
 
 def get_config_service(
@@ -22,7 +23,14 @@ def get_config_service(
     return DifficultyConfigService(db)
 
 
+def get_config_read_service(
+    db: Annotated[AsyncSession, Depends(get_read_db)],
+) -> DifficultyConfigService:
+    return DifficultyConfigService(db)
+
+
 ServiceDep = Annotated[DifficultyConfigService, Depends(get_config_service)]
+ReadServiceDep = Annotated[DifficultyConfigService, Depends(get_config_read_service)]
 
 router = APIRouter(prefix="/difficulty-config", tags=["DifficultyConfig"])
 
@@ -31,7 +39,7 @@ router = APIRouter(prefix="/difficulty-config", tags=["DifficultyConfig"])
 async def create_difficulty_config(
     service: ServiceDep,
     config_in: DifficultyConfigCreate,
-    current_user: Annotated[User, Depends(require_role(Role.ADMIN, Role.SUPERVISOR))],
+    current_user: Annotated[Principal, Depends(require_role(Role.ADMIN, Role.SUPERVISOR))],
 ) -> DifficultyConfigResponse:
     company_id = current_user.company_id
     return await service.create(config_in, company_id)  # type: ignore
@@ -41,7 +49,7 @@ async def create_difficulty_config(
 async def update_difficulty_config(
     service: ServiceDep,
     config_in: DifficultyConfigUpdate,
-    current_user: Annotated[User, Depends(require_role(Role.ADMIN, Role.SUPERVISOR))],
+    current_user: Annotated[Principal, Depends(require_role(Role.ADMIN, Role.SUPERVISOR))],
 ) -> DifficultyConfigResponse:
     company_id = current_user.company_id
     return await service.update(config_in, company_id)  # type: ignore
@@ -49,7 +57,16 @@ async def update_difficulty_config(
 
 @router.get("/", status_code=status.HTTP_200_OK)
 async def get_difficulty_config(
-    service: ServiceDep, current_user: Annotated[User, Depends(get_current_user)]
+    request: Request,
+    response: Response,
+    service: ReadServiceDep,
+    current_user: Annotated[Principal, Depends(get_current_user)],
 ) -> DifficultyConfigResponse:
     company_id = current_user.company_id
-    return await service.get_by_company_id(company_id)  # type: ignore
+    config = await service.get_by_company_id(company_id)  # type: ignore
+    if config is not None:
+        etag = weak_etag(config.id, config.updated_at)
+        if cached := not_modified(request, etag, SHORT_LIVED):
+            return cached
+        set_cache_headers(response, etag, SHORT_LIVED)
+    return config
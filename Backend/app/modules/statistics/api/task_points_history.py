@@ -4,12 +4,13 @@ from fastapi import Depends, APIRouter
 from sqlalchemy.ext.asyncio import AsyncSession
 from starlette import status
 
-from app.core.db import get_db
+from app.core.db import get_read_db
+from app.core.serialization import orm_list_response
 from app.modules.statistics.schemas.task_points_history import TaskPointsHistoryCreate, TaskPointsHistoryResponse
 from app.modules.statistics.services.task_points_history import TaskPointsHistoryService
 
 
-def task_points_history_service(db: Annotated[AsyncSession, Depends(get_db)]) -> TaskPointsHistoryService:
+def task_points_history_service(db: Annotated[AsyncSession, Depends(get_read_db)]) -> TaskPointsHistoryService:
     return TaskPointsHistoryService(db)
 
 ServiceDep = Annotated[TaskPointsHistoryService, Depends(task_points_history_service)]
@@ -18,7 +19,7 @@ router = APIRouter(prefix="/task_points_history", tags=["Task Points History"])
 
 @router.get("/all")
 async def get_task_points_history(service: ServiceDep) -> list[TaskPointsHistoryResponse]:
-    return await service.get_all()
+    return orm_list_response(await service.get_all(), TaskPointsHistoryResponse)
 
 @router.get("/task/{task_id}")
 async def get_task_points_history_by_task(task_id: int, service: ServiceDep) -> TaskPointsHistoryResponse:
@@ -3,7 +3,7 @@ from typing import Annotated
 from fastapi import APIRouter, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.db import get_db
+from app.core.db import get_db, get_read_db
 from app.modules.base_module.enums import PeriodType
 from app.modules.statistics.schemas.chart import ChartDataResponse
 from app.modules.statistics.schemas.user import UserStatisticsResponse, UserDashboard
@@ -16,7 +16,12 @@ def get_statistics_service(db: Annotated[AsyncSession, Depends(get_db)]) -> User
 
 
 
+def get_statistics_read_service(db: Annotated[AsyncSession, Depends(get_read_db)]) -> UserStatisticsService:
+    return UserStatisticsService(db)
+
+
 ServiceDep = Annotated[UserStatisticsService, Depends(get_statistics_service)]
+ReadServiceDep = Annotated[UserStatisticsService, Depends(get_statistics_read_service)]
 
 
 @router.get("/statistics/{user_id}")
@@ -24,13 +29,13 @@ async def calc_statistics(user_id: int, period_type: PeriodType, service: Servic
     return await service.calculate_statistics(user_id, period_type)
 
 @router.get("/dashboard/{user_id}")
-async def dashboard_statistics(user_id: int, period_type: PeriodType, service: ServiceDep) -> UserDashboard:
+async def dashboard_statistics(user_id: int, period_type: PeriodType, service: ReadServiceDep) -> UserDashboard:
     return await service.get_dashboard(user_id, period_type)
 
 
 @router.get("/chart/{user_id}")
 async def get_chart(
-        service: ServiceDep,
+        service: ReadServiceDep,
         user_id: int,
         metric: str = "total_points",
 ) -> ChartDataResponse:
@@ -5,6 +5,7 @@ from sqlalchemy import select, func
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.http_cache import aggregate_version, combined_version, membership_version
 from app.modules.base_module.enums import TaskStep, PeriodType, Role, TaskType
 from app.modules.company.model.company import Company
 from app.modules.statistics.models.task_point_history import TaskPointHistory
@@ -349,6 +350,24 @@ class UserStatisticsService:
         return [ChartPoint(date=row.period_date, value=row[1]) for row in result.all()]
 
 
+    async def get_leaderboard_version(self, company_id: int) -> tuple:
+        """Cheap fingerprint of everything get_leaderboard reads for the current month."""
+        first_day_of_month = date.today().replace(day=1)
+        month_operations = (
+            select(TaskOperation.id)
+            .join(Task, Task.id == TaskOperation.task_id)
+            .where(Task.completed_at >= first_day_of_month)
+        )
+        version = combined_version(
+            aggregate_version(TaskPointHistory, TaskPointHistory.period_date >= first_day_of_month),
+            aggregate_version(Task, Task.completed_at >= first_day_of_month),
+            aggregate_version(User, User.company_id == company_id),
+            membership_version(executors.c.user_id, executors.c.task_id, executors.c.task_id.in_(month_operations)),
+        )
+
+        row = (await self.db.execute(version)).one()
+        return first_day_of_month, *row
+
     async def get_leaderboard(
             self,
             company_id: int,
@@ -1,10 +1,14 @@
 from datetime import date
 from typing import Annotated, List, Optional, Literal
 
-from fastapi import APIRouter, Depends, status, Query, HTTPException
+from fastapi import APIRouter, Depends, status, Query, HTTPException, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.db import get_db
+from app.core.db import get_db, get_read_db
+from app.core.http_cache import REVALIDATE, cache_headers, not_modified, weak_etag
+from app.core.pagination import cursor_headers
+from app.core.serialization import orm_list_response
+from app.modules.auth.schemas.auth import Principal
 from app.modules.base_module.dependencies import require_role, get_current_user
 from app.modules.base_module.enums import Role, TaskType, City, TaskStep
 from app.modules.task.schemas.task import (
@@ -12,12 +16,11 @@ from app.modules.task.schemas.task import (
     TaskCreate,
     TaskSort,
     TaskFilter,
-    TaskUpdate, TakeTaskRequest, TaskAccessUsersUpdate, TaskParticipantsResponse
+    TaskUpdate, TakeTaskRequest, TaskAccessUsersUpdate, TaskParticipantsResponse, TaskInboxResponse
 )
 from app.modules.task.services.task import TaskService
 from app.modules.task_operations.schema.task_operation import TaskOperationCreate
 from app.modules.task_operations.service.task_operation import TaskOperationService
-from app.modules.users.models.user import User
 
 router = APIRouter(prefix="/task", tags=["Task"])
 
@@ -25,11 +28,15 @@ router = APIRouter(prefix="/task", tags=["Task"])
 def get_task_service(db: Annotated[AsyncSession, Depends(get_db)]):
     return TaskService(db)
 
+def get_task_read_service(db: Annotated[AsyncSession, Depends(get_read_db)]):
+    return TaskService(db)
+
 def get_task_operation_service(db: Annotated[AsyncSession, Depends(get_db)]):
     return TaskOperationService(db)
 
 
 ServiceDep = Annotated[TaskService, Depends(get_task_service)]
+ReadServiceDep = Annotated[TaskService, Depends(get_task_read_service)]
 ServiceOperationDep = Annotated[TaskOperationService, Depends(get_task_operation_service)]
 
 
@@ -41,7 +48,7 @@ async def create_task(
     task_operation_in: TaskOperationCreate,
     service: ServiceDep,
     operation_service:  ServiceOperationDep,
-    current_user: Annotated[User, Depends(require_role(Role.ADMIN, Role.SUPERVISOR))],
+    current_user: Annotated[Principal, Depends(require_role(Role.ADMIN, Role.SUPERVISOR))],
 ) -> TaskResponse:
     if not task_operation_in.accessed_users_ids:
         raise HTTPException(
@@ -62,7 +69,9 @@ async def create_task(
 
 @router.get("/", response_model=List[TaskResponse])
 async def get_all_tasks(
-    service: ServiceDep,
+    request: Request,
+    service: ReadServiceDep,
+    current_user: Annotated[Principal, Depends(get_current_user)],
     deadline: Optional[date] = None,
     is_active: Optional[bool] = None,
     task_type: Optional[TaskType] = None,
@@ -73,6 +82,8 @@ async def get_all_tasks(
     city: Optional[City] = None,
     task_step: Optional[TaskStep] = None,
     search: Optional[str] = None,
+    # Only for an administrator outside any company; without it they get every company's tasks.
+    company_id: Optional[int] = None,
     sort_field: Literal[
         "id",
         "name",
@@ -83,6 +94,8 @@ async def get_all_tasks(
         "task_step",
     ] = "deadline",
     sort_order: Literal["asc", "desc"] = "asc",
+    cursor: Optional[str] = None,
+    # Offset paging is kept for old clients; new ones follow the X-Next-Cursor header.
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
 ) -> List[TaskResponse]:
@@ -101,11 +114,42 @@ async def get_all_tasks(
 
     sort = TaskSort(field=sort_field, order=sort_order)
 
-    return await service.get_all(filters=filters, sort=sort, skip=skip, limit=limit)
+    # Tasks are listed for the caller's company; the indexes on task lead with company_id. An
+    # administrator outside any company picks one with ?company_id= or gets every company's tasks.
+    if current_user.company_id is not None:
+        if company_id not in (None, current_user.company_id):
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Нет доступа к заданиям компании")
+        company_id = current_user.company_id
+    elif current_user.role != Role.ADMIN:
+        return []
+
+    etag = weak_etag(await service.get_list_version(company_id), company_id, request.url.query)
+    if cached := not_modified(request, etag, REVALIDATE):
+        return cached
+
+    headers = cache_headers(etag, REVALIDATE)
+    if skip:
+        tasks = await service.get_all(filters=filters, sort=sort, skip=skip, limit=limit, company_id=company_id)
+        return orm_list_response(tasks, TaskResponse, headers=headers)
+
+    tasks, next_page = await service.get_page(
+        filters=filters, sort=sort, company_id=company_id, cursor=cursor, limit=limit
+    )
+    return orm_list_response(tasks, TaskResponse, headers={**headers, **cursor_headers(next_page)})
+
+
+@router.get("/inbox", response_model=TaskInboxResponse)
+async def get_task_inbox(
+    service: ReadServiceDep,
+    current_user: Annotated[Principal, Depends(get_current_user)],
+    limit: int = Query(20, ge=1, le=100),
+) -> TaskInboxResponse:
+    # Replaces the per-step endpoints below with one query; `limit` applies to each step.
+    return await service.inbox(current_user.id, limit)
 
 
 @router.get("/{task_id}", response_model=TaskResponse)
-async def get_task(task_id: int, service: ServiceDep) -> TaskResponse:
+async def get_task(task_id: int, service: ReadServiceDep) -> TaskResponse:
     task = await service.get_by_id(task_id)
 
     if not task:
@@ -121,7 +165,7 @@ async def update_task(
     task_id: int,
     task_in: TaskUpdate,
     service: ServiceDep,
-    _current_user: Annotated[User, Depends(require_role(Role.ADMIN, Role.SUPERVISOR))],
+    _current_user: Annotated[Principal, Depends(require_role(Role.ADMIN, Role.SUPERVISOR))],
 ) -> TaskResponse:
     task = await service.get_by_id(task_id)
     if not task:
@@ -148,8 +192,8 @@ async def update_task(
 @router.get("/{task_id}/accessed-users", response_model=list[int])
 async def get_task_accessed_users(
     task_id: int,
-    service: ServiceDep,
-    _current_user: Annotated[User, Depends(require_role(Role.ADMIN, Role.SUPERVISOR))],
+    service: ReadServiceDep,
+    _current_user: Annotated[Principal, Depends(require_role(Role.ADMIN, Role.SUPERVISOR))],
 ) -> list[int]:
     task = await service.get_by_id(task_id)
     if not task:
@@ -170,7 +214,7 @@ async def update_task_accessed_users(
     task_id: int,
     body: TaskAccessUsersUpdate,
     service: ServiceDep,
-    current_user: Annotated[User, Depends(require_role(Role.ADMIN, Role.SUPERVISOR))],
+    current_user: Annotated[Principal, Depends(require_role(Role.ADMIN, Role.SUPERVISOR))],
 ) -> list[int]:
     if not body.accessed_users_ids:
         raise HTTPException(
@@ -194,8 +238,8 @@ async def update_task_accessed_users(
 @router.get("/{task_id}/participants", response_model=TaskParticipantsResponse)
 async def get_task_participants(
     task_id: int,
-    service: ServiceDep,
-    current_user: Annotated[User, Depends(get_current_user)],
+    service: ReadServiceDep,
+    current_user: Annotated[Principal, Depends(get_current_user)],
 ) -> TaskParticipantsResponse:
     task = await service.get_by_id(task_id)
     if not task:
@@ -232,7 +276,7 @@ async def delete_task(task_id: int, service: ServiceDep):
 async def take_task_endpoint(
         service: ServiceDep,
         task_id: int,
-        current_user: Annotated[User, Depends(get_current_user)],
+        current_user: Annotated[Principal, Depends(get_current_user)],
         body: TakeTaskRequest,
 ) -> Optional[TaskResponse]:
     user_id = current_user.id
@@ -250,7 +294,7 @@ async def take_task_endpoint(
 async def complete_task_endpoint(
     task_id: int,
     service: ServiceDep,
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[Principal, Depends(get_current_user)],
 ) -> TaskResponse:
     user_id = current_user.id
     task = await service.complete_task(task_id, user_id)   # type: ignore
@@ -266,7 +310,7 @@ async def complete_task_endpoint(
 async def verify_task_endpoint(
         task_id: int,
         service: ServiceDep,
-        _current_user: Annotated[User, Depends(require_role(Role.ADMIN, Role.SUPERVISOR))],
+        _current_user: Annotated[Principal, Depends(require_role(Role.ADMIN, Role.SUPERVISOR))],
 ) -> bool:
     success = await service.verify_task(task_id)
 
@@ -282,7 +326,7 @@ async def verify_task_endpoint(
 async def reject_task_endpoint(
         task_id: int,
         service: ServiceDep,
-        _current_user: Annotated[User, Depends(require_role(Role.ADMIN, Role.SUPERVISOR))],
+        _current_user: Annotated[Principal, Depends(require_role(Role.ADMIN, Role.SUPERVISOR))],
 ) -> bool:
     success = await service.reject_task(task_id)
 
@@ -296,8 +340,8 @@ async def reject_task_endpoint(
 
 @router.get("/{user_id}/accessed-tasks", response_model=list[TaskResponse])
 async def get_accessed_tasks(
-        service: ServiceDep,
-        current_user: Annotated[User, Depends(get_current_user)],
+        service: ReadServiceDep,
+        current_user: Annotated[Principal, Depends(get_current_user)],
 ) -> list[TaskResponse]:
     user_id = current_user.id
     tasks = await service.accessed_tasks(user_id)   # type: ignore
@@ -311,8 +355,8 @@ async def get_accessed_tasks(
 
 @router.get("/{user_id}/tasks-in-progress", response_model=list[TaskResponse])
 async def get_tasks_in_progress(
-        service: ServiceDep,
-        current_user: Annotated[User, Depends(get_current_user)],
+        service: ReadServiceDep,
+        current_user: Annotated[Principal, Depends(get_current_user)],
 ) -> list[TaskResponse]:
     user_id = current_user.id
     tasks = await service.executing_tasks(user_id)   # type: ignore
@@ -327,8 +371,8 @@ async def get_tasks_in_progress(
 
 @router.get("/{user_id}/tasks-completed", response_model=list[TaskResponse])
 async def get_tasks_completed(
-        service: ServiceDep,
-        current_user: Annotated[User, Depends(get_current_user)],
+        service: ReadServiceDep,
+        current_user: Annotated[Principal, Depends(get_current_user)],
 ) -> list[TaskResponse]:
     user_id = current_user.id
     tasks = await service.completed_tasks(user_id)   # type: ignore
@@ -343,8 +387,8 @@ async def get_tasks_completed(
 
 @router.get("/{user_id}/verified-tasks", response_model=list[TaskResponse])
 async def get_verified_tasks(
-        service: ServiceDep,
-        current_user: Annotated[User, Depends(get_current_user)],
+        service: ReadServiceDep,
+        current_user: Annotated[Principal, Depends(get_current_user)],
 ) -> list[TaskResponse]:
     user_id = current_user.id
     tasks = await service.verified_tasks(user_id)   # type: ignore
@@ -1,11 +1,14 @@
 from typing import Optional, TYPE_CHECKING
 
 from sqlalchemy import (
+    DDL,
+    event,
     Integer,
     String,
     Boolean,
     Enum,
     Date, ForeignKey,
+    Index,
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -20,6 +23,16 @@ if TYPE_CHECKING:
 
 class Task(Base, TimestampMixin):
     __tablename__ = "task"
+    # Listings are always scoped to one company and page by (sort field, id).
+    __table_args__ = (
+        Index("idx_task_company_id_id", "company_id", "id"),
+        Index("idx_task_company_deadline_id", "company_id", "deadline", "id"),
+        Index("idx_task_company_step_deadline_id", "company_id", "task_step", "deadline", "id"),
+        Index("idx_task_company_city_deadline_id", "company_id", "city", "deadline", "id"),
+        Index("idx_task_company_name_id", "company_id", "name", "id"),
+        # The full-text search_vector column and the GIN indexes are PostgreSQL-only; see
+        # TASK_POSTGRESQL_DDL below.
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, nullable=False)
     company_id: Mapped[int] = mapped_column(ForeignKey("company.id"), nullable=False)
@@ -47,6 +60,9 @@ class Task(Base, TimestampMixin):
         nullable=False,
         default=Priority.MEDIUM,
     )
+    # Optimistic lock: every ORM update checks and bumps it, so two requests that read the same
+    # task cannot both write it (the loser gets StaleDataError, answered with 409).
+    version: Mapped[int] = mapped_column(Integer, nullable=False, server_default="1")
 
     operations: Mapped["TaskOperation"] = relationship("TaskOperation", back_populates="task", uselist=False)
     company: Mapped["Company"] = relationship("Company")
@@ -54,3 +70,25 @@ class Task(Base, TimestampMixin):
         "TaskPointHistory",
         back_populates="task",
     )
+
+    __mapper_args__ = {"version_id_col": version}
+
+
+# PostgreSQL-only schema from migrations a5c1e8f3d7b2 (search_vector and its index) and
+# c8e4a2f6b1d9 (name trigram index), repeated here so that metadata.create_all
+# (DB_SCHEMA_STARTUP=create_all) builds the same table. Other dialects skip it.
+TASK_POSTGRESQL_DDL = (
+    """
+    ALTER TABLE task ADD COLUMN search_vector tsvector GENERATED ALWAYS AS (
+        setweight(to_tsvector('simple', coalesce(name, '')), 'A') ||
+        setweight(to_tsvector('simple', coalesce(description, '')), 'B')
+    ) STORED
+    """,
+    "CREATE EXTENSION IF NOT EXISTS btree_gin",
+    "CREATE INDEX idx_task_company_search_vector ON task USING gin (company_id, search_vector)",
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "CREATE INDEX idx_task_name_trgm ON task USING gin (name gin_trgm_ops)",
+)
+
+for _statement in TASK_POSTGRESQL_DDL:
+    event.listen(Task.__table__, "after_create", DDL(_statement).execute_if(dialect="postgresql"))
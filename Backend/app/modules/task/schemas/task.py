@@ -101,6 +101,15 @@ class TaskList(BaseModel):
     total: int
 
 
+class TaskInboxResponse(BaseModel):
+    """A worker's tasks by step: available ones they may take, the rest they execute(d)."""
+    available: TaskList
+    in_progress: TaskList
+    completed: TaskList
+    verified: TaskList
+    failed: TaskList
+
+
 class TaskFilter(BaseModel):
     deadline: Optional[date] = None
     is_active: Optional[bool] = None
@@ -1,21 +1,26 @@
 from typing import Optional
 
-from sqlalchemy import select, asc, desc
+from sqlalchemy import Select, select, update, asc, desc, and_, case, false, func, not_, or_, true, union_all
 from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import date
 
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import aliased, selectinload
 
+from app.core.db import on_commit
+from app.core.http_cache import fetch_version
 from app.core.logging import get_logger
-from app.modules.base_module.enums import TaskType, TaskStep, Role, QualityStatus
-
-logger = get_logger("tasks")
+from app.core.metrics import TASK_TRANSITIONS
+from app.core.pagination import decode_cursor, keyset_page, next_cursor
+from app.modules.base_module.enums import TaskType, TaskStep, QualityStatus
+from app.modules.search.service.search import task_text_match
 from app.modules.statistics.services.points_calculation import PointsCalculationService
 from app.modules.task.model.task import Task
 from app.modules.task.schemas.task import (
     TaskCreate,
     TaskResponse,
     TaskFilter,
+    TaskInboxResponse,
+    TaskList,
     TaskSort,
     TaskUpdate,
     TaskParticipantsResponse,
@@ -27,6 +32,9 @@ from app.modules.task_operations.model.task_operation import (
     executors,
 )
 from app.modules.users.models.user import User
+from app.modules.users.services.position_cache import is_group_head
+
+logger = get_logger("tasks")
 
 
 class TaskService:
@@ -57,15 +65,18 @@ class TaskService:
         result = await self.db.execute(select(Task).where(Task.id == task_id))
         return result.scalar_one_or_none()
 
-    async def get_all(
-        self,
-        filters: TaskFilter,
-        sort: TaskSort,
-        skip: int = 0,
-        limit: int = 100,
-    ) -> list[TaskResponse]:
+    async def get_list_version(self, company_id: Optional[int] = None) -> tuple:
+        # TaskResponse carries no participants, so the task rows alone version the list.
+        if company_id is None:
+            return await fetch_version(self.db, Task)
+        return await fetch_version(self.db, Task, Task.company_id == company_id)
+
+    @staticmethod
+    def _filtered_query(filters: TaskFilter, company_id: Optional[int] = None) -> Select:
         query = select(Task)
 
+        if company_id is not None:
+            query = query.where(Task.company_id == company_id)
         if filters.deadline:
             query = query.where(Task.deadline >= filters.deadline)
         if filters.is_active is not None:
@@ -87,8 +98,18 @@ class TaskService:
         if filters.priority:
             query = query.where(Task.priority == filters.priority)
         if filters.search:
-            search_pattern = f"%{filters.search}%"
-            query = query.where(Task.name.ilike(search_pattern))
+            query = query.where(task_text_match(filters.search))
+        return query
+
+    async def get_all(
+        self,
+        filters: TaskFilter,
+        sort: TaskSort,
+        skip: int = 0,
+        limit: int = 100,
+        company_id: Optional[int] = None,
+    ) -> list[TaskResponse]:
+        query = self._filtered_query(filters, company_id)
 
         order_func = desc if sort.order == "desc" else asc
         query = query.order_by(order_func(getattr(Task, sort.field)))
@@ -97,6 +118,27 @@ class TaskService:
         result = await self.db.execute(query)
         return list(result.scalars().all())
 
+    async def get_page(
+        self,
+        filters: TaskFilter,
+        sort: TaskSort,
+        company_id: Optional[int],
+        cursor: Optional[str] = None,
+        limit: int = 100,
+    ) -> tuple[list[Task], Optional[str]]:
+        """
+        Keyset page of the company's tasks (every company's when company_id is None) ordered by
+        (sort.field, id), plus the next cursor.
+        """
+        sort_column = getattr(Task, sort.field)
+        after = decode_cursor(cursor, sort.field, sort.order, sort_column) if cursor else None
+        query = keyset_page(
+            self._filtered_query(filters, company_id), sort_column, Task.id, sort.order, after, limit
+        )
+
+        result = await self.db.execute(query)
+        return next_cursor(result.scalars().all(), sort.field, sort.order, limit)
+
     async def update(self, task_id: int, task_in: TaskUpdate) -> Optional[TaskResponse]:
         task = await self.get_by_id(task_id)
         if not task:
@@ -169,21 +211,15 @@ class TaskService:
         unique_ids = list(set(accessed_user_ids))
         if unique_ids:
             users_result = await self.db.execute(
-                select(User)
-                .options(selectinload(User.position))
-                .where(User.id.in_(unique_ids), User.company_id == task.company_id)
+                select(User).where(User.id.in_(unique_ids), User.company_id == task.company_id)
             )
             users = list(users_result.scalars().all())
             if len(users) != len(unique_ids):
                 return None
             if task.task_type == TaskType.GROUP:
-                invalid = [
-                    user.id
-                    for user in users
-                    if user.role != Role.HEAD and not bool(user.position and user.position.head_of_group)
-                ]
-                if invalid:
-                    return None
+                for user in users:
+                    if not await is_group_head(user.role, user.position_id):
+                        return None
         else:
             users = []
 
@@ -237,6 +273,20 @@ class TaskService:
         logger.info("Task deleted: id=%s", task_id)
         return True
 
+    async def _claim(self, task_id: int) -> bool:
+        """Move the task from AVAILABLE to IN_PROGRESS unless someone else already has.
+
+        One conditional UPDATE instead of read-check-write: concurrent claims queue on the row
+        lock and, once the winner commits, the others no longer match the WHERE clause.
+        """
+        result = await self.db.execute(
+            update(Task)
+            .where(Task.id == task_id, Task.task_step == TaskStep.AVAILABLE)
+            .values(task_step=TaskStep.IN_PROGRESS, version=Task.version + 1)
+            .returning(Task.id)
+        )
+        return result.scalar_one_or_none() is not None
+
     async def take_task(
             self,
             task_id: int,
@@ -263,20 +313,14 @@ class TaskService:
         if user_id not in [u.id for u in task_operation.accessed_users]:
             return None
 
-        user_result = await self.db.execute(
-            select(User).options(selectinload(User.position)).where(User.id == user_id)
-        )
-        user = user_result.scalar_one_or_none()
+        user = await self.db.get(User, user_id)
         if not user:
             return None
 
-        is_group_head = user.role == Role.HEAD or bool(user.position and user.position.head_of_group)
-        if task.task_type == TaskType.GROUP and not is_group_head:
+        if task.task_type == TaskType.GROUP and not await is_group_head(user.role, user.position_id):
             return None
 
-        task.task_step = TaskStep.IN_PROGRESS
-        task_operation.executors.append(user)
-
+        brigade_users = []
         if task.task_type == TaskType.GROUP:
             candidate_ids = list({uid for uid in (executors_list or []) if uid != user_id})
             if candidate_ids:
@@ -289,19 +333,23 @@ class TaskService:
                 brigade_users = list(users_result.scalars().all())
                 if len(brigade_users) != len(candidate_ids):
                     return None
-            else:
-                brigade_users = []
 
             full_group_size = 1 + len(brigade_users)
             if task.group_size_limit is not None and full_group_size > task.group_size_limit:
                 return None
 
-            for executor in brigade_users:
-                if executor.id not in [u.id for u in task_operation.executors]:
-                    task_operation.executors.append(executor)
+        if not await self._claim(task_id):
+            logger.info("Task take lost to a concurrent take: task_id=%s user_id=%s", task_id, user_id)
+            return None
+
+        task_operation.executors.append(user)
+        for executor in brigade_users:
+            if executor.id not in [u.id for u in task_operation.executors]:
+                task_operation.executors.append(executor)
 
         await self.db.flush()
         await self.db.refresh(task)
+        on_commit(self.db, lambda: TASK_TRANSITIONS.inc(transition="take"))
         logger.info("Task taken: task_id=%s user_id=%s type=%s", task_id, user_id, task.task_type)
         return task
 
@@ -328,12 +376,10 @@ class TaskService:
             return None
 
         if task.task_type == TaskType.GROUP:
-            user_result = await self.db.execute(
-                select(User).options(selectinload(User.position)).where(User.id == user_id)
-            )
-            user = user_result.scalar_one_or_none()
-            is_group_head = bool(user and (user.role == Role.HEAD or (user.position and user.position.head_of_group)))
-            if not is_group_head:
+            user = (await self.db.execute(
+                select(User.role, User.position_id).where(User.id == user_id)
+            )).one_or_none()
+            if not user or not await is_group_head(user.role, user.position_id):
                 return None
 
         task.task_step = TaskStep.COMPLETED
@@ -341,6 +387,7 @@ class TaskService:
 
         await self.db.flush()
         await self.db.refresh(task)
+        on_commit(self.db, lambda: TASK_TRANSITIONS.inc(transition="complete"))
         logger.info("Task completed: task_id=%s user_id=%s", task_id, user_id)
         return task
 
@@ -382,6 +429,7 @@ class TaskService:
 
         await self.db.flush()
         await self.db.refresh(task)
+        on_commit(self.db, lambda: TASK_TRANSITIONS.inc(transition="verify"))
         logger.info("Task verified: task_id=%s", task_id)
         return True
 
@@ -441,10 +489,58 @@ class TaskService:
 
         await self.db.flush()
         await self.db.refresh(task)
+        on_commit(self.db, lambda: TASK_TRANSITIONS.inc(transition="reject"))
         logger.info("Task rejected: task_id=%s", task_id)
         return False
 
 
+    @staticmethod
+    def _inbox_query(user_id: int, limit: int) -> Select:
+        memberships = union_all(
+            select(TaskOperation.task_id, true().label("via_access"))
+            .join(accessed_users, accessed_users.c.task_id == TaskOperation.id)
+            .where(accessed_users.c.user_id == user_id),
+            select(TaskOperation.task_id, false().label("via_access"))
+            .join(executors, executors.c.task_id == TaskOperation.id)
+            .where(executors.c.user_id == user_id),
+        ).subquery()
+
+        # Open steps list the nearest deadline first, closed ones the latest completion first.
+        open_deadline = case((Task.task_step.in_([TaskStep.AVAILABLE, TaskStep.IN_PROGRESS]), Task.deadline))
+        ranked = (
+            select(
+                Task,
+                func.row_number().over(
+                    partition_by=Task.task_step,
+                    order_by=(open_deadline.asc(), Task.completed_at.desc().nulls_last(), Task.id),
+                ).label("position"),
+                func.count().over(partition_by=Task.task_step).label("total"),
+            )
+            .join(memberships, memberships.c.task_id == Task.id)
+            # Available tasks come from the access list, every other step from the executors,
+            # exactly as in accessed_tasks / executing_tasks / ... below.
+            .where(or_(
+                and_(Task.task_step == TaskStep.AVAILABLE, memberships.c.via_access),
+                and_(Task.task_step != TaskStep.AVAILABLE, not_(memberships.c.via_access)),
+            ))
+            .subquery()
+        )
+        ranked_task = aliased(Task, ranked)
+        return (
+            select(ranked_task, ranked.c.total)
+            .where(ranked.c.position <= limit)
+            .order_by(ranked.c.task_step, ranked.c.position)
+        )
+
+    async def inbox(self, user_id: int, limit: int = 20) -> TaskInboxResponse:
+        """All of a worker's tasks grouped by step, at most `limit` per step, with per-step totals."""
+        buckets = {step: TaskList(tasks=[], total=0) for step in TaskStep}
+        for task, total in await self.db.execute(self._inbox_query(user_id, limit)):
+            bucket = buckets[task.task_step]
+            bucket.tasks.append(TaskResponse.model_validate(task))
+            bucket.total = total
+        return TaskInboxResponse(**{step.value: bucket for step, bucket in buckets.items()})
+
     async def accessed_tasks(self, user_id: int) -> Optional[list[TaskResponse]]:
         user = await self.db.get(User, user_id)
         if not user:
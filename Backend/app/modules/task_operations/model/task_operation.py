@@ -1,6 +1,6 @@
 from typing import List, TYPE_CHECKING
 
-from sqlalchemy import Integer, ForeignKey, Column, Table
+from sqlalchemy import Integer, ForeignKey, Column, Table, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.db import Base
@@ -16,6 +16,8 @@ accessed_users = Table(
     Base.metadata,
     Column("user_id", ForeignKey("user.id"), primary_key=True),
     Column("task_id", ForeignKey("task_operations.id"), primary_key=True),
+    # The primary key leads with user_id; joins coming from the task side need the reverse.
+    Index("idx_accessed_users_task_user", "task_id", "user_id"),
 )
 
 executors = Table(
@@ -23,10 +25,15 @@ executors = Table(
     Base.metadata,
     Column("user_id", ForeignKey("user.id"), primary_key=True),
     Column("task_id", ForeignKey("task_operations.id"), primary_key=True),
+    Index("idx_executors_task_user", "task_id", "user_id"),
 )
 
 class TaskOperation(Base):
     __tablename__ = "task_operations"
+    # Each task has exactly one operation, and every task -> operation join goes through task_id.
+    __table_args__ = (
+        Index("uq_task_operations_task_id", "task_id", unique=True),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, nullable=False)
     task_id: Mapped[int] = mapped_column(ForeignKey("task.id"), nullable=False)
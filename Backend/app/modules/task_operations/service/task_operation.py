@@ -3,14 +3,14 @@ from typing import Optional
 from fastapi import HTTPException, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
-from app.modules.base_module.enums import TaskType, Role
+from app.modules.base_module.enums import TaskType
 from app.modules.task.model.task import Task
 from app.modules.task_operations.model.task_operation import TaskOperation
 from app.modules.task_operations.schema.task_operation import TaskOperationCreate, TaskOperationBase, \
     TaskOperationUpdate, TaskOperationResponse
 from app.modules.users.models.user import User
+from app.modules.users.services.position_cache import is_group_head
 
 
 class TaskOperationService:
@@ -30,9 +30,7 @@ class TaskOperationService:
         if task_in.accessed_users_ids:
             unique_ids = list(set(task_in.accessed_users_ids))
             result = await self.db.execute(
-                select(User)
-                .options(selectinload(User.position))
-                .where(User.id.in_(unique_ids), User.company_id == task.company_id)
+                select(User).where(User.id.in_(unique_ids), User.company_id == task.company_id)
             )
             accessed_users_list = list(result.scalars().all())
             if len(accessed_users_list) != len(unique_ids):
@@ -44,7 +42,7 @@ class TaskOperationService:
                 not_group_heads = [
                     user.id
                     for user in accessed_users_list
-                    if user.role != Role.HEAD and not bool(user.position and user.position.head_of_group)
+                    if not await is_group_head(user.role, user.position_id)
                 ]
                 if not_group_heads:
                     raise HTTPException(
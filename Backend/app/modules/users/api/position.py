@@ -1,12 +1,13 @@
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, status as http_status, HTTPException
+from fastapi import APIRouter, Depends, status as http_status, HTTPException, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.db import get_db
+from app.core.db import get_db, get_read_db
+from app.core.http_cache import SHORT_LIVED, not_modified, set_cache_headers, weak_etag
+from app.modules.auth.schemas.auth import Principal
 from app.modules.base_module.dependencies import require_role
 from app.modules.base_module.enums import Role
-from app.modules.users.models.user import User
 from app.modules.users.services.position import PositionServices
 from app.modules.users.schemas.position import PositionResponse, PositionCreate
 
@@ -19,7 +20,14 @@ def get_position_service(
     return PositionServices(db)
 
 
+def get_position_read_service(
+    db: Annotated[AsyncSession, Depends(get_read_db)],
+) -> PositionServices:
+    return PositionServices(db)
+
+
 ServiceDep = Annotated[PositionServices, Depends(get_position_service)]
+ReadServiceDep = Annotated[PositionServices, Depends(get_position_read_service)]
 
 
 @router.post(
@@ -28,22 +36,30 @@ ServiceDep = Annotated[PositionServices, Depends(get_position_service)]
 async def create_position(
         pos_in: PositionCreate,
         service: ServiceDep,
-        _current_user: Annotated[User, Depends(require_role(Role.ADMIN, Role.SUPERVISOR))]
+        _current_user: Annotated[Principal, Depends(require_role(Role.ADMIN, Role.SUPERVISOR))]
 ):
     return await service.create(pos_in)
 
 
 @router.get("/{pos_id}", response_model=PositionResponse)
-async def get_pos_by_id(pos_id: int, service: ServiceDep):
+async def get_pos_by_id(pos_id: int, request: Request, response: Response, service: ReadServiceDep):
     pos = await service.get_by_id(pos_id)
     if not pos:
         raise HTTPException(
             status_code=http_status.HTTP_404_NOT_FOUND, detail="Позиция не найдена"
         )
 
+    etag = weak_etag(pos.id, pos.updated_at)
+    if cached := not_modified(request, etag, SHORT_LIVED):
+        return cached
+    set_cache_headers(response, etag, SHORT_LIVED)
     return pos
 
 
 @router.get("/", response_model=list[PositionResponse])
-async def get_all_pos(service: ServiceDep):
+async def get_all_pos(request: Request, response: Response, service: ReadServiceDep):
+    etag = weak_etag(await service.get_list_version())
+    if cached := not_modified(request, etag, SHORT_LIVED):
+        return cached
+    set_cache_headers(response, etag, SHORT_LIVED)
     return await service.get_all()
@@ -4,14 +4,23 @@ from fastapi import APIRouter, Depends, status as http_status, HTTPException, Qu
 from sqlalchemy.ext.asyncio import AsyncSession
 from starlette import status
 
-from app.core.db import get_db
+from app.core.config import settings
+from app.core.db import get_db, get_read_db
+from app.core.pagination import cursor_headers
+from app.core.serialization import orm_list_response
+from app.core.storage import get_storage
+from app.modules.auth.schemas.auth import Principal
 from app.modules.base_module.dependencies import get_current_user, require_role
 from app.modules.base_module.enums import Role
 from app.modules.users.models.user import User
+from app.modules.users.services.avatar import avatar_key, avatar_pipeline, read_upload
 from app.modules.users.services.user import UserService
+from app.modules.users.services.user_import import UserImportService, detect_import_format
 from app.modules.users.schemas.user import (
+    AvatarJobResponse,
     UserResponse,
     UserCreate,
+    UserImportResponse,
     UserFilter,
     UserSort,
     UserUpdate,
@@ -25,7 +34,19 @@ def get_user_service(db: Annotated[AsyncSession, Depends(get_db)]) -> UserServic
     return UserService(db)
 
 
+def get_user_read_service(db: Annotated[AsyncSession, Depends(get_read_db)]) -> UserService:
+    return UserService(db)
+
+
 ServiceDep = Annotated[UserService, Depends(get_user_service)]
+ReadServiceDep = Annotated[UserService, Depends(get_user_read_service)]
+
+
+def get_user_import_service(db: Annotated[AsyncSession, Depends(get_db)]) -> UserImportService:
+    return UserImportService(db)
+
+
+ImportServiceDep = Annotated[UserImportService, Depends(get_user_import_service)]
 
 
 def _can_assign_role(actor_role: Role, target_role: Role) -> bool:
@@ -36,13 +57,28 @@ def _can_assign_role(actor_role: Role, target_role: Role) -> bool:
     return False
 
 
+def _manages_company(actor: Principal, company_id: Optional[int]) -> bool:
+    if actor.role == Role.ADMIN:
+        return actor.company_id is None or actor.company_id == company_id
+    return actor.role == Role.SUPERVISOR and actor.company_id == company_id
+
+
+def _can_manage_user(actor: Principal, target: User) -> bool:
+    """The user themself, or an admin/supervisor of their company (supervisors not over admins)."""
+    if actor.id == target.id:
+        return True
+    if actor.role == Role.SUPERVISOR and target.role == Role.ADMIN:
+        return False
+    return _manages_company(actor, target.company_id)
+
+
 @router.post(
     "/create", response_model=UserResponse, status_code=http_status.HTTP_201_CREATED
 )
 async def create_user_endpoint(
     user_in: UserCreate,
     service: ServiceDep,
-    current_user: Annotated[User, Depends(require_role(Role.ADMIN, Role.SUPERVISOR))],
+    current_user: Annotated[Principal, Depends(require_role(Role.ADMIN, Role.SUPERVISOR))],
 ) -> UserResponse:
     payload = user_in.model_dump()
 
@@ -57,20 +93,45 @@ async def create_user_endpoint(
     return await service.create(UserCreate(**payload))
 
 
+@router.post("/import", response_model=UserImportResponse)
+async def import_users(
+    service: ImportServiceDep,
+    current_user: Annotated[Principal, Depends(require_role(Role.ADMIN, Role.SUPERVISOR))],
+    file: UploadFile = File(...),
+) -> UserImportResponse:
+    if current_user.company_id is None:
+        raise HTTPException(
+            status_code=http_status.HTTP_400_BAD_REQUEST,
+            detail="Нельзя создать сотрудника без компании",
+        )
+
+    fmt = detect_import_format(file.filename, file.content_type)
+    if fmt is None:
+        raise HTTPException(
+            status_code=http_status.HTTP_400_BAD_REQUEST,
+            detail="Поддерживаются только файлы CSV и NDJSON",
+        )
+
+    return await service.import_users(file.file, fmt, current_user.company_id)
+
+
 @router.get("/my-employees", response_model=list[UserResponse])
 async def get_employees(
-        current_user: Annotated[User, Depends(get_current_user)],
-        service: ServiceDep,
+        current_user: Annotated[Principal, Depends(get_current_user)],
+        service: ReadServiceDep,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = Query(None, ge=1, le=1000),
 ) -> list[UserResponse]:
-    employees = await service.get_my_employees(current_user.id)
-    if not employees:
+    page = await service.get_my_employees(current_user.id, cursor=cursor, limit=limit)
+    if not page or (not page[0] and cursor is None):
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Нет еще данных о работниках")
 
-    return employees
+    employees, next_page = page
+    return orm_list_response(employees, UserResponse, headers=cursor_headers(next_page))
 
 
 @router.get("/{user_id}", response_model=UserResponse)
-async def get_user(user_id: int, service: ServiceDep) -> UserResponse:
+async def get_user(user_id: int, service: ReadServiceDep) -> UserResponse:
     user = await service.get_by_id(user_id)
     if not user:
         raise HTTPException(
@@ -81,7 +142,7 @@ async def get_user(user_id: int, service: ServiceDep) -> UserResponse:
 
 @router.get("/", response_model=List[UserResponse])
 async def get_all_users(
-    service: ServiceDep,
+    service: ReadServiceDep,
     role: Optional[Role] = None,
     position_id: Optional[int] = None,
     min_salary: Optional[int] = None,
@@ -91,6 +152,8 @@ async def get_all_users(
         "id", "login", "first_name", "last_name", "salary", "created_at"
     ] = Query("id"),
     sort_order: Literal["asc", "desc"] = Query("asc"),
+    cursor: Optional[str] = None,
+    # Offset paging is kept for old clients; new ones follow the X-Next-Cursor header.
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
 ) -> List[UserResponse]:
@@ -104,7 +167,12 @@ async def get_all_users(
 
     sort = UserSort(field=sort_field, order=sort_order)
 
-    return await service.get_all(filters=filters, sort=sort, skip=skip, limit=limit)
+    if skip:
+        users = await service.get_all(filters=filters, sort=sort, skip=skip, limit=limit)
+        return orm_list_response(users, UserResponse)
+
+    users, next_page = await service.get_page(filters=filters, sort=sort, cursor=cursor, limit=limit)
+    return orm_list_response(users, UserResponse, headers=cursor_headers(next_page))
 
 
 @router.patch("/{user_id}", response_model=UserResponse)
@@ -112,7 +180,7 @@ async def update_user(
     user_id: int,
     user_in: UserUpdate,
     service: ServiceDep,
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[Principal, Depends(get_current_user)],
 ) -> UserResponse:
     existing_user = await service.get_by_id(user_id)
     if not existing_user:
@@ -157,47 +225,76 @@ async def update_password(
     return user
 
 
-@router.post("/{user_id}/avatar", response_model=UserResponse)
+@router.post(
+    "/{user_id}/avatar", response_model=AvatarJobResponse, status_code=http_status.HTTP_202_ACCEPTED
+)
 async def upload_user_avatar(
     user_id: int,
-    service: ServiceDep,
+    service: ReadServiceDep,
+    current_user: Annotated[Principal, Depends(get_current_user)],
     file: UploadFile = File(...),
-) -> UserResponse:
+) -> AvatarJobResponse:
     if not file.content_type or not file.content_type.startswith("image/"):
         raise HTTPException(
             status_code=http_status.HTTP_400_BAD_REQUEST,
             detail="Файл должен быть изображением (jpeg, png, webp и др.)",
         )
 
-    file_bytes = await file.read()
-    if len(file_bytes) > 5 * 1024 * 1024:
+    user = await service.get_by_id(user_id)
+    if not user:
+        raise HTTPException(
+            status_code=http_status.HTTP_404_NOT_FOUND, detail="Пользователь не найден"
+        )
+    if not _can_manage_user(current_user, user):
         raise HTTPException(
-            status_code=http_status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-            detail="Размер файла не должен превышать 5 МБ",
+            status_code=http_status.HTTP_403_FORBIDDEN, detail="Недостаточно прав для изменения аватара"
         )
 
-    from app.core.cloudinary_client import upload_avatar
-    avatar_url = await upload_avatar(file_bytes, user_id)
+    file_bytes = await read_upload(file, settings.AVATAR_MAX_BYTES)
 
-    user = await service.update_avatar(user_id, avatar_url)
-    if not user:
+    # Resizing and uploading happen in the background; poll /user/avatar-jobs/{job_id}.
+    job = avatar_pipeline.submit(user_id, file_bytes, file.content_type, current_user.id, user.company_id)
+    return job.to_response()
+
+
+@router.get("/avatar-jobs/{job_id}", response_model=AvatarJobResponse)
+async def get_avatar_job(
+    job_id: str,
+    current_user: Annotated[Principal, Depends(get_current_user)],
+) -> AvatarJobResponse:
+    job = avatar_pipeline.get(job_id)
+    if not job:
+        # Jobs live in the memory of the worker that accepted the upload.
         raise HTTPException(
-            status_code=http_status.HTTP_404_NOT_FOUND, detail="Пользователь не найден"
+            status_code=http_status.HTTP_404_NOT_FOUND,
+            detail="Задача загрузки не найдена: она устарела или обрабатывается другим экземпляром сервера; "
+                   "текущий аватар доступен в GET /user/{user_id}",
         )
-    return user
+    if current_user.id not in (job.user_id, job.submitted_by) and not _manages_company(current_user, job.company_id):
+        raise HTTPException(
+            status_code=http_status.HTTP_403_FORBIDDEN, detail="Нет доступа к задаче загрузки"
+        )
+    return job.to_response()
 
 
 @router.delete("/{user_id}/avatar", response_model=UserResponse)
-async def delete_user_avatar(user_id: int, service: ServiceDep) -> UserResponse:
+async def delete_user_avatar(
+    user_id: int,
+    service: ServiceDep,
+    current_user: Annotated[Principal, Depends(get_current_user)],
+) -> UserResponse:
     user = await service.get_by_id(user_id)
     if not user:
         raise HTTPException(
             status_code=http_status.HTTP_404_NOT_FOUND, detail="Пользователь не найден"
         )
+    if not _can_manage_user(current_user, user):
+        raise HTTPException(
+            status_code=http_status.HTTP_403_FORBIDDEN, detail="Недостаточно прав для изменения аватара"
+        )
 
     if user.avatar_url:
-        from app.core.cloudinary_client import delete_avatar
-        await delete_avatar(user_id)
+        await get_storage().delete(avatar_key(user_id))
 
     updated_user = await service.update_avatar(user_id, None)
     return updated_user
@@ -4,9 +4,10 @@ from sqlalchemy import String, Integer, Boolean
 from sqlalchemy.orm import Mapped, mapped_column, Relationship, relationship
 
 from app.core.db import Base
+from app.modules.base_module.base_class import TimestampMixin
 
 
-class Position(Base):
+class Position(Base, TimestampMixin):
     __tablename__ = "position"
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, nullable=False)
@@ -9,6 +9,7 @@ from sqlalchemy import (
     Date,
     CheckConstraint,
     ForeignKey,
+    Index,
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -26,7 +27,17 @@ if TYPE_CHECKING:
 
 class User(Base, TimestampMixin):
     __tablename__ = "user"
-    __table_args__ = (CheckConstraint("salary > 0", name="check_salary_non_negative"),)
+    __table_args__ = (
+        CheckConstraint("salary > 0", name="check_salary_non_negative"),
+        # Keyset pagination walks (sort field, id); login is unique, so its own index is enough.
+        Index("idx_user_first_name_id", "first_name", "id"),
+        Index("idx_user_last_name_id", "last_name", "id"),
+        Index("idx_user_salary_id", "salary", "id"),
+        Index("idx_user_created_at_id", "created_at", "id"),
+        Index("idx_user_company_id_id", "company_id", "id"),
+        # The pg_trgm and lower() prefix indexes used by search are PostgreSQL-only and are
+        # created in migration d9b2e7a4c3f5.
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, nullable=False)
     login: Mapped[str] = mapped_column(String(100), index=True, unique=True, nullable=False)
@@ -4,7 +4,7 @@ from typing import Optional, Literal, Annotated, TYPE_CHECKING
 
 from pydantic import BaseModel, Field, field_validator, ConfigDict, model_validator
 
-from app.modules.base_module.enums import Role
+from app.modules.base_module.enums import JobStatus, Role
 from app.modules.users.schemas.position import PositionResponse
 
 
@@ -95,3 +95,23 @@ class UserSort(BaseModel):
         "id"
     )
     order: Literal["asc", "desc"] = "asc"
+
+
+class UserImportError(BaseModel):
+    row: int
+    login: Optional[str] = None
+    errors: list[str]
+
+
+class UserImportResponse(BaseModel):
+    created: int
+    failed: int
+    errors: list[UserImportError]
+
+
+class AvatarJobResponse(BaseModel):
+    job_id: str
+    user_id: int
+    status: JobStatus
+    avatar_url: Optional[str] = None
+    error: Optional[str] = None
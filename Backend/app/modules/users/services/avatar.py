@@ -0,0 +1,157 @@
+import asyncio
+from dataclasses import dataclass, field
+from typing import Optional
+from uuid import uuid4
+
+from fastapi import HTTPException, UploadFile, status
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.db import db_manager
+from app.core.images import ImageProcessor, InvalidImageError
+from app.core.logging import get_logger
+from app.core.storage import get_storage
+from app.modules.base_module.enums import JobStatus
+from app.modules.users.schemas.user import AvatarJobResponse
+from app.modules.users.services.user import UserService
+
+logger = get_logger("users.avatar")
+
+READ_CHUNK_SIZE = 64 * 1024
+# Finished jobs stay queryable for this long.
+JOB_TTL_SECONDS = 3600
+
+
+def avatar_key(user_id: int) -> str:
+    return f"avatars/user_{user_id}"
+
+
+def format_size(size: int) -> str:
+    for unit, scale in (("МБ", 1024 * 1024), ("КБ", 1024)):
+        if size >= scale:
+            return f"{size / scale:.3g} {unit}"
+    return f"{size} Б"
+
+
+async def read_upload(file: UploadFile, max_bytes: int) -> bytes:
+    """Read an upload in chunks, rejecting it as soon as it grows past max_bytes."""
+    too_large = HTTPException(
+        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        detail=f"Размер файла не должен превышать {format_size(max_bytes)}",
+    )
+    if file.size is not None and file.size > max_bytes:
+        raise too_large
+
+    chunks, total = [], 0
+    while chunk := await file.read(READ_CHUNK_SIZE):
+        total += len(chunk)
+        if total > max_bytes:
+            raise too_large
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+
+@dataclass
+class AvatarJob:
+    user_id: int
+    content_type: str
+    data: Optional[bytes]
+    # Who uploaded the file and the company of the user it is for; used to authorize status checks.
+    submitted_by: int
+    company_id: Optional[int]
+    id: str = field(default_factory=lambda: uuid4().hex)
+    status: JobStatus = JobStatus.PENDING
+    avatar_url: Optional[str] = None
+    error: Optional[str] = None
+
+    def to_response(self) -> AvatarJobResponse:
+        return AvatarJobResponse(
+            job_id=self.id, user_id=self.user_id, status=self.status, avatar_url=self.avatar_url, error=self.error
+        )
+
+
+class AvatarPipeline:
+    """Background avatar processing: thumbnail in a process pool, upload, then save the URL.
+
+    Uploads wait in a bounded queue for one of `workers` tasks; when the queue is full the
+    request is rejected with 503 rather than buffering an unbounded number of images. Job
+    state lives in this worker's memory only.
+    """
+
+    def __init__(self, workers: int, queue_size: int, images: ImageProcessor):
+        self.workers = workers
+        self.images = images
+        self._queue: asyncio.Queue[AvatarJob] = asyncio.Queue(maxsize=queue_size)
+        self._jobs: TTLCache[str, AvatarJob] = TTLCache(maxsize=10 * queue_size, ttl=JOB_TTL_SECONDS)
+        self._tasks: list[asyncio.Task] = []
+
+    def submit(
+        self, user_id: int, data: bytes, content_type: str, submitted_by: int, company_id: Optional[int]
+    ) -> AvatarJob:
+        job = AvatarJob(
+            user_id=user_id, content_type=content_type, data=data,
+            submitted_by=submitted_by, company_id=company_id,
+        )
+        try:
+            self._queue.put_nowait(job)
+        except asyncio.QueueFull:
+            logger.warning("Avatar queue is full, rejecting upload for user id=%s", user_id)
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Сервер перегружен, повторите попытку позже",
+                headers={"Retry-After": "5"},
+            )
+        self._jobs.set(job.id, job)
+        return job
+
+    def get(self, job_id: str) -> Optional[AvatarJob]:
+        return self._jobs.get(job_id)
+
+    async def process(self, job: AvatarJob) -> None:
+        job.status = JobStatus.PROCESSING
+        try:
+            data, content_type = await self.images.thumbnail(job.data, job.content_type, settings.AVATAR_SIZE_PX)
+            # Without Pillow the upload is stored as is; let the storage crop it if it can.
+            crop_size = None if self.images.available else settings.AVATAR_SIZE_PX
+            avatar_url = await get_storage().put(avatar_key(job.user_id), data, content_type, crop_size)
+
+            async with db_manager.AsyncSessionLocal() as session:
+                user = await UserService(session).update_avatar(job.user_id, avatar_url)
+                await session.commit()
+            if user is None:
+                job.status, job.error = JobStatus.FAILED, "Пользователь не найден"
+                return
+
+            job.status, job.avatar_url = JobStatus.DONE, avatar_url
+        except InvalidImageError:
+            job.status, job.error = JobStatus.FAILED, "Файл не является изображением"
+        except Exception as e:
+            logger.error("Avatar job %s for user id=%s failed: %s", job.id, job.user_id, e)
+            job.status, job.error = JobStatus.FAILED, "Не удалось загрузить аватар"
+        finally:
+            job.data = None
+
+    async def _worker(self) -> None:
+        while True:
+            job = await self._queue.get()
+            try:
+                await self.process(job)
+            finally:
+                self._queue.task_done()
+
+    def start(self) -> None:
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self.images.shutdown()
+
+
+avatar_pipeline = AvatarPipeline(
+    workers=settings.AVATAR_WORKERS,
+    queue_size=settings.AVATAR_QUEUE_SIZE,
+    images=ImageProcessor(settings.IMAGE_PROCESSES),
+)
@@ -3,8 +3,11 @@ from typing import Optional
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.http_cache import fetch_version
+from app.modules.auth.service.principal_cache import invalidate_all_principals
 from app.modules.users.models.position import Position
 from app.modules.users.schemas.position import PositionCreate, PositionUpdate
+from app.modules.users.services.position_cache import invalidate_positions
 
 
 class PositionServices:
@@ -16,6 +19,7 @@ class PositionServices:
 
         self.db.add(position)
         await self.db.flush()
+        invalidate_positions(self.db)
         await self.db.refresh(position)
         return position
 
@@ -25,6 +29,9 @@ class PositionServices:
         )
         return result.scalar_one_or_none()
 
+    async def get_list_version(self) -> tuple:
+        return await fetch_version(self.db, Position)
+
     async def get_all(self) -> list[Position]:
         result = await self.db.execute(select(Position))
         return list(result.scalars().all())
@@ -46,13 +53,18 @@ class PositionServices:
             setattr(position, field, value)
 
         await self.db.flush()
+        # head_of_group is part of every cached principal holding this position.
+        invalidate_all_principals(self.db)
+        invalidate_positions(self.db)
         await self.db.refresh(position)
         return position
 
     async def delete(self, position_id: int) -> bool:
-        position = self.get_by_id(position_id)
+        position = await self.get_by_id(position_id)
         if not position:
             return False
 
         await self.db.delete(position)
+        invalidate_all_principals(self.db)
+        invalidate_positions(self.db)
         return True
@@ -0,0 +1,78 @@
+import asyncio
+import time
+from typing import Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.db import db_manager, on_commit
+from app.core.logging import get_logger
+from app.modules.base_module.enums import Role
+from app.modules.users.models.position import Position
+
+logger = get_logger("positions")
+
+
+class PositionCache:
+    """The whole position table (id -> head_of_group) held in memory per worker.
+
+    Positions are few and rarely change, so the table is loaded in one query, warmed at
+    startup and reloaded after a local change (see `invalidate_positions`), after `ttl`
+    seconds (changes made through other workers) or when an unknown id shows up. Loads use
+    their own short session, never a request's, so uncommitted changes cannot get cached.
+    """
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._head_of_group: Optional[dict[int, bool]] = None
+        self._loaded_at = 0.0
+        self._lock = asyncio.Lock()
+
+    def _fresh(self) -> bool:
+        return self._head_of_group is not None and time.monotonic() - self._loaded_at < self.ttl
+
+    async def load(self) -> None:
+        async with db_manager.AsyncSessionLocal() as session:
+            rows = (await session.execute(select(Position.id, Position.head_of_group))).all()
+        self._head_of_group = {row.id: bool(row.head_of_group) for row in rows}
+        self._loaded_at = time.monotonic()
+
+    async def _ensure(self, position_id: Optional[int] = None) -> dict[int, bool]:
+        if self._fresh() and (position_id is None or position_id in self._head_of_group):
+            return self._head_of_group
+        loaded_at = self._loaded_at
+        async with self._lock:
+            # Skip the query when another request reloaded while this one waited for the lock.
+            if self._loaded_at == loaded_at or not self._fresh():
+                await self.load()
+        return self._head_of_group
+
+    async def is_head_of_group(self, position_id: Optional[int]) -> bool:
+        if position_id is None:
+            return False
+        return (await self._ensure(position_id)).get(position_id, False)
+
+    async def warm(self) -> None:
+        await self.load()
+        logger.info("Position cache warmed: %d positions", len(self._head_of_group))
+
+    def invalidate(self) -> None:
+        self._head_of_group = None
+
+
+position_cache = PositionCache(ttl=settings.POSITION_CACHE_TTL_SECONDS)
+
+
+def invalidate_positions(db: AsyncSession) -> None:
+    """Drop the cache now and again once the transaction commits.
+
+    Reloads in between read committed rows only, so a rollback leaves nothing stale behind.
+    """
+    position_cache.invalidate()
+    on_commit(db, position_cache.invalidate)
+
+
+async def is_group_head(role: Role, position_id: Optional[int]) -> bool:
+    """May this user lead a group task: HEAD role or a head_of_group position."""
+    return role == Role.HEAD or await position_cache.is_head_of_group(position_id)
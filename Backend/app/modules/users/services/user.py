@@ -2,15 +2,19 @@ from datetime import date
 from typing import Optional
 
 from fastapi import HTTPException, status
-from sqlalchemy import select, or_, desc, asc
+from sqlalchemy import Select, select, desc, asc
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from app.core.logging import get_logger
-from app.core.security import hash_password, verify_password
+from app.core.pagination import decode_cursor, keyset_page, next_cursor
+from app.core.security import password_hasher
 
 logger = get_logger("users")
+from app.modules.auth.service.principal_cache import invalidate_principal
+from app.modules.auth.service.revocation import revoke_user_tokens
 from app.modules.base_module.enums import TaskStep, PeriodType
+from app.modules.search.service.search import USER_SEARCH_COLUMNS, contains_any
 from app.modules.statistics.models.user_statistic import UserStatistic
 from app.modules.task.model.task import Task
 from app.modules.task.schemas.task import TaskResponse
@@ -30,16 +34,17 @@ class UserService:
         self.db = db
 
     async def create(self, user_in: UserCreate) -> User:
-        user = User(
-            **user_in.model_dump(exclude={"password"}),
-            hashed_password=hash_password(user_in.password),
-        )
-
-        existing_user = await self.db.execute(select(User).where(User.login == user.login))
+        # Check the login first so a duplicate does not cost an Argon2 hash.
+        existing_user = await self.db.execute(select(User).where(User.login == user_in.login))
         if existing_user.scalar_one_or_none():
             logger.warning("Create user failed: login already exists: %s", user_in.login)
             raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Пользователь уже существует.")
 
+        user = User(
+            **user_in.model_dump(exclude={"password"}),
+            hashed_password=await password_hasher.hash(user_in.password),
+        )
+
         self.db.add(user)
         await self.db.flush()
 
@@ -70,10 +75,8 @@ class UserService:
         )
         return result.scalar_one_or_none()
 
-    async def get_all(
-        self, filters: UserFilter, sort: UserSort, skip: int = 0, limit: int = 100
-    ) -> list[User]:
-
+    @staticmethod
+    def _filtered_query(filters: UserFilter) -> Select:
         query = select(User).options(selectinload(User.position))
 
         if filters.role:
@@ -89,14 +92,13 @@ class UserService:
             query = query.where(User.salary >= filters.min_salary)
 
         if filters.search:
-            search_pattern = f"%{filters.search}"
-            query = query.where(
-                or_(
-                    User.first_name.ilike(search_pattern),
-                    User.last_name.ilike(search_pattern),
-                    User.login.ilike(search_pattern),
-                )
-            )
+            query = query.where(contains_any(USER_SEARCH_COLUMNS, filters.search))
+        return query
+
+    async def get_all(
+        self, filters: UserFilter, sort: UserSort, skip: int = 0, limit: int = 100
+    ) -> list[User]:
+        query = self._filtered_query(filters)
 
         order_func = desc if sort.order == "desc" else asc
         query = query.order_by(order_func(getattr(User, sort.field)))
@@ -105,6 +107,17 @@ class UserService:
         result = await self.db.execute(query)
         return list(result.scalars().all())
 
+    async def get_page(
+        self, filters: UserFilter, sort: UserSort, cursor: Optional[str] = None, limit: int = 100
+    ) -> tuple[list[User], Optional[str]]:
+        """Keyset page ordered by (sort.field, id) plus the cursor of the next page, if any."""
+        sort_column = getattr(User, sort.field)
+        after = decode_cursor(cursor, sort.field, sort.order, sort_column) if cursor else None
+        query = keyset_page(self._filtered_query(filters), sort_column, User.id, sort.order, after, limit)
+
+        result = await self.db.execute(query)
+        return next_cursor(result.scalars().all(), sort.field, sort.order, limit)
+
     async def get_tasks_in_progress(self, user_id: int) -> Optional[list[TaskResponse]]:
         user = await self.get_by_id(user_id)
         if not user:
@@ -165,10 +178,15 @@ class UserService:
             return None
 
         update_data = user_in.model_dump(exclude_unset=True)
+        role_changed = "role" in update_data and update_data["role"] != user.role
         for field, value in update_data.items():
             setattr(user, field, value)
 
         await self.db.flush()
+        invalidate_principal(self.db, user_id)
+        if role_changed:
+            # Tokens issued under the old role must not keep working until they expire.
+            revoke_user_tokens(self.db, user_id)
 
         result = await self.db.execute(
             select(User)
@@ -187,12 +205,13 @@ class UserService:
             return None
 
         # noinspection PyTypeChecker
-        if not verify_password(passwords.old_password, user.hashed_password):
+        if not await password_hasher.verify(passwords.old_password, user.hashed_password):
             logger.warning("Update password: wrong old password for user id=%s", user_id)
             return None
 
-        user.hashed_password = hash_password(passwords.new_password)
+        user.hashed_password = await password_hasher.hash(passwords.new_password)
         await self.db.flush()
+        invalidate_principal(self.db, user_id)
 
         result = await self.db.execute(
             select(User)
@@ -226,15 +245,19 @@ class UserService:
             return False
 
         await self.db.delete(user)
+        invalidate_principal(self.db, user_id)
         logger.info("User deleted: id=%s", user_id)
         return True
 
-    async def get_my_employees(self, user_id: int) -> list[UserResponse] | None:
+    async def get_my_employees(
+        self, user_id: int, cursor: Optional[str] = None, limit: Optional[int] = None
+    ) -> tuple[list[User], Optional[str]] | None:
+        """Colleagues of user_id ordered by id; without `limit` the whole list is returned."""
         user = await self.get_by_id(user_id)
         if not user:
             return None
 
-        employees = await self.db.execute(
+        query = (
             select(User)
             .options(selectinload(User.position))
             .where(
@@ -242,4 +265,10 @@ class UserService:
                 User.id != user_id
             )
         )
-        return list(employees.scalars().all())
\ No newline at end of file
+        if limit is None:
+            employees = await self.db.execute(query.order_by(User.id))
+            return list(employees.scalars().all()), None
+
+        after = decode_cursor(cursor, "id", "asc", User.id) if cursor else None
+        employees = await self.db.execute(keyset_page(query, User.id, User.id, "asc", after, limit))
+        return next_cursor(employees.scalars().all(), "id", "asc", limit)
\ No newline at end of file
@@ -0,0 +1,258 @@
+import asyncio
+import csv
+import io
+import json
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+from itertools import islice
+from typing import BinaryIO, Iterator, Literal, Optional
+
+from fastapi import HTTPException, status
+from pydantic import ValidationError
+from sqlalchemy import insert, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.core.security import hash_password_batch
+from app.modules.base_module.enums import PeriodType
+from app.modules.statistics.models.user_statistic import UserStatistic
+from app.modules.users.models.position import Position
+from app.modules.users.models.user import User
+from app.modules.users.schemas.user import UserCreate, UserImportError, UserImportResponse
+
+logger = get_logger("users.import")
+
+ImportFormat = Literal["csv", "ndjson"]
+
+# (row number, parsed fields or None, parse error)
+RawRow = tuple[int, Optional[dict], Optional[str]]
+
+_hash_pool: Optional[ProcessPoolExecutor] = None
+
+
+def detect_import_format(filename: Optional[str], content_type: Optional[str]) -> Optional[ImportFormat]:
+    name = (filename or "").lower()
+    content_type = (content_type or "").split(";")[0].strip().lower()
+    if name.endswith(".csv") or content_type in {"text/csv", "application/csv"}:
+        return "csv"
+    if name.endswith((".ndjson", ".jsonl")) or content_type in {"application/x-ndjson", "application/jsonl"}:
+        return "ndjson"
+    return None
+
+
+def iter_rows(file: BinaryIO, fmt: ImportFormat) -> Iterator[RawRow]:
+    """Parse the upload lazily, one row at a time; the file is never read into memory whole."""
+    text = io.TextIOWrapper(file, encoding="utf-8-sig", newline="")
+    try:
+        yield from _parse_csv(text) if fmt == "csv" else _parse_ndjson(text)
+    except UnicodeDecodeError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Файл должен быть в кодировке UTF-8",
+        )
+    except csv.Error as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Некорректный CSV-файл: {e}",
+        )
+
+
+def _parse_csv(text: io.TextIOWrapper) -> Iterator[RawRow]:
+    for row_number, row in enumerate(csv.DictReader(text), start=1):
+        # Empty cells mean "not set" for the optional columns (position_id, bonus).
+        yield row_number, {key: value or None for key, value in row.items() if key}, None
+
+
+def _parse_ndjson(text: io.TextIOWrapper) -> Iterator[RawRow]:
+    row_number = 0
+    for line in text:
+        if not line.strip():
+            continue
+        row_number += 1
+        try:
+            data = json.loads(line)
+        except ValueError:
+            yield row_number, None, "Строка не является корректным JSON"
+            continue
+        if not isinstance(data, dict):
+            yield row_number, None, "Строка должна быть JSON-объектом"
+            continue
+        yield row_number, data, None
+
+
+def _get_hash_pool() -> ProcessPoolExecutor:
+    global _hash_pool
+    if _hash_pool is None:
+        # spawn, not fork: the server process runs threads (log listener, DB drivers) whose
+        # locks a forked child could inherit in a held state.
+        _hash_pool = ProcessPoolExecutor(
+            max_workers=settings.USER_IMPORT_HASH_PROCESSES,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _hash_pool
+
+
+async def hash_passwords(passwords: list[str]) -> list[str]:
+    """Hash a batch across the import process pool, keeping the input order."""
+    if not passwords:
+        return []
+    workers = settings.USER_IMPORT_HASH_PROCESSES
+    size = -(-len(passwords) // workers)
+    chunks = [passwords[i:i + size] for i in range(0, len(passwords), size)]
+    loop = asyncio.get_running_loop()
+    results = await asyncio.gather(*(loop.run_in_executor(_get_hash_pool(), hash_password_batch, chunk) for chunk in chunks))
+    return [hashed for chunk in results for hashed in chunk]
+
+
+def shutdown_hash_pool() -> None:
+    global _hash_pool
+    if _hash_pool is not None:
+        _hash_pool.shutdown(wait=False, cancel_futures=True)
+        _hash_pool = None
+
+
+def _format_validation_error(error: ValidationError) -> list[str]:
+    return [
+        f"{'.'.join(str(part) for part in item['loc'])}: {item['msg']}" if item["loc"] else item["msg"]
+        for item in error.errors()
+    ]
+
+
+class UserImportService:
+    """Bulk creation of employees from a CSV or NDJSON upload.
+
+    Rows are processed in batches of USER_IMPORT_BATCH_SIZE: validated with UserCreate, checked
+    against existing logins and positions with one query each, hashed in a process pool and
+    inserted with multi-row INSERTs (users, then their initial monthly statistics). Invalid rows
+    are reported back and skipped; the valid ones are created in the request's transaction.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def import_users(self, file: BinaryIO, fmt: ImportFormat, company_id: int) -> UserImportResponse:
+        rows = iter_rows(file, fmt)
+        seen_logins: set[str] = set()
+        errors: list[UserImportError] = []
+        created = 0
+        total = 0
+
+        while True:
+            batch = await asyncio.to_thread(lambda: list(islice(rows, settings.USER_IMPORT_BATCH_SIZE)))
+            if not batch:
+                break
+            total += len(batch)
+            if total > settings.USER_IMPORT_MAX_ROWS:
+                raise HTTPException(
+                    status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                    detail=f"Файл содержит больше {settings.USER_IMPORT_MAX_ROWS} строк",
+                )
+
+            valid = self._validate(batch, company_id, seen_logins, errors)
+            valid = await self._check_references(valid, errors)
+            created += await self._insert(valid)
+
+        errors.sort(key=lambda error: error.row)
+        logger.info(
+            "User import finished: company_id=%s created=%s failed=%s", company_id, created, len(errors)
+        )
+        return UserImportResponse(created=created, failed=len(errors), errors=errors)
+
+    @staticmethod
+    def _validate(
+        batch: list[RawRow], company_id: int, seen_logins: set[str], errors: list[UserImportError]
+    ) -> list[tuple[int, UserCreate]]:
+        valid: list[tuple[int, UserCreate]] = []
+        for row_number, data, parse_error in batch:
+            if parse_error is not None:
+                errors.append(UserImportError(row=row_number, errors=[parse_error]))
+                continue
+
+            login = data.get("login")
+            # PostgreSQL text cannot hold NUL; let it through and the whole batch fails on INSERT.
+            nul_fields = [key for key, value in data.items() if isinstance(value, str) and "\x00" in value]
+            if nul_fields:
+                errors.append(UserImportError(
+                    row=row_number,
+                    login=None if "login" in nul_fields else login,
+                    errors=[f"{key}: недопустимый символ NUL" for key in nul_fields],
+                ))
+                continue
+
+            try:
+                user_in = UserCreate.model_validate({**data, "company_id": company_id})
+            except ValidationError as e:
+                errors.append(UserImportError(row=row_number, login=login, errors=_format_validation_error(e)))
+                continue
+
+            if user_in.login in seen_logins:
+                errors.append(UserImportError(row=row_number, login=login, errors=["Логин повторяется в файле"]))
+                continue
+            seen_logins.add(user_in.login)
+            valid.append((row_number, user_in))
+        return valid
+
+    async def _check_references(
+        self, valid: list[tuple[int, UserCreate]], errors: list[UserImportError]
+    ) -> list[tuple[int, UserCreate]]:
+        if not valid:
+            return valid
+
+        logins = {user_in.login for _, user_in in valid}
+        taken = set((await self.db.execute(select(User.login).where(User.login.in_(logins)))).scalars())
+
+        position_ids = {user_in.position_id for _, user_in in valid if user_in.position_id is not None}
+        known_positions: set[int] = set()
+        if position_ids:
+            known_positions = set(
+                (await self.db.execute(select(Position.id).where(Position.id.in_(position_ids)))).scalars()
+            )
+
+        checked: list[tuple[int, UserCreate]] = []
+        for row_number, user_in in valid:
+            row_errors = []
+            if user_in.login in taken:
+                row_errors.append("Пользователь уже существует.")
+            if user_in.position_id is not None and user_in.position_id not in known_positions:
+                row_errors.append("Должность не найдена")
+            if row_errors:
+                errors.append(UserImportError(row=row_number, login=user_in.login, errors=row_errors))
+            else:
+                checked.append((row_number, user_in))
+        return checked
+
+    async def _insert(self, valid: list[tuple[int, UserCreate]]) -> int:
+        if not valid:
+            return 0
+
+        hashes = await hash_passwords([user_in.password for _, user_in in valid])
+        users = [
+            {**user_in.model_dump(exclude={"password"}), "hashed_password": hashed}
+            for (_, user_in), hashed in zip(valid, hashes)
+        ]
+
+        try:
+            result = await self.db.execute(
+                insert(User).returning(User.id, sort_by_parameter_order=True), users
+            )
+            user_ids = result.scalars().all()
+
+            today = date.today()
+            await self.db.execute(
+                insert(UserStatistic),
+                [
+                    {"user_id": user_id, "period_type": PeriodType.MONTH, "period_date": today, "total_points": 0}
+                    for user_id in user_ids
+                ],
+            )
+        except IntegrityError as e:
+            # Another request created one of these logins between the check and the insert.
+            logger.warning("User import conflicted with a concurrent change: %s", e.orig)
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Данные изменились во время импорта, повторите попытку",
+            )
+        return len(user_ids)
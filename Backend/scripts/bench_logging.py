@@ -0,0 +1,98 @@
+"""
+Measure how much logging stalls the event loop when the log sink is slow
+(e.g. stdout piped into a busy collector). Compares a plain StreamHandler
+with the queue-based pipeline from app.core.logging. Run from the Backend
+directory:
+
+    python -m scripts.bench_logging [--records 2000] [--write-delay-ms 0.2]
+"""
+
+import argparse
+import asyncio
+import io
+import logging
+import queue
+import time
+from logging.handlers import QueueListener
+
+from app.core.logging import BoundedQueueHandler
+
+
+class SlowStream(io.StringIO):
+    """Stream whose every write blocks for a fixed time, like a pipe with a slow reader."""
+
+    def __init__(self, delay_s: float):
+        super().__init__()
+        self.delay_s = delay_s
+
+    def write(self, s: str) -> int:
+        time.sleep(self.delay_s)
+        return len(s)
+
+
+async def _measure(logger: logging.Logger, records: int) -> dict[str, float]:
+    tick_s = 0.001
+    lags: list[float] = []
+    done = asyncio.Event()
+
+    async def ticker() -> None:
+        while not done.is_set():
+            expected = time.perf_counter() + tick_s
+            await asyncio.sleep(tick_s)
+            lags.append(max(time.perf_counter() - expected, 0.0))
+
+    async def producer() -> None:
+        for i in range(records):
+            logger.info("GET /api/v1/task/%d -> 200 (3.2ms, db: 2 queries 1.1ms)", i)
+            if i % 10 == 0:
+                await asyncio.sleep(0)
+        done.set()
+
+    start = time.perf_counter()
+    await asyncio.gather(ticker(), producer())
+    elapsed = time.perf_counter() - start
+    lags.sort()
+    return {
+        "elapsed_ms": elapsed * 1000,
+        "p50_lag_ms": lags[len(lags) // 2] * 1000 if lags else 0.0,
+        "p99_lag_ms": lags[int(len(lags) * 0.99)] * 1000 if lags else 0.0,
+        "max_lag_ms": lags[-1] * 1000 if lags else 0.0,
+    }
+
+
+def _logger(name: str, handler: logging.Handler) -> logging.Logger:
+    logger = logging.getLogger(name)
+    logger.handlers = [handler]
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    return logger
+
+
+async def main(records: int, write_delay_ms: float) -> None:
+    delay_s = write_delay_ms / 1000
+
+    sync_logger = _logger("bench.sync", logging.StreamHandler(SlowStream(delay_s)))
+    sync_result = await _measure(sync_logger, records)
+
+    log_queue: queue.Queue = queue.Queue(maxsize=records * 2)
+    listener = QueueListener(log_queue, logging.StreamHandler(SlowStream(delay_s)))
+    listener.start()
+    queued_logger = _logger("bench.queued", BoundedQueueHandler(log_queue))
+    queued_result = await _measure(queued_logger, records)
+    listener.stop()
+
+    print(f"{records} records, sink write delay {write_delay_ms}ms")
+    print(f"{'pipeline':<14}{'elapsed ms':>12}{'p50 lag ms':>12}{'p99 lag ms':>12}{'max lag ms':>12}")
+    for name, result in (("StreamHandler", sync_result), ("QueueHandler", queued_result)):
+        print(
+            f"{name:<14}{result['elapsed_ms']:>12.1f}{result['p50_lag_ms']:>12.2f}"
+            f"{result['p99_lag_ms']:>12.2f}{result['max_lag_ms']:>12.2f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--records", type=int, default=2000)
+    parser.add_argument("--write-delay-ms", type=float, default=0.2)
+    args = parser.parse_args()
+    asyncio.run(main(args.records, args.write_delay_ms))
@@ -0,0 +1,72 @@
+"""
+Login throughput with concurrent API traffic: Argon2 verification inline on the
+event loop versus the bounded thread pool in app.core.security. "API" requests
+are simulated as 1ms awaits; their latency shows how much hashing stalls the
+loop. Run from the Backend directory:
+
+    python -m scripts.bench_password_hashing [--seconds 5] [--logins 8] [--api 50]
+"""
+
+import argparse
+import asyncio
+import time
+
+from app.core.security import PasswordHasher, pwd_context
+
+
+async def _run(mode: str, seconds: float, login_workers: int, api_workers: int, hasher: PasswordHasher) -> dict:
+    stored_hash = pwd_context.hash("CorrectHorse1!")
+    deadline = time.perf_counter() + seconds
+    logins = 0
+    api_latencies: list[float] = []
+
+    async def login_worker() -> None:
+        nonlocal logins
+        while time.perf_counter() < deadline:
+            if mode == "inline":
+                pwd_context.verify("CorrectHorse1!", stored_hash)
+                await asyncio.sleep(0)
+            else:
+                await hasher.verify("CorrectHorse1!", stored_hash)
+            logins += 1
+
+    async def api_worker() -> None:
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            await asyncio.sleep(0.001)
+            api_latencies.append(time.perf_counter() - start)
+
+    await asyncio.gather(
+        *(login_worker() for _ in range(login_workers)),
+        *(api_worker() for _ in range(api_workers)),
+    )
+    api_latencies.sort()
+    return {
+        "logins_per_s": logins / seconds,
+        "api_per_s": len(api_latencies) / seconds,
+        "api_p50_ms": api_latencies[len(api_latencies) // 2] * 1000,
+        "api_p99_ms": api_latencies[int(len(api_latencies) * 0.99)] * 1000,
+    }
+
+
+async def main(seconds: float, login_workers: int, api_workers: int, hash_workers: int) -> None:
+    hasher = PasswordHasher(workers=hash_workers, max_pending=login_workers)
+    print(f"{seconds}s, {login_workers} concurrent logins, {api_workers} concurrent API requests")
+    print(f"{'mode':<10}{'logins/s':>10}{'api req/s':>12}{'api p50 ms':>12}{'api p99 ms':>12}")
+    for mode in ("inline", "offloaded"):
+        result = await _run(mode, seconds, login_workers, api_workers, hasher)
+        print(
+            f"{mode:<10}{result['logins_per_s']:>10.1f}{result['api_per_s']:>12.0f}"
+            f"{result['api_p50_ms']:>12.2f}{result['api_p99_ms']:>12.2f}"
+        )
+    hasher.shutdown()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--logins", type=int, default=8)
+    parser.add_argument("--api", type=int, default=50)
+    parser.add_argument("--hash-workers", type=int, default=4)
+    args = parser.parse_args()
+    asyncio.run(main(args.seconds, args.logins, args.api, args.hash_workers))
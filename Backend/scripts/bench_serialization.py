@@ -0,0 +1,103 @@
+"""
+Compare the default response path (pydantic validation + dump + stdlib json) with
+the ORM fast path (dump_orm_list + orjson) for list endpoints. Run from the Backend
+directory:
+
+    python -m scripts.bench_serialization [--rows 1000 10000] [--repeat 5]
+"""
+
+import argparse
+import json
+import time
+from datetime import date, datetime, timedelta
+
+import orjson
+from pydantic import TypeAdapter
+
+import app.main  # noqa: F401  registers all mappers
+from app.core.serialization import dump_orm_list
+from app.modules.base_module.enums import City, Priority, Role, TaskStep, TaskType
+from app.modules.task.model.task import Task
+from app.modules.task.schemas.task import TaskResponse
+from app.modules.users.models.position import Position
+from app.modules.users.models.user import User
+from app.modules.users.schemas.user import UserResponse
+
+
+def _tasks(n: int) -> list[Task]:
+    today = date.today()
+    return [
+        Task(
+            id=i,
+            company_id=1,
+            name=f"Задача {i}",
+            description="Описание задачи " * 5,
+            deadline=today + timedelta(days=i % 30),
+            is_active=True,
+            task_type=TaskType.SOLO,
+            payment=1000 + i,
+            duration=2,
+            city=list(City)[i % len(City)],
+            task_step=TaskStep.AVAILABLE,
+            priority=Priority.MEDIUM,
+        )
+        for i in range(n)
+    ]
+
+
+def _users(n: int) -> list[User]:
+    now = datetime.now()
+    position = Position(id=1, name="Инженер", head_of_group=False)
+    return [
+        User(
+            id=i,
+            login=f"user{i}",
+            first_name="Иван",
+            last_name="Иванов",
+            date_of_birth=date(1990, 1, 1),
+            role=Role.USER,
+            salary=100000,
+            position_id=1,
+            position=position,
+            company_id=1,
+            created_at=now,
+            updated_at=now,
+        )
+        for i in range(n)
+    ]
+
+
+def _best_ms(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main(row_counts: list[int], repeat: int) -> None:
+    print(f"{'endpoint':<10}{'rows':>8}{'pydantic ms':>14}{'fast path ms':>14}{'speedup':>10}")
+    for label, schema, factory in (("task", TaskResponse, _tasks), ("user", UserResponse, _users)):
+        adapter = TypeAdapter(list[schema])
+        for n in row_counts:
+            rows = factory(n)
+
+            def default_path():
+                validated = adapter.validate_python(rows, from_attributes=True)
+                return json.dumps(adapter.dump_python(validated, mode="json"), ensure_ascii=False).encode()
+
+            def fast_path():
+                return orjson.dumps(dump_orm_list(rows, schema))
+
+            assert json.loads(default_path()) == json.loads(fast_path())
+            slow, fast = _best_ms(default_path, repeat), _best_ms(fast_path, repeat)
+            print(f"{label:<10}{n:>8}{slow:>14.1f}{fast:>14.1f}{slow / fast:>9.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    main(args.rows, args.repeat)
@@ -0,0 +1,81 @@
+"""
+Measure cold start: import time of app.main and time from process spawn to the
+first successful request. Each sample runs in a fresh interpreter. Run from the
+Backend directory:
+
+    python -m scripts.bench_startup [--runs 5] [--schema-mode check|create_all|skip]
+
+With --schema-mode check or create_all the configured database must be reachable.
+"""
+
+import argparse
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.request
+
+IMPORT_SNIPPET = (
+    "import time; start = time.perf_counter(); import app.main; "
+    "print(time.perf_counter() - start)"
+)
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _import_seconds(env: dict[str, str]) -> float:
+    output = subprocess.run(
+        [sys.executable, "-c", IMPORT_SNIPPET], env=env, capture_output=True, text=True, check=True
+    ).stdout
+    return float(output.strip().splitlines()[-1])
+
+
+def _first_request_seconds(env: dict[str, str], timeout: float = 60.0) -> float:
+    port = _free_port()
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port), "--log-level", "warning"],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        while time.perf_counter() - start < timeout:
+            if process.poll() is not None:
+                raise RuntimeError("uvicorn exited during startup (is the database reachable?)")
+            try:
+                with urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics", timeout=1):
+                    return time.perf_counter() - start
+            except OSError:
+                time.sleep(0.01)
+        raise TimeoutError("server did not answer in time")
+    finally:
+        process.terminate()
+        process.wait()
+
+
+def main(runs: int, schema_mode: str) -> None:
+    env = {**os.environ, "DB_SCHEMA_STARTUP": schema_mode}
+    imports = [_import_seconds(env) for _ in range(runs)]
+    first_requests = [_first_request_seconds(env) for _ in range(runs)]
+
+    print(f"schema mode: {schema_mode}, runs: {runs}")
+    for label, samples in (("import app.main", imports), ("spawn -> first request", first_requests)):
+        print(
+            f"{label:<24} median {statistics.median(samples) * 1000:8.1f}ms"
+            f"  min {min(samples) * 1000:8.1f}ms  max {max(samples) * 1000:8.1f}ms"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--schema-mode", choices=["check", "create_all", "skip"], default="check")
+    args = parser.parse_args()
+    main(args.runs, args.schema_mode)
@@ -0,0 +1,144 @@
+"""
+Concurrent task claiming through TaskService.take_task: N claimers walk the same M available
+tasks in nearly the same order (so they collide on most of them), each attempt in its own
+session and transaction. Afterwards the executors table is checked for tasks claimed twice.
+
+Runs on a temporary SQLite file by default; pass a disposable PostgreSQL database (its task
+tables are created and dropped) to see row-lock contention. Run from the Backend directory:
+
+    python -m scripts.bench_task_claims [--claimers 20] [--tasks 1000] [--db-url postgresql+asyncpg://...]
+"""
+
+import argparse
+import asyncio
+import random
+import tempfile
+import time
+from dataclasses import dataclass, field
+from datetime import date
+from pathlib import Path
+
+from sqlalchemy import func, insert, select
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm.exc import StaleDataError
+
+import app.main  # noqa: F401  registers all mappers
+from app.core.db import Base
+from app.modules.base_module.enums import City, TaskStep, TaskType
+from app.modules.company.model.company import Company
+from app.modules.task.model.task import Task
+from app.modules.task.services.task import TaskService
+from app.modules.task_operations.model.task_operation import TaskOperation, accessed_users, executors
+from app.modules.users.models.position import Position
+from app.modules.users.models.user import User
+
+TABLES = [
+    Position.__table__, User.__table__, Company.__table__, Task.__table__, TaskOperation.__table__,
+    accessed_users, executors,
+]
+BATCH = 10_000
+# How far apart two claimers' orders may drift; small windows mean heavy collisions.
+JITTER = 5
+RETRIES = 3
+
+
+@dataclass
+class ClaimStats:
+    won: int = 0
+    rejected: int = 0
+    retries: int = 0
+    latencies_ms: list[float] = field(default_factory=list)
+
+
+async def seed(engine, claimers: int, tasks: int) -> None:
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all, tables=TABLES[::-1])
+        await conn.run_sync(Base.metadata.create_all, tables=TABLES)
+        await conn.execute(insert(User), [
+            {
+                "id": i, "login": f"claimer{i}", "hashed_password": "x", "first_name": "Имя",
+                "last_name": "Фамилия", "date_of_birth": date(1990, 1, 1), "salary": 1,
+            }
+            for i in range(1, claimers + 1)
+        ])
+        await conn.execute(insert(Company).values(id=1, owner_id=1, name="Компания", date_established=date(2020, 1, 1)))
+        await conn.execute(insert(Task), [
+            {
+                "id": i, "company_id": 1, "name": f"Задача {i}", "description": "Описание",
+                "deadline": date(2026, 1, 1), "task_type": TaskType.SOLO, "payment": 100,
+                "duration": 1, "city": City.ALMATY, "task_step": TaskStep.AVAILABLE,
+            }
+            for i in range(1, tasks + 1)
+        ])
+        await conn.execute(insert(TaskOperation), [{"id": i, "task_id": i} for i in range(1, tasks + 1)])
+        access = [{"user_id": u, "task_id": t} for t in range(1, tasks + 1) for u in range(1, claimers + 1)]
+        for offset in range(0, len(access), BATCH):
+            await conn.execute(insert(accessed_users), access[offset:offset + BATCH])
+
+
+async def claimer(engine, user_id: int, tasks: int, stats: ClaimStats) -> None:
+    order = sorted(range(1, tasks + 1), key=lambda task_id: task_id + random.randint(0, JITTER))
+    for task_id in order:
+        for _ in range(RETRIES):
+            start = time.perf_counter()
+            try:
+                async with AsyncSession(engine) as db:
+                    task = await TaskService(db).take_task(task_id, user_id)
+                    await db.commit()
+            except (StaleDataError, OperationalError):
+                # SQLite "database is locked" past its busy timeout; PostgreSQL never gets here.
+                stats.retries += 1
+                continue
+            if task is None:
+                stats.rejected += 1
+            else:
+                stats.won += 1
+                stats.latencies_ms.append((time.perf_counter() - start) * 1000)
+            break
+
+
+async def main(claimers: int, tasks: int, db_url: str | None) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        url = db_url or f"sqlite+aiosqlite:///{Path(tmp) / 'claims.db'}"
+        # One pooled connection per claimer on PostgreSQL; SQLite files get a fresh connection per session.
+        options = {"pool_size": claimers} if db_url else {"connect_args": {"timeout": 30}}
+        engine = create_async_engine(url, **options)
+        try:
+            await seed(engine, claimers, tasks)
+
+            stats = ClaimStats()
+            start = time.perf_counter()
+            await asyncio.gather(*(claimer(engine, user_id, tasks, stats) for user_id in range(1, claimers + 1)))
+            elapsed = time.perf_counter() - start
+
+            async with AsyncSession(engine) as db:
+                per_task = select(executors.c.task_id).group_by(executors.c.task_id).having(func.count() > 1)
+                double_claims = await db.scalar(select(func.count()).select_from(per_task.subquery()))
+                in_progress = await db.scalar(
+                    select(func.count()).select_from(Task).where(Task.task_step == TaskStep.IN_PROGRESS)
+                )
+            if db_url:
+                async with engine.begin() as conn:
+                    await conn.run_sync(Base.metadata.drop_all, tables=TABLES[::-1])
+        finally:
+            await engine.dispose()
+
+    latencies = sorted(stats.latencies_ms) or [0.0]
+    print(f"{claimers} claimers, {tasks} tasks, {engine.dialect.name}")
+    print(f"claimed        {stats.won} in {elapsed:.2f}s ({stats.won / elapsed:.0f} claims/s)")
+    print(f"rejected       {stats.rejected} (already taken or lost the race)")
+    print(f"attempts       {(stats.won + stats.rejected) / elapsed:.0f}/s")
+    print(f"retries        {stats.retries}")
+    print(f"take p50/p95   {latencies[len(latencies) // 2]:.1f} / {latencies[int(len(latencies) * 0.95)]:.1f} ms")
+    print(f"in progress    {in_progress}")
+    print(f"double claims  {double_claims}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--claimers", type=int, default=20)
+    parser.add_argument("--tasks", type=int, default=1000)
+    parser.add_argument("--db-url", default=None, help="disposable PostgreSQL database (asyncpg URL)")
+    args = parser.parse_args()
+    asyncio.run(main(args.claimers, args.tasks, args.db_url))
@@ -0,0 +1,98 @@
+"""
+GET /task/ paging over a large task table: OFFSET (TaskService.get_all) versus
+keyset (TaskService.get_page), both scoped to one company, on an in-memory
+SQLite database with the model's company-leading indexes. Reports p50/p95 for
+the first page and a deep page. Run from the Backend directory:
+
+    python -m scripts.bench_task_pagination [--tasks 1000000] [--companies 10] [--page 500]
+"""
+
+import argparse
+import asyncio
+import random
+import time
+from datetime import date, timedelta
+
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+import app.main  # noqa: F401  registers all mappers
+from app.core.pagination import encode_cursor
+from app.modules.base_module.enums import City, TaskStep, TaskType
+from app.modules.task.model.task import Task
+from app.modules.task.schemas.task import TaskFilter, TaskSort
+from app.modules.task.services.task import TaskService
+
+BATCH = 50_000
+
+
+async def _percentiles(fn, repeat: int) -> tuple[float, float]:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        await fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return samples[len(samples) // 2], samples[int(len(samples) * 0.95)]
+
+
+async def main(tasks: int, companies: int, limit: int, page: int, repeat: int) -> None:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    rng = random.Random(0)
+    cities = list(City)
+    steps = list(TaskStep)
+    async with engine.begin() as conn:
+        await conn.run_sync(Task.__table__.create)
+        for offset in range(0, tasks, BATCH):
+            await conn.execute(insert(Task), [
+                {
+                    "company_id": i % companies + 1, "name": f"Задача {i}",
+                    "deadline": date(2024, 1, 1) + timedelta(days=rng.randrange(1000)),
+                    "task_type": TaskType.SOLO, "payment": 1000, "duration": 8,
+                    "city": rng.choice(cities), "task_step": rng.choice(steps),
+                }
+                for i in range(offset, min(offset + BATCH, tasks))
+            ])
+
+    company_id = 1
+    filters = TaskFilter()
+    sort = TaskSort(field="deadline", order="asc")
+    skip = (page - 1) * limit
+
+    async with AsyncSession(engine) as session:
+        service = TaskService(session)
+        boundary = (await session.execute(
+            select(Task.deadline, Task.id)
+            .where(Task.company_id == company_id)
+            .order_by(Task.deadline, Task.id)
+            .offset(skip - 1)
+            .limit(1)
+        )).one()
+        deep_cursor = encode_cursor("deadline", "asc", boundary.deadline, boundary.id)
+
+        runs = {
+            ("offset", 1): lambda: service.get_all(filters, sort, skip=0, limit=limit, company_id=company_id),
+            ("offset", page): lambda: service.get_all(filters, sort, skip=skip, limit=limit, company_id=company_id),
+            ("keyset", 1): lambda: service.get_page(filters, sort, company_id=company_id, limit=limit),
+            ("keyset", page): lambda: service.get_page(
+                filters, sort, company_id=company_id, cursor=deep_cursor, limit=limit
+            ),
+        }
+        results = {key: await _percentiles(fn, repeat) for key, fn in runs.items()}
+    await engine.dispose()
+
+    print(f"{tasks} tasks in {companies} companies, {limit} per page, sorted by deadline")
+    print(f"{'mode':<8}{'page':>6}{'p50 ms':>10}{'p95 ms':>10}")
+    for (mode, page_number), (p50, p95) in results.items():
+        print(f"{mode:<8}{page_number:>6}{p50:>10.2f}{p95:>10.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tasks", type=int, default=1_000_000)
+    parser.add_argument("--companies", type=int, default=10)
+    parser.add_argument("--limit", type=int, default=100)
+    parser.add_argument("--page", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+    asyncio.run(main(args.tasks, args.companies, args.limit, args.page, args.repeat))
@@ -0,0 +1,82 @@
+"""
+Bulk employee import against an in-memory SQLite database: the old way (one
+UserService.create per employee, hashing one password at a time) versus
+UserImportService with batched validation, process-pool hashing and
+multi-row INSERTs. Run from the Backend directory:
+
+    python -m scripts.bench_user_import [--rows 500]
+"""
+
+import argparse
+import asyncio
+import io
+import json
+import time
+
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+
+import app.main  # noqa: F401  registers all mappers
+from app.core.config import settings
+from app.modules.statistics.models.user_statistic import UserStatistic
+from app.modules.users.models.position import Position
+from app.modules.users.models.user import User
+from app.modules.users.schemas.user import UserCreate
+from app.modules.users.services.user import UserService
+from app.modules.users.services.user_import import UserImportService, hash_passwords, shutdown_hash_pool
+
+PASSWORD = "Secret@123"
+
+
+def _rows(count: int, prefix: str) -> list[dict]:
+    return [
+        {
+            "login": f"{prefix}{i}", "first_name": "Иван", "last_name": "Иванов",
+            "date_of_birth": "1990-01-01", "salary": 1000, "password": PASSWORD, "company_id": 1,
+        }
+        for i in range(count)
+    ]
+
+
+async def _engine() -> AsyncEngine:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        for model in (Position, User, UserStatistic):
+            await conn.run_sync(model.__table__.create)
+    return engine
+
+
+async def main(rows: int) -> None:
+    engine = await _engine()
+    async with AsyncSession(engine) as session:
+        start = time.perf_counter()
+        service = UserService(session)
+        for row in _rows(rows, "serial"):
+            await service.create(UserCreate(**row))
+        await session.commit()
+        serial = time.perf_counter() - start
+    await engine.dispose()
+
+    # Start the worker processes outside the timed section; a server pays this once.
+    await hash_passwords(["warmup"] * settings.USER_IMPORT_HASH_PROCESSES)
+
+    engine = await _engine()
+    body = "".join(json.dumps(row) + "\n" for row in _rows(rows, "bulk")).encode()
+    async with AsyncSession(engine) as session:
+        start = time.perf_counter()
+        result = await UserImportService(session).import_users(io.BytesIO(body), "ndjson", company_id=1)
+        await session.commit()
+        bulk = time.perf_counter() - start
+    await engine.dispose()
+    shutdown_hash_pool()
+
+    print(f"{rows} employees")
+    print(f"{'mode':<10}{'seconds':>10}{'rows/s':>10}")
+    print(f"{'serial':<10}{serial:>10.2f}{rows / serial:>10.1f}")
+    print(f"{'import':<10}{bulk:>10.2f}{result.created / bulk:>10.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=500)
+    args = parser.parse_args()
+    asyncio.run(main(args.rows))
@@ -0,0 +1,82 @@
+"""
+Offset versus keyset paging of GET /user/ over many users, on an in-memory
+SQLite database with the model's indexes. Times page 1 and a deep page for
+both UserService.get_all (OFFSET) and UserService.get_page (cursor). Run from
+the Backend directory:
+
+    python -m scripts.bench_user_pagination [--users 100000] [--limit 100] [--page 500]
+"""
+
+import argparse
+import asyncio
+import time
+from datetime import date
+
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+import app.main  # noqa: F401  registers all mappers
+from app.core.pagination import encode_cursor
+from app.modules.users.models.position import Position
+from app.modules.users.models.user import User
+from app.modules.users.schemas.user import UserFilter, UserSort
+from app.modules.users.services.user import UserService
+
+
+async def _timed(fn, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        await fn()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+async def main(users: int, limit: int, page: int, repeat: int) -> None:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Position.__table__.create)
+        await conn.run_sync(User.__table__.create)
+        await conn.execute(insert(User), [
+            {
+                "login": f"user{i}", "hashed_password": "x", "first_name": f"Имя{i % 997}",
+                "last_name": "Фамилия", "date_of_birth": date(1990, 1, 1), "salary": 1000 + i % 5000,
+                "company_id": 1,
+            }
+            for i in range(users)
+        ])
+
+    filters = UserFilter()
+    sort = UserSort(field="salary", order="asc")
+    skip = (page - 1) * limit
+
+    async with AsyncSession(engine) as session:
+        service = UserService(session)
+        # The cursor a client would hold after walking to `page`.
+        boundary = (await session.execute(
+            select(User.salary, User.id).order_by(User.salary, User.id).offset(skip - 1).limit(1)
+        )).one()
+        deep_cursor = encode_cursor("salary", "asc", boundary.salary, boundary.id)
+
+        results = {
+            ("offset", 1): await _timed(lambda: service.get_all(filters, sort, skip=0, limit=limit), repeat),
+            ("offset", page): await _timed(lambda: service.get_all(filters, sort, skip=skip, limit=limit), repeat),
+            ("keyset", 1): await _timed(lambda: service.get_page(filters, sort, limit=limit), repeat),
+            ("keyset", page): await _timed(
+                lambda: service.get_page(filters, sort, cursor=deep_cursor, limit=limit), repeat
+            ),
+        }
+    await engine.dispose()
+
+    print(f"{users} users, {limit} per page, sorted by salary")
+    print(f"{'mode':<10}{'page 1 ms':>12}{f'page {page} ms':>16}")
+    for mode in ("offset", "keyset"):
+        print(f"{mode:<10}{results[(mode, 1)]:>12.2f}{results[(mode, page)]:>16.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--users", type=int, default=100_000)
+    parser.add_argument("--limit", type=int, default=100)
+    parser.add_argument("--page", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(main(args.users, args.limit, args.page, args.repeat))
@@ -0,0 +1,63 @@
+from datetime import date
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+import app.main  # noqa: F401  registers all mappers
+from app.core.db import db_manager
+from app.modules.users.models.user import User
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "tables(*tables): tables the `engine` fixture creates")
+
+
+# ---------------- База данных ----------------
+@pytest_asyncio.fixture
+async def engine(request, tmp_path):
+    """
+    SQLite file database with only the tables the test asks for, in dependency order:
+
+        @pytest.mark.tables(Position.__table__, User.__table__)
+
+    A file rather than :memory: so that separate sessions get separate connections.
+    """
+    marker = request.node.get_closest_marker("tables")
+    tables = marker.args if marker else ()
+
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'test.db'}")
+    try:
+        async with engine.begin() as conn:
+            for table in tables:
+                await conn.run_sync(table.create)
+        yield engine
+    finally:
+        await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def session(engine):
+    async with AsyncSession(engine) as session:
+        yield session
+
+
+@pytest.fixture
+def session_factory(engine, monkeypatch):
+    """Point db_manager.AsyncSessionLocal (used by background work and caches) at the test engine."""
+    factory = async_sessionmaker(engine, expire_on_commit=False)
+    monkeypatch.setattr(db_manager, "AsyncSessionLocal", factory)
+    return factory
+
+
+# ---------------- Пользователи ----------------
+@pytest.fixture
+def make_user():
+    def make(id: int, **fields) -> User:
+        defaults = dict(
+            login=f"user{id}", hashed_password="x", first_name="А", last_name="Б",
+            date_of_birth=date(1990, 1, 1), salary=1,
+        )
+        return User(id=id, **{**defaults, **fields})
+
+    return make
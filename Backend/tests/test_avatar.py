@@ -0,0 +1,152 @@
+import io
+
+import pytest
+from fastapi import HTTPException, UploadFile
+
+import app.main  # noqa: F401  registers all mappers
+from app.core import images
+from app.core.storage import CloudinaryStorage, LocalStorage
+from app.modules.auth.schemas.auth import Principal
+from app.modules.base_module.enums import JobStatus, Role
+from app.modules.users.api import user as user_api
+from app.modules.users.models.position import Position
+from app.modules.users.models.user import User
+from app.modules.users.services import avatar
+from app.modules.users.services.avatar import AvatarPipeline, format_size, read_upload
+
+
+def _image_bytes() -> bytes:
+    if images.Image is None:
+        return b"\x89PNG not really"
+    out = io.BytesIO()
+    images.Image.new("RGB", (640, 480), "red").save(out, format="PNG")
+    return out.getvalue()
+
+
+# ---------------- Хранилище ----------------
+@pytest.mark.asyncio
+async def test_local_storage_replaces_and_deletes(tmp_path):
+    storage = LocalStorage(str(tmp_path), "/media")
+
+    first = await storage.put("avatars/user_1", b"png", "image/png")
+    second = await storage.put("avatars/user_1", b"webp", "image/webp")
+
+    assert first.startswith("/media/avatars/user_1.png?v=")
+    assert second.startswith("/media/avatars/user_1.webp?v=")
+    assert [p.name for p in (tmp_path / "avatars").iterdir()] == ["user_1.webp"]
+
+    await storage.delete("avatars/user_1")
+    assert list((tmp_path / "avatars").iterdir()) == []
+    storage.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_read_upload_stops_at_limit():
+    upload = UploadFile(io.BytesIO(b"x" * 100))
+
+    assert await read_upload(upload, 100) == b"x" * 100
+    await upload.seek(0)
+    with pytest.raises(HTTPException) as exc:
+        await read_upload(upload, 99)
+    assert exc.value.status_code == 413
+    assert exc.value.detail.endswith("99 Б")
+
+
+def test_format_size():
+    assert format_size(5 * 1024 * 1024) == "5 МБ"
+    assert format_size(1536) == "1.5 КБ"
+    assert format_size(99) == "99 Б"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("crop_size", [None, 300])
+async def test_cloudinary_crops_only_when_asked(monkeypatch, crop_size):
+    uploads = []
+
+    class Uploader:
+        @staticmethod
+        def upload(data, **options):
+            uploads.append(options)
+            return {"secure_url": "https://example.com/a.webp"}
+
+    monkeypatch.setattr(CloudinaryStorage, "_uploader", staticmethod(lambda: Uploader))
+    storage = CloudinaryStorage(1)
+
+    assert await storage.put("avatars/user_1", b"png", "image/png", crop_size) == "https://example.com/a.webp"
+    storage.shutdown()
+
+    crops = [step for step in uploads[0]["transformation"] if "crop" in step]
+    if crop_size is None:
+        assert crops == []
+    else:
+        assert crops == [{"width": 300, "height": 300, "crop": "fill", "gravity": "face"}]
+
+
+# ---------------- Фоновая обработка ----------------
+@pytest.mark.asyncio
+@pytest.mark.tables(Position.__table__, User.__table__)
+async def test_pipeline_stores_file_and_saves_url(tmp_path, monkeypatch, session_factory, make_user):
+    storage = LocalStorage(str(tmp_path), "/media")
+    monkeypatch.setattr(avatar, "get_storage", lambda: storage)
+
+    pipeline = AvatarPipeline(workers=1, queue_size=1, images=images.ImageProcessor(1))
+    try:
+        async with session_factory() as session:
+            session.add(make_user(1))
+            await session.commit()
+
+        job = pipeline.submit(1, _image_bytes(), "image/png", submitted_by=1, company_id=None)
+        with pytest.raises(HTTPException) as exc:
+            pipeline.submit(1, b"", "image/png", submitted_by=1, company_id=None)
+        assert exc.value.status_code == 503
+
+        await pipeline.process(await pipeline._queue.get())
+
+        assert pipeline.get(job.id).status == JobStatus.DONE
+        assert job.data is None
+        async with session_factory() as session:
+            assert (await session.get(User, 1)).avatar_url == job.avatar_url
+        assert len(list((tmp_path / "avatars").iterdir())) == 1
+    finally:
+        await pipeline.stop()
+
+
+# ---------------- Права ----------------
+def test_avatar_can_be_managed_by_the_user_and_their_company_managers(make_user):
+    target = make_user(1, role=Role.USER, company_id=10)
+
+    assert user_api._can_manage_user(Principal(id=1, role=Role.USER, company_id=10), target)
+    assert user_api._can_manage_user(Principal(id=2, role=Role.SUPERVISOR, company_id=10), target)
+    assert user_api._can_manage_user(Principal(id=3, role=Role.ADMIN, company_id=10), target)
+    assert user_api._can_manage_user(Principal(id=4, role=Role.ADMIN), target)
+    assert not user_api._can_manage_user(Principal(id=5, role=Role.SUPERVISOR, company_id=11), target)
+    assert not user_api._can_manage_user(Principal(id=6, role=Role.USER, company_id=10), target)
+    assert not user_api._can_manage_user(
+        Principal(id=2, role=Role.SUPERVISOR, company_id=10), make_user(7, role=Role.ADMIN, company_id=10)
+    )
+
+
+# ---------------- Статус задачи ----------------
+@pytest.mark.asyncio
+async def test_avatar_job_is_visible_to_its_user_submitter_and_company_managers(monkeypatch):
+    pipeline = AvatarPipeline(workers=1, queue_size=1, images=images.ImageProcessor(1))
+    monkeypatch.setattr(user_api, "avatar_pipeline", pipeline)
+    job = pipeline.submit(1, b"png", "image/png", submitted_by=2, company_id=10)
+
+    for principal in (
+        Principal(id=1, role=Role.USER, company_id=10),
+        Principal(id=2, role=Role.SUPERVISOR, company_id=10),
+        Principal(id=3, role=Role.SUPERVISOR, company_id=10),
+        Principal(id=4, role=Role.ADMIN),
+    ):
+        assert (await user_api.get_avatar_job(job.id, principal)).job_id == job.id
+    for principal in (
+        Principal(id=5, role=Role.USER, company_id=10),
+        Principal(id=6, role=Role.SUPERVISOR, company_id=11),
+    ):
+        with pytest.raises(HTTPException) as exc:
+            await user_api.get_avatar_job(job.id, principal)
+        assert exc.value.status_code == 403
+    with pytest.raises(HTTPException) as exc:
+        await user_api.get_avatar_job("missing", Principal(id=1, role=Role.USER))
+    assert exc.value.status_code == 404
@@ -0,0 +1,62 @@
+import gzip
+
+import pytest
+
+from app.core.compression import CompressionMiddleware, choose_encoding
+
+
+def _json_app(body: bytes):
+    async def app(scope, receive, send):
+        await send({
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode())],
+        })
+        await send({"type": "http.response.body", "body": body})
+
+    return app
+
+
+async def _call(app, accept_encoding: str) -> list[dict]:
+    scope = {"type": "http", "method": "GET", "path": "/", "headers": [(b"accept-encoding", accept_encoding.encode())]}
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b""}
+
+    async def send(message):
+        messages.append(message)
+
+    await app(scope, receive, send)
+    return messages
+
+
+# ---------------- Выбор кодировки ----------------
+def test_choose_encoding_respects_quality():
+    assert choose_encoding("gzip") == "gzip"
+    assert choose_encoding("gzip;q=0, identity") is None
+    assert choose_encoding("") is None
+
+
+# ---------------- Сжатие ответа ----------------
+@pytest.mark.asyncio
+async def test_large_body_is_gzipped_in_worker_thread():
+    body = b'[{"id": 1, "name": "task"}]' * 2000
+    app = CompressionMiddleware(_json_app(body), minimum_size=100, offload_size=1024)
+
+    start, payload = await _call(app, "gzip")
+
+    headers = dict(start["headers"])
+    assert headers[b"content-encoding"] == b"gzip"
+    assert int(headers[b"content-length"]) == len(payload["body"])
+    assert gzip.decompress(payload["body"]) == body
+
+
+@pytest.mark.asyncio
+async def test_small_body_is_left_alone():
+    app = CompressionMiddleware(_json_app(b"[]"), minimum_size=100)
+
+    start, payload = await _call(app, "gzip")
+
+    assert b"content-encoding" not in dict(start["headers"])
+    assert payload["body"] == b"[]"
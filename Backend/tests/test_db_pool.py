@@ -0,0 +1,31 @@
+from app.core.db_pool import PoolStats, WAIT_BUCKETS_MS
+
+
+# ---------------- Гистограмма ожидания пула ----------------
+def test_observe_checkout_fills_cumulative_buckets():
+    stats = PoolStats("primary", slow_checkout_ms=100)
+
+    stats.observe_checkout(0.5)
+    stats.observe_checkout(7)
+    stats.observe_checkout(150)
+
+    buckets = dict(stats.cumulative_buckets())
+    assert len(buckets) == len(WAIT_BUCKETS_MS) + 1
+    assert buckets["1"] == 1
+    assert buckets["10"] == 2
+    assert buckets["100"] == 2
+    assert buckets["250"] == 3
+    assert buckets["+Inf"] == 3
+    assert stats.checkouts == 3
+    assert stats.slow_checkouts == 1
+    assert stats.wait_ms_max == 150
+
+
+def test_observe_timeout_counts_separately():
+    stats = PoolStats("primary", slow_checkout_ms=100)
+
+    stats.observe_timeout()
+
+    assert stats.timeouts == 1
+    assert stats.checkouts == 0
+    assert dict(stats.cumulative_buckets())["+Inf"] == 0
@@ -0,0 +1,69 @@
+from datetime import date
+
+import pytest
+from sqlalchemy import insert
+from starlette.requests import Request
+
+from app.core.http_cache import REVALIDATE, not_modified, weak_etag
+from app.modules.base_module.enums import City, TaskType
+from app.modules.task.model.task import Task
+from app.modules.task.services.task import TaskService
+from app.modules.task_operations.model.task_operation import TaskOperation, accessed_users, executors
+
+
+def _request(if_none_match: str | None = None) -> Request:
+    headers = [(b"if-none-match", if_none_match.encode())] if if_none_match else []
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": headers})
+
+
+# ---------------- Условные GET-запросы ----------------
+def test_weak_etag_changes_with_version():
+    assert weak_etag(3, "2026-01-01") == weak_etag(3, "2026-01-01")
+    assert weak_etag(3, "2026-01-01") != weak_etag(4, "2026-01-01")
+    assert weak_etag(1).startswith('W/"')
+
+
+def test_not_modified_when_etag_matches():
+    etag = weak_etag(10, "2026-01-01")
+
+    response = not_modified(_request(f'"other", {etag}'), etag, REVALIDATE)
+
+    assert response is not None
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
+    assert response.headers["cache-control"] == REVALIDATE
+
+
+def test_full_response_when_etag_differs_or_missing():
+    etag = weak_etag(10)
+
+    assert not_modified(_request(weak_etag(11)), etag, REVALIDATE) is None
+    assert not_modified(_request(), etag, REVALIDATE) is None
+
+
+# ---------------- Версия списка заданий ----------------
+@pytest.mark.asyncio
+@pytest.mark.tables(Task.__table__, TaskOperation.__table__, accessed_users, executors)
+async def test_task_list_version_follows_the_company_tasks_only(session):
+    def task(task_id: int, company_id: int) -> Task:
+        return Task(
+            id=task_id, company_id=company_id, name=f"Задача {task_id}", deadline=date(2026, 1, 1),
+            task_type=TaskType.SOLO, payment=100, duration=1, city=City.ALMATY,
+        )
+
+    session.add_all([task(1, 1), TaskOperation(id=1, task_id=1)])
+    await session.commit()
+    service = TaskService(session)
+    initial = await service.get_list_version(1)
+
+    # The list does not serialize participants, so they do not change its version.
+    await session.execute(insert(executors).values(user_id=2, task_id=1))
+    assert await service.get_list_version(1) == initial
+
+    session.add(task(2, 2))
+    await session.flush()
+    assert await service.get_list_version(1) == initial
+
+    session.add(task(3, 1))
+    await session.flush()
+    assert await service.get_list_version(1) != initial
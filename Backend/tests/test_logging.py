@@ -0,0 +1,37 @@
+import logging
+import queue
+
+from app.core.logging import BoundedQueueHandler, SamplingFilter
+
+
+def _record(name: str = "app", level: int = logging.INFO, msg: str = "m") -> logging.LogRecord:
+    return logging.LogRecord(name, level, __file__, 1, msg, None, None)
+
+
+# ---------------- Переполнение очереди логов ----------------
+def test_drop_new_keeps_queued_records():
+    log_queue: queue.Queue = queue.Queue(maxsize=2)
+    handler = BoundedQueueHandler(log_queue, overflow="drop_new")
+    for msg in ("a", "b", "c"):
+        handler.emit(_record(msg=msg))
+
+    assert [log_queue.get_nowait().getMessage() for _ in range(2)] == ["a", "b"]
+
+
+def test_drop_oldest_keeps_latest_records():
+    log_queue: queue.Queue = queue.Queue(maxsize=2)
+    handler = BoundedQueueHandler(log_queue, overflow="drop_oldest")
+    for msg in ("a", "b", "c"):
+        handler.emit(_record(msg=msg))
+
+    assert [log_queue.get_nowait().getMessage() for _ in range(2)] == ["b", "c"]
+
+
+# ---------------- Сэмплирование ----------------
+def test_sampling_applies_to_child_loggers_but_not_warnings():
+    sampling = SamplingFilter({"app.requests": 0.0})
+
+    assert not sampling.filter(_record("app.requests"))
+    assert not sampling.filter(_record("app.requests.slow"))
+    assert sampling.filter(_record("app.requests", level=logging.WARNING))
+    assert sampling.filter(_record("app"))
@@ -0,0 +1,121 @@
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+from starlette.requests import Request
+
+from app.core.client_ip import client_ip
+from app.core.rate_limit import TokenBucketLimiter
+from app.modules.auth.service.login_guard import LoginGuard
+
+
+# ---------------- Token bucket ----------------
+def test_bucket_allows_burst_then_throttles():
+    limiter = TokenBucketLimiter(rate_per_second=1.0, burst=2)
+
+    assert limiter.acquire("a") == 0
+    assert limiter.acquire("a") == 0
+    assert 0 < limiter.acquire("a") <= 1.0
+    assert limiter.acquire("b") == 0
+
+
+def test_bucket_forgets_least_recent_keys():
+    limiter = TokenBucketLimiter(rate_per_second=0.001, burst=1, max_keys=1)
+    limiter.acquire("a")
+    limiter.acquire("b")
+
+    assert limiter.acquire("a") == 0
+
+
+# ---------------- Адрес клиента ----------------
+PROXIES = ["172.28.0.10", "10.1.0.0/16"]
+
+
+def _request(peer: str, **headers: str) -> Request:
+    raw = [(name.replace("_", "-").encode(), value.encode()) for name, value in headers.items()]
+    return Request({"type": "http", "method": "POST", "path": "/", "headers": raw, "client": (peer, 1234)})
+
+
+def test_forwarded_address_is_used_behind_a_trusted_proxy():
+    assert client_ip(_request("172.28.0.10", x_forwarded_for="203.0.113.5"), PROXIES) == "203.0.113.5"
+    assert client_ip(_request("172.28.0.10", x_real_ip="203.0.113.6"), PROXIES) == "203.0.113.6"
+    # The client may prepend anything; only the hop the trusted proxies appended counts.
+    request = _request("172.28.0.10", x_forwarded_for="1.2.3.4, 203.0.113.5, 10.1.2.3")
+    assert client_ip(request, PROXIES) == "203.0.113.5"
+
+
+def test_forwarded_headers_from_untrusted_peers_are_ignored():
+    assert client_ip(_request("198.51.100.7", x_forwarded_for="203.0.113.5"), PROXIES) == "198.51.100.7"
+    assert client_ip(_request("172.28.0.10", x_forwarded_for="203.0.113.5"), []) == "172.28.0.10"
+
+
+def test_clients_behind_the_proxy_get_their_own_ip_bucket():
+    guard = LoginGuard()
+    guard.per_ip = TokenBucketLimiter(rate_per_second=0.001, burst=1)
+
+    guard.admit("anna", client_ip(_request("172.28.0.10", x_forwarded_for="203.0.113.5"), PROXIES))
+    guard.admit("boris", client_ip(_request("172.28.0.10", x_forwarded_for="203.0.113.6"), PROXIES))
+    with pytest.raises(HTTPException) as exc:
+        guard.admit("vera", client_ip(_request("172.28.0.10", x_forwarded_for="203.0.113.5"), PROXIES))
+    assert exc.value.status_code == 429
+
+
+# ---------------- Защита входа ----------------
+def test_login_is_throttled_per_login_case_insensitive():
+    guard = LoginGuard()
+    guard.per_login = TokenBucketLimiter(rate_per_second=0.001, burst=1)
+
+    guard.admit("Admin", "10.0.0.1")
+    with pytest.raises(HTTPException) as exc:
+        guard.admit("admin", "10.0.0.2")
+
+    assert exc.value.status_code == 429
+    assert int(exc.value.headers["Retry-After"]) >= 1
+
+
+@pytest.mark.asyncio
+async def test_logins_over_the_cap_wait_for_a_slot():
+    guard = LoginGuard()
+    guard._verifications = asyncio.Semaphore(2)
+    running, peak = 0, 0
+
+    async def login():
+        nonlocal running, peak
+        async with guard.verification():
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+    await asyncio.gather(*(login() for _ in range(6)))
+
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_verification_is_rejected_after_waiting_too_long():
+    guard = LoginGuard()
+    guard._verifications = asyncio.Semaphore(1)
+    guard._wait_seconds = 0.01
+
+    async with guard.verification():
+        with pytest.raises(HTTPException) as exc:
+            async with guard.verification():
+                pass
+
+    assert exc.value.status_code == 503
+    assert not guard._verifications.locked()
+
+
+@pytest.mark.asyncio
+async def test_unknown_logins_queue_for_the_same_slots():
+    guard = LoginGuard()
+    guard._verifications = asyncio.Semaphore(1)
+    guard._wait_seconds = 0.01
+
+    async with guard.verification():
+        with pytest.raises(HTTPException) as exc:
+            await guard.unknown_login_delay()
+
+    assert exc.value.status_code == 503
+    assert not guard._verifications.locked()
@@ -0,0 +1,65 @@
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.core.db import on_commit
+from app.core.metrics import Registry
+
+
+# ---------------- Формат экспозиции метрик ----------------
+def test_counter_and_histogram_render():
+    registry = Registry()
+    requests = registry.counter("requests_total", "Requests.", ("route",))
+    latency = registry.histogram("latency_seconds", "Latency.", ("route",), buckets=(0.1, 1.0))
+
+    requests.inc(route="/task/{task_id}")
+    requests.inc(2, route="/task/{task_id}")
+    latency.observe(0.05, route="/task/")
+    latency.observe(0.5, route="/task/")
+
+    text = registry.render()
+    assert "# TYPE requests_total counter" in text
+    assert 'requests_total{route="/task/{task_id}"} 3' in text
+    assert 'latency_seconds_bucket{route="/task/",le="0.1"} 1' in text
+    assert 'latency_seconds_bucket{route="/task/",le="1.0"} 2' in text
+    assert 'latency_seconds_bucket{route="/task/",le="+Inf"} 2' in text
+    assert 'latency_seconds_count{route="/task/"} 2' in text
+
+
+def test_label_values_are_escaped():
+    registry = Registry()
+    gauge = registry.gauge("in_flight", "In flight.", ("method",))
+    gauge.set(1, method='GE"T')
+    assert 'in_flight{method="GE\\"T"} 1' in registry.render()
+
+
+def test_wrong_labels_rejected():
+    registry = Registry()
+    counter = registry.counter("transitions_total", "Transitions.", ("transition",))
+    with pytest.raises(ValueError):
+        counter.inc(route="/")
+
+
+# ---------------- Счётчики после фиксации транзакции ----------------
+@pytest.mark.asyncio
+async def test_on_commit_counts_committed_transactions_only():
+    counter = Registry().counter("transitions_total", "Transitions.", ("transition",))
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    try:
+        async with AsyncSession(engine) as db:
+            await db.execute(text("SELECT 1"))
+            on_commit(db, lambda: counter.inc(transition="take"))
+            await db.rollback()
+
+            await db.execute(text("SELECT 1"))
+            on_commit(db, lambda: counter.inc(transition="complete"))
+            assert counter.value(transition="complete") == 0
+            await db.commit()
+
+            await db.execute(text("SELECT 1"))
+            await db.commit()
+    finally:
+        await engine.dispose()
+
+    assert counter.value(transition="take") == 0
+    assert counter.value(transition="complete") == 1
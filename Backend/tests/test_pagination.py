@@ -0,0 +1,124 @@
+from datetime import date
+
+import pytest
+import pytest_asyncio
+from fastapi import HTTPException
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+import app.main  # noqa: F401  registers all mappers
+from app.core.pagination import decode_cursor, encode_cursor, keyset_page, next_cursor
+from app.modules.base_module.enums import City, TaskType
+from app.modules.task.model.task import Task
+from app.modules.task.schemas.task import TaskFilter, TaskSort
+from app.modules.task.services.task import TaskService
+from app.modules.users.models.position import Position
+from app.modules.users.models.user import User
+from app.modules.users.schemas.user import UserFilter, UserSort
+from app.modules.users.services.user import UserService
+
+
+pytestmark = pytest.mark.tables(Position.__table__, User.__table__)
+
+
+@pytest_asyncio.fixture
+async def session(session, make_user):
+    for i in range(1, 24):
+        session.add(make_user(
+            i, login=f"user{i:02}", first_name="Имя", last_name="Фамилия",
+            salary=100 * (i % 4 + 1), bonus=None if i % 3 else i, company_id=1 if i % 2 else 2,
+        ))
+    await session.commit()
+    return session
+
+
+# ---------------- Курсор ----------------
+def test_cursor_round_trip_and_sort_mismatch():
+    cursor = encode_cursor("created_at", "desc", None, 7)
+    assert decode_cursor(cursor, "created_at", "desc", User.created_at) == (None, 7)
+
+    with pytest.raises(HTTPException) as exc:
+        decode_cursor(cursor, "salary", "desc", User.salary)
+    assert exc.value.status_code == 400
+
+    with pytest.raises(HTTPException):
+        decode_cursor("мусор", "salary", "asc", User.salary)
+
+
+# ---------------- Постраничный обход ----------------
+@pytest.mark.asyncio
+@pytest.mark.parametrize("order", ["asc", "desc"])
+async def test_pages_cover_every_user_once_with_duplicate_sort_values(session, order):
+    service = UserService(session)
+    sort = UserSort(field="salary", order=order)
+    seen, cursor = [], None
+    while True:
+        page, cursor = await service.get_page(UserFilter(), sort, cursor=cursor, limit=5)
+        seen.extend((user.salary, user.id) for user in page)
+        if cursor is None:
+            break
+
+    expected = sorted(((100 * (i % 4 + 1)), i) for i in range(1, 24))
+    assert seen == (expected if order == "asc" else expected[::-1])
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("order", ["asc", "desc"])
+async def test_nullable_sort_key(session, order):
+    seen, cursor = [], None
+    while True:
+        after = decode_cursor(cursor, "bonus", order, User.bonus) if cursor else None
+        rows = (await session.execute(keyset_page(select(User), User.bonus, User.id, order, after, 4))).scalars().all()
+        page, cursor = next_cursor(rows, "bonus", order, 4)
+        seen.extend(user.id for user in page)
+        if cursor is None:
+            break
+
+    with_bonus = [i for i in range(1, 24) if i % 3 == 0]
+    without_bonus = [i for i in range(1, 24) if i % 3]
+    if order == "asc":
+        assert seen == with_bonus + without_bonus
+    else:
+        assert seen == without_bonus[::-1] + with_bonus[::-1]
+
+
+@pytest.mark.asyncio
+async def test_my_employees_pages(session):
+    service = UserService(session)
+
+    everyone, cursor = await service.get_my_employees(1)
+    assert cursor is None
+    assert [user.id for user in everyone] == [i for i in range(3, 24, 2)]
+
+    first, cursor = await service.get_my_employees(1, limit=6)
+    second, last_cursor = await service.get_my_employees(1, cursor=cursor, limit=6)
+    assert [user.id for user in first + second] == [user.id for user in everyone]
+    assert last_cursor is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.tables(Task.__table__)
+async def test_task_pages_are_company_scoped_and_walk_nullable_city(engine):
+    cities = [City.ALMATY, None, City.ASTANA, City.ALMATY, None]
+    async with AsyncSession(engine) as db:
+        for i in range(1, 21):
+            db.add(Task(
+                id=i, company_id=1 if i % 4 else 2, name=f"Задача {i}", deadline=date(2026, 1, i),
+                task_type=TaskType.SOLO, payment=100, duration=1, city=cities[i % 5],
+            ))
+        await db.commit()
+
+        service = TaskService(db)
+        sort = TaskSort(field="city", order="asc")
+        seen, cursor = [], None
+        while True:
+            page, cursor = await service.get_page(TaskFilter(), sort, company_id=1, cursor=cursor, limit=4)
+            seen.extend(task.id for task in page)
+            if cursor is None:
+                break
+
+    own = [i for i in range(1, 21) if i % 4]
+    expected = sorted(
+        (i for i in own if cities[i % 5]), key=lambda i: (cities[i % 5], i)
+    ) + [i for i in own if cities[i % 5] is None]
+    assert seen == expected
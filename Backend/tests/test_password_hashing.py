@@ -0,0 +1,30 @@
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+
+from app.core.security import PasswordHasher
+
+
+# ---------------- Хеширование паролей вне event loop ----------------
+@pytest.mark.asyncio
+async def test_hash_and_verify_in_pool():
+    hasher = PasswordHasher(workers=1, max_pending=1)
+    hashed = await hasher.hash("Secret123!")
+
+    assert await hasher.verify("Secret123!", hashed)
+    assert await hasher.verify_and_update("wrong", hashed) == (False, None)
+    hasher.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_rejects_when_queue_is_full():
+    hasher = PasswordHasher(workers=1, max_pending=0)
+
+    results = await asyncio.gather(
+        hasher.hash("Secret123!"), hasher.hash("Secret123!"), return_exceptions=True
+    )
+
+    assert isinstance(results[0], str)
+    assert isinstance(results[1], HTTPException) and results[1].status_code == 503
+    hasher.shutdown()
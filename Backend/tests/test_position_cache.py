@@ -0,0 +1,70 @@
+import pytest
+
+import app.main  # noqa: F401  registers all mappers
+from app.core import query_stats
+from app.modules.base_module.enums import Role
+from app.modules.users.models.position import Position
+from app.modules.users.schemas.position import PositionUpdate
+from app.modules.users.services.position import PositionServices
+from app.modules.users.services.position_cache import PositionCache, is_group_head, position_cache
+
+pytestmark = pytest.mark.tables(Position.__table__)
+
+
+# ---------------- Кэш должностей ----------------
+@pytest.mark.asyncio
+async def test_positions_are_loaded_once_and_reloaded_for_unknown_ids(engine, session, session_factory):
+    query_stats.instrument_engine(engine)
+    session.add_all([Position(id=1, name="Бригадир", head_of_group=True), Position(id=2, name="Монтажник")])
+    await session.commit()
+
+    cache = PositionCache(ttl=60)
+    stats, token = query_stats.begin_request()
+    try:
+        assert await cache.is_head_of_group(1)
+        assert not await cache.is_head_of_group(2)
+        assert not await cache.is_head_of_group(None)
+        assert stats.count == 1
+
+        session.add(Position(id=3, name="Мастер", head_of_group=True))
+        await session.commit()
+        assert await cache.is_head_of_group(3)
+        assert stats.count == 3  # INSERT + one reload
+    finally:
+        query_stats.end_request(token)
+
+
+@pytest.mark.asyncio
+async def test_position_update_invalidates_cache(session, session_factory):
+    session.add(Position(id=1, name="Монтажник"))
+    await session.commit()
+
+    try:
+        position_cache.invalidate()
+        assert not await is_group_head(Role.USER, 1)
+        assert await is_group_head(Role.HEAD, None)
+
+        await PositionServices(session).update(1, PositionUpdate(name="Бригадир", head_of_group=True))
+        # Reloads while the change is uncommitted read the committed row only.
+        assert not await is_group_head(Role.USER, 1)
+        await session.commit()
+
+        assert await is_group_head(Role.USER, 1)
+    finally:
+        position_cache.invalidate()
+
+
+@pytest.mark.asyncio
+async def test_rolled_back_position_change_is_not_cached(session, session_factory):
+    session.add(Position(id=1, name="Монтажник"))
+    await session.commit()
+
+    try:
+        await PositionServices(session).update(1, PositionUpdate(name="Бригадир", head_of_group=True))
+        assert not await is_group_head(Role.USER, 1)  # reloaded mid-transaction
+        await session.rollback()
+
+        assert session.info["on_commit"] == []
+        assert not await is_group_head(Role.USER, 1)
+    finally:
+        position_cache.invalidate()
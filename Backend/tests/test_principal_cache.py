@@ -0,0 +1,61 @@
+import time
+
+import pytest
+
+import app.main  # noqa: F401  registers all mappers
+from app.core import query_stats
+from app.core.cache import TTLCache
+from app.modules.auth.service.auth import AuthService
+from app.modules.auth.service.principal_cache import invalidate_principal, principal_cache
+from app.modules.base_module.enums import Role
+from app.modules.users.models.position import Position
+from app.modules.users.models.user import User
+
+
+# ---------------- TTL/LRU кэш ----------------
+def test_ttl_cache_evicts_least_recently_used():
+    cache: TTLCache[int, str] = TTLCache(maxsize=2, ttl=60)
+    cache.set(1, "a")
+    cache.set(2, "b")
+    cache.get(1)
+    cache.set(3, "c")
+
+    assert cache.get(1) == "a"
+    assert cache.get(2) is None
+    assert cache.get(3) == "c"
+
+
+def test_ttl_cache_entries_expire():
+    cache: TTLCache[int, str] = TTLCache(maxsize=10, ttl=0.01)
+    cache.set(1, "a")
+    time.sleep(0.02)
+
+    assert cache.get(1) is None
+
+
+# ---------------- Кэш текущего пользователя ----------------
+@pytest.mark.asyncio
+@pytest.mark.tables(Position.__table__, User.__table__)
+async def test_principal_is_loaded_once_and_invalidated_on_commit(engine, session, make_user):
+    query_stats.instrument_engine(engine)
+    principal_cache.clear()
+
+    session.add(Position(id=1, name="Бригадир", head_of_group=True))
+    session.add(make_user(1, login="head", role=Role.HEAD, position_id=1))
+    await session.commit()
+
+    stats, token = query_stats.begin_request()
+    try:
+        first = await AuthService(session).load_principal(1)
+        second = await AuthService(session).load_principal(1)
+    finally:
+        query_stats.end_request(token)
+
+    assert first == second
+    assert first.role == Role.HEAD and first.head_of_group
+    assert stats.count == 1
+
+    invalidate_principal(session, 1)
+    await AuthService(session).load_principal(1)
+    await session.commit()
+    assert principal_cache.get(1) is None
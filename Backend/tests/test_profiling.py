@@ -0,0 +1,51 @@
+import asyncio
+
+import pytest
+
+from app.core.profiling import RequestProfiler
+
+
+class _Response:
+    status_code = 200
+
+
+class _Request:
+    method = "GET"
+    scope: dict = {}
+
+    class url:
+        path = "/api/v1/task/"
+
+
+def _busy_work() -> int:
+    return sum(i * i for i in range(20000))
+
+
+async def _call_next(_request):
+    _busy_work()
+    await asyncio.sleep(0)
+    return _Response()
+
+
+# ---------------- Профилирование запросов ----------------
+@pytest.mark.asyncio
+async def test_profile_is_recorded_and_retrievable():
+    profiler = RequestProfiler(max_profiles=2)
+
+    response, profile = await profiler.profile(_call_next, _Request())
+
+    assert response.status_code == 200
+    assert profile is not None
+    assert profile["wall_ms"] >= 0
+    assert "_busy_work" in profile["text"]
+    assert profile["call_tree"]
+    assert profiler.get(profile["id"]) is profile
+
+
+@pytest.mark.asyncio
+async def test_only_recent_profiles_are_kept():
+    profiler = RequestProfiler(max_profiles=2)
+    ids = [(await profiler.profile(_call_next, _Request()))[1]["id"] for _ in range(3)]
+
+    assert [p["id"] for p in profiler.recent()] == ids[:0:-1]
+    assert profiler.get(ids[0]) is None
@@ -0,0 +1,64 @@
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core import query_stats
+from app.core.query_stats import normalize_statement
+
+
+# ---------------- Нормализация запросов ----------------
+def test_normalize_statement_groups_same_shape():
+    first = normalize_statement("SELECT * FROM task\n WHERE id = $1 AND name = 'a'")
+    second = normalize_statement("SELECT *  FROM task WHERE id = $7 AND name = 'b''c'")
+    assert first == second == "SELECT * FROM task WHERE id = ? AND name = ?"
+
+
+def test_normalize_statement_collapses_in_lists():
+    assert normalize_statement("SELECT 1 FROM u WHERE id IN ($1, $2, $3)") == (
+        "SELECT ? FROM u WHERE id IN (?)"
+    )
+
+
+# ---------------- Подсчёт запросов на запрос ----------------
+@pytest.mark.asyncio
+async def test_statements_are_counted_per_request():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    query_stats.instrument_engine(engine)
+
+    stats, token = query_stats.begin_request()
+    try:
+        async with engine.connect() as conn:
+            for value in range(3):
+                await conn.execute(text("SELECT :v"), {"v": value})
+    finally:
+        query_stats.end_request(token)
+
+    assert stats.count == 3
+    assert stats.repeated_statements(2) == [("SELECT ?", 3)]
+    assert stats.repeated_statements(3) == []
+    assert stats.server_timing(10.0).startswith('db;dur=')
+
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+    assert stats.count == 3
+
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_failed_statements_do_not_skew_timing():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    query_stats.instrument_engine(engine)
+
+    stats, token = query_stats.begin_request()
+    try:
+        async with engine.connect() as conn:
+            with pytest.raises(Exception):
+                await conn.execute(text("SELECT * FROM missing_table"))
+            await conn.execute(text("SELECT 1"))
+    finally:
+        query_stats.end_request(token)
+        await engine.dispose()
+
+    assert stats.count == 1
+    assert stats.statements == {"SELECT ?": 1}
@@ -0,0 +1,43 @@
+from datetime import datetime, timedelta, UTC
+
+from app.core.bloom import BloomFilter
+from app.modules.auth.schemas.auth import TokenPayload
+from app.modules.auth.service.revocation import RevocationList
+
+
+def _payload(sub: str = "1", jti: str | None = "a" * 32, iat: int | None = None) -> TokenPayload:
+    now = int(datetime.now(UTC).timestamp())
+    return TokenPayload(sub=sub, exp=now + 60, type="access", jti=jti, iat=now if iat is None else iat)
+
+
+# ---------------- Bloom-фильтр ----------------
+def test_bloom_filter_has_no_false_negatives():
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    items = [f"jti-{i}" for i in range(1000)]
+    for item in items:
+        bloom.add(item)
+
+    assert all(item in bloom for item in items)
+    false_positives = sum(f"other-{i}" in bloom for i in range(10000))
+    assert false_positives < 300
+
+
+# ---------------- Список отозванных токенов ----------------
+def test_revoked_jti_is_rejected():
+    revocations = RevocationList(capacity=100, error_rate=0.01)
+    revoked, other = _payload(jti="1" * 32), _payload(jti="2" * 32)
+    revocations.add_jti(revoked.jti)
+
+    assert revocations.is_revoked(revoked)
+    assert not revocations.is_revoked(other)
+
+
+def test_user_cutoff_rejects_older_tokens_only():
+    revocations = RevocationList(capacity=100, error_rate=0.01)
+    now = datetime.now(UTC)
+    revocations.add_user_cutoff(1, now)
+
+    assert revocations.is_revoked(_payload(iat=int(now.timestamp()) - 10))
+    assert revocations.is_revoked(_payload(jti=None).model_copy(update={"iat": None}))
+    assert not revocations.is_revoked(_payload(iat=int((now + timedelta(seconds=2)).timestamp())))
+    assert not revocations.is_revoked(_payload(sub="2", iat=int(now.timestamp()) - 10))
@@ -0,0 +1,103 @@
+import pytest
+from sqlalchemy import create_mock_engine
+from sqlalchemy.dialects import postgresql
+
+import app.main  # noqa: F401  registers all mappers
+from app.modules.search.service.search import (
+    SearchService,
+    escape_like,
+    prefix_tsquery,
+    task_search_query,
+    user_suggestions_query,
+)
+from app.modules.task.model.task import Task
+from app.modules.task.schemas.task import TaskFilter
+from app.modules.task.services.task import TaskService
+from app.modules.users.models.position import Position
+from app.modules.users.models.user import User
+
+
+def _sql(statement) -> str:
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+# ---------------- Построение запросов ----------------
+def test_escape_like_keeps_wildcards_literal():
+    assert escape_like("50%_a\\b") == "50\\%\\_a\\\\b"
+
+
+def test_long_query_uses_trigram_match_and_ranking():
+    sql = _sql(user_suggestions_query("иван", company_id=1, limit=10))
+
+    assert "ILIKE" in sql
+    assert "%%" in sql or " % " in sql
+    assert "greatest(similarity(" in sql
+    assert "company_id" in sql
+
+
+def test_short_query_uses_prefix_path():
+    sql = _sql(user_suggestions_query("ив", company_id=1, limit=10))
+
+    assert "similarity" not in sql
+    assert "lower(" in sql
+
+
+# ---------------- Полнотекстовый поиск заданий ----------------
+def test_prefix_tsquery_keeps_only_words():
+    assert prefix_tsquery("Монтаж  кабеля!") == "монтаж:* & кабеля:*"
+    assert prefix_tsquery("a & !b | c:*") == "a:* & b:* & c:*"
+    assert prefix_tsquery("'&!") is None
+
+
+def test_task_search_is_ranked_and_scoped_to_company():
+    sql = _sql(task_search_query(prefix_tsquery("монтаж"), company_id=1, limit=20))
+
+    assert "task.search_vector @@ to_tsquery(" in sql
+    assert "ORDER BY ts_rank(task.search_vector, to_tsquery(" in sql
+    assert "task.company_id =" in sql
+
+
+def _after_create_ddl(url: str) -> str:
+    statements = []
+    engine = create_mock_engine(url, lambda sql, *_args, **_kwargs: statements.append(str(sql)))
+    Task.__table__.dispatch.after_create(Task.__table__, engine, checkfirst=False)
+    return "\n".join(statements)
+
+
+def test_create_all_adds_the_search_vector_on_postgresql_only():
+    ddl = _after_create_ddl("postgresql://")
+
+    assert "ADD COLUMN search_vector tsvector GENERATED ALWAYS AS" in ddl
+    assert "idx_task_company_search_vector" in ddl
+    assert "idx_task_name_trgm" in ddl
+    assert _after_create_ddl("sqlite://") == ""
+
+
+def test_task_list_search_matches_word_prefixes_or_name_substrings():
+    sql = _sql(TaskService._filtered_query(TaskFilter(search="таж"), company_id=1))
+
+    assert "@@ to_tsquery(" in sql
+    assert "task.name ILIKE" in sql
+
+
+def test_task_list_search_without_words_falls_back_to_substring():
+    sql = _sql(TaskService._filtered_query(TaskFilter(search="-+"), company_id=1))
+
+    assert "to_tsquery(" not in sql
+    assert "task.name ILIKE" in sql
+
+
+# ---------------- Подсказки ----------------
+@pytest.mark.asyncio
+@pytest.mark.tables(Position.__table__, User.__table__)
+async def test_prefix_suggestions_are_scoped_to_company(session, make_user):
+    # SQLite lower() only folds ASCII, so the names here are Latin.
+    for i, (last_name, company_id) in enumerate([("Ivanov", 1), ("Ivlev", 1), ("Ivanova", 2), ("Petrov", 1)], 1):
+        session.add(make_user(
+            i, first_name="Anna", last_name=last_name, company_id=company_id, avatar_url=f"a{i}.png",
+        ))
+    await session.commit()
+
+    suggestions = await SearchService(session).suggest_users("iv", company_id=1)
+
+    assert [(s.name, s.avatar_url) for s in suggestions] == [("Anna Ivanov", "a1.png"), ("Anna Ivlev", "a2.png")]
@@ -0,0 +1,50 @@
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Optional
+
+import orjson
+from pydantic import BaseModel, ConfigDict
+
+from app.core.serialization import dump_orm_list
+
+
+class _Position(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    name: str
+
+
+class _Row(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    ratio: float
+    created_at: datetime
+    deadline: Optional[date] = None
+    position: Optional[_Position] = None
+    tags: list[_Position] = []
+
+
+class _Obj:
+    def __init__(self, **kwargs):
+        self.__dict__.update(kwargs)
+
+
+# ---------------- Быстрая сериализация ORM ----------------
+def test_fast_path_matches_pydantic_output():
+    rows = [
+        _Obj(
+            id=1,
+            ratio=Decimal("1.5"),
+            created_at=datetime(2025, 1, 2, 3, 4, 5),
+            deadline=date(2025, 2, 1),
+            position=_Obj(id=7, name="Инженер"),
+            tags=[_Obj(id=1, name="a")],
+        ),
+        _Obj(id=2, ratio=2, created_at=datetime(2025, 1, 2), position=None),
+    ]
+
+    expected = [_Row.model_validate(row).model_dump(mode="json") for row in rows]
+    assert json.loads(orjson.dumps(dump_orm_list(rows, _Row))) == expected
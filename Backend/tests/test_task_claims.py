@@ -0,0 +1,70 @@
+from datetime import date
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.exc import StaleDataError
+
+import app.main  # noqa: F401  registers all mappers
+from app.modules.base_module.enums import City, TaskStep, TaskType
+from app.modules.task.model.task import Task
+from app.modules.task.services.task import TaskService
+from app.modules.task_operations.model.task_operation import TaskOperation, accessed_users, executors
+from app.modules.users.models.position import Position
+from app.modules.users.models.user import User
+
+
+pytestmark = pytest.mark.tables(
+    Position.__table__, User.__table__, Task.__table__, TaskOperation.__table__, accessed_users, executors
+)
+
+
+@pytest_asyncio.fixture
+async def engine(engine, make_user):
+    async with AsyncSession(engine) as db:
+        db.add_all([make_user(1, company_id=1), make_user(2, company_id=1)])
+        db.add(Task(
+            id=1, company_id=1, name="Задача", description="Описание", deadline=date(2026, 1, 1),
+            task_type=TaskType.SOLO, payment=100, duration=1, city=City.ALMATY,
+        ))
+        db.add(TaskOperation(id=1, task_id=1))
+        await db.flush()
+        await db.execute(insert(accessed_users), [{"user_id": 1, "task_id": 1}, {"user_id": 2, "task_id": 1}])
+        await db.commit()
+    return engine
+
+
+# ---------------- Взятие задания ----------------
+@pytest.mark.asyncio
+async def test_take_after_stale_read_loses_the_claim(engine):
+    async with AsyncSession(engine) as first, AsyncSession(engine) as second:
+        # Both read the task while it is still available.
+        assert (await TaskService(first).get_by_id(1)).task_step == TaskStep.AVAILABLE
+        assert (await TaskService(second).get_by_id(1)).task_step == TaskStep.AVAILABLE
+
+        taken = await TaskService(first).take_task(1, 1)
+        assert (taken.task_step, taken.version) == (TaskStep.IN_PROGRESS, 2)
+        await first.commit()
+
+        assert await TaskService(second).take_task(1, 2) is None
+        await second.commit()
+
+    async with AsyncSession(engine) as db:
+        assert (await db.execute(select(executors.c.user_id))).scalars().all() == [1]
+
+
+@pytest.mark.asyncio
+async def test_stale_task_update_raises(engine):
+    async with AsyncSession(engine) as first, AsyncSession(engine) as second:
+        stale = await second.get(Task, 1)
+
+        (await first.get(Task, 1)).name = "Первая правка"
+        await first.commit()
+
+        stale.name = "Вторая правка"
+        with pytest.raises(StaleDataError):
+            await second.flush()
+
+    async with AsyncSession(engine) as db:
+        assert await db.scalar(select(func.max(Task.name))) == "Первая правка"
@@ -0,0 +1,70 @@
+from datetime import date
+
+import pytest
+from sqlalchemy import insert
+from sqlalchemy.dialects import postgresql
+
+import app.main  # noqa: F401  registers all mappers
+from app.core import query_stats
+from app.modules.base_module.enums import City, TaskStep, TaskType
+from app.modules.task.model.task import Task
+from app.modules.task.services.task import TaskService
+from app.modules.task_operations.model.task_operation import TaskOperation, accessed_users, executors
+
+USER_ID = 7
+
+
+# ---------------- Входящие задания ----------------
+@pytest.mark.asyncio
+@pytest.mark.tables(Task.__table__, TaskOperation.__table__, accessed_users, executors)
+async def test_inbox_groups_by_step_with_limits_and_totals(engine, session):
+    query_stats.instrument_engine(engine)
+
+    # id: (step, deadline day, completed_at day, accessed user, executor)
+    tasks = {
+        1: (TaskStep.AVAILABLE, 3, None, USER_ID, None),
+        2: (TaskStep.AVAILABLE, 1, None, USER_ID, None),
+        3: (TaskStep.AVAILABLE, 2, None, USER_ID, None),
+        4: (TaskStep.AVAILABLE, 1, None, 8, None),
+        5: (TaskStep.IN_PROGRESS, 5, None, USER_ID, USER_ID),
+        6: (TaskStep.VERIFIED, 5, 10, None, USER_ID),
+        7: (TaskStep.VERIFIED, 5, 12, None, USER_ID),
+        8: (TaskStep.VERIFIED, 5, 11, None, USER_ID),
+        9: (TaskStep.AVAILABLE, 5, None, None, USER_ID),
+        10: (TaskStep.VERIFIED, 5, None, None, USER_ID),
+    }
+    for task_id, (step, deadline, completed, accessed, executor) in tasks.items():
+        session.add(Task(
+            id=task_id, company_id=1, name=f"Задача {task_id}", description="Описание",
+            deadline=date(2026, 1, deadline),
+            task_type=TaskType.SOLO, payment=100, duration=1, city=City.ALMATY, task_step=step,
+            completed_at=date(2026, 1, completed) if completed else None,
+        ))
+        session.add(TaskOperation(id=task_id, task_id=task_id))
+    await session.flush()
+    for task_id, (*_, accessed, executor) in tasks.items():
+        if accessed:
+            await session.execute(insert(accessed_users).values(user_id=accessed, task_id=task_id))
+        if executor:
+            await session.execute(insert(executors).values(user_id=executor, task_id=task_id))
+    await session.commit()
+
+    stats, token = query_stats.begin_request()
+    try:
+        inbox = await TaskService(session).inbox(USER_ID, limit=2)
+    finally:
+        query_stats.end_request(token)
+
+    assert stats.count == 1
+    assert ([t.id for t in inbox.available.tasks], inbox.available.total) == ([2, 3], 3)
+    assert ([t.id for t in inbox.in_progress.tasks], inbox.in_progress.total) == ([5], 1)
+    assert ([t.id for t in inbox.verified.tasks], inbox.verified.total) == ([7, 8], 4)
+    assert (inbox.completed.tasks, inbox.completed.total) == ([], 0)
+    assert (inbox.failed.tasks, inbox.failed.total) == ([], 0)
+
+
+def test_inbox_puts_undated_completions_last_on_postgres():
+    # SQLite already sorts NULLs last in DESC order; PostgreSQL needs it spelled out.
+    sql = str(TaskService._inbox_query(USER_ID, 20).compile(dialect=postgresql.dialect()))
+
+    assert "task.completed_at DESC NULLS LAST" in sql
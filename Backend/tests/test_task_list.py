@@ -0,0 +1,63 @@
+from datetime import date
+
+import httpx
+import pytest
+import pytest_asyncio
+
+from app.core.db import get_read_db
+from app.main import app
+from app.modules.auth.schemas.auth import Principal
+from app.modules.base_module.dependencies import get_current_user
+from app.modules.base_module.enums import City, Role, TaskType
+from app.modules.task.model.task import Task
+from app.modules.task_operations.model.task_operation import TaskOperation, accessed_users, executors
+
+pytestmark = pytest.mark.tables(Task.__table__, TaskOperation.__table__, accessed_users, executors)
+
+
+@pytest_asyncio.fixture
+async def list_tasks(session):
+    for task_id in range(1, 5):
+        session.add(Task(
+            id=task_id, company_id=1 if task_id % 2 else 2, name=f"Задача {task_id}", description="Описание",
+            deadline=date(2026, 1, task_id), task_type=TaskType.SOLO, payment=100, duration=1, city=City.ALMATY,
+        ))
+    await session.commit()
+
+    async def list_tasks(principal: Principal, headers: dict | None = None, **params) -> httpx.Response:
+        app.dependency_overrides[get_read_db] = lambda: session
+        app.dependency_overrides[get_current_user] = lambda: principal
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+            return await client.get("/api/v1/task/", params=params, headers=headers)
+
+    yield list_tasks
+    app.dependency_overrides.clear()
+
+
+def _ids(response: httpx.Response) -> list[int]:
+    assert response.status_code == 200, response.text
+    return [task["id"] for task in response.json()]
+
+
+# ---------------- Список заданий ----------------
+@pytest.mark.asyncio
+async def test_company_users_see_their_company_only(list_tasks):
+    user = Principal(id=1, role=Role.USER, company_id=1)
+
+    assert _ids(await list_tasks(user)) == [1, 3]
+    assert (await list_tasks(user, company_id=2)).status_code == 403
+    assert _ids(await list_tasks(Principal(id=2, role=Role.USER))) == []
+
+
+@pytest.mark.asyncio
+async def test_admin_without_company_lists_all_or_one_company(list_tasks):
+    admin = Principal(id=1, role=Role.ADMIN)
+
+    everything = await list_tasks(admin)
+    assert _ids(everything) == [1, 2, 3, 4]
+    assert _ids(await list_tasks(admin, company_id=2)) == [2, 4]
+
+    # The unscoped listing is revalidated against every company's tasks.
+    etag = everything.headers["etag"]
+    assert etag != (await list_tasks(admin, company_id=2)).headers["etag"]
+    assert (await list_tasks(admin, headers={"If-None-Match": etag})).status_code == 304
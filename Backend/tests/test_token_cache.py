@@ -0,0 +1,24 @@
+from app.modules.auth.service.auth import AuthService, TOKEN_CACHE_LOOKUPS
+
+
+# ---------------- Кэш проверенных токенов ----------------
+def test_repeated_token_is_served_from_cache():
+    service = AuthService(None)  # type: ignore[arg-type]
+    token = service.create_access_token(42)
+    hits_before = TOKEN_CACHE_LOOKUPS.value(result="hit")
+
+    first = service.verify_token(token, "access")
+    second = service.verify_token(token, "access")
+
+    assert first is not None and first.sub == "42"
+    assert second == first
+    assert TOKEN_CACHE_LOOKUPS.value(result="hit") == hits_before + 1
+
+
+def test_cached_token_still_checks_type_and_signature():
+    service = AuthService(None)  # type: ignore[arg-type]
+    token = service.create_access_token(42)
+    service.verify_token(token, "access")
+
+    assert service.verify_token(token, "refresh") is None
+    assert service.verify_token(token[:-2] + "xx", "access") is None
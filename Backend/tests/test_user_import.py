@@ -0,0 +1,95 @@
+import io
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import func, select
+
+import app.main  # noqa: F401  registers all mappers
+from app.core.security import verify_password
+from app.modules.base_module.enums import Role
+from app.modules.statistics.models.user_statistic import UserStatistic
+from app.modules.users.models.position import Position
+from app.modules.users.models.user import User
+from app.modules.users.services.user_import import UserImportService, detect_import_format, iter_rows
+
+PASSWORD = "Secret@123"
+
+
+# ---------------- Разбор файла ----------------
+def test_detect_import_format():
+    assert detect_import_format("staff.csv", None) == "csv"
+    assert detect_import_format("staff", "application/x-ndjson") == "ndjson"
+    assert detect_import_format("staff.xlsx", "application/octet-stream") is None
+
+
+def test_csv_empty_cells_become_none():
+    data = b"login,position_id,bonus\r\nivanov,,100\r\n"
+    rows = list(iter_rows(io.BytesIO(data), "csv"))
+
+    assert rows == [(1, {"login": "ivanov", "position_id": None, "bonus": "100"}, None)]
+
+
+def test_ndjson_reports_broken_lines():
+    data = b'{"login": "a"}\n\nnot json\n[1, 2]\n'
+    rows = list(iter_rows(io.BytesIO(data), "ndjson"))
+
+    assert rows[0] == (1, {"login": "a"}, None)
+    assert rows[1][0] == 2 and rows[1][2]
+    assert rows[2][0] == 3 and rows[2][2]
+
+
+@pytest.mark.parametrize("fmt", ["csv", "ndjson"])
+def test_non_utf8_file_is_a_client_error(fmt):
+    with pytest.raises(HTTPException) as exc:
+        list(iter_rows(io.BytesIO(b"login\n\xff\xfe\n"), fmt))
+
+    assert exc.value.status_code == 400
+    assert "UTF-8" in exc.value.detail
+
+
+def test_rows_with_nul_bytes_are_reported():
+    errors = []
+    rows = [(1, {"login": "ivanov", "first_name": "Ив\x00ан"}, None), (2, {"login": "pe\x00trov"}, None)]
+
+    assert UserImportService._validate(rows, company_id=1, seen_logins=set(), errors=errors) == []
+    assert [(e.row, e.login, e.errors) for e in errors] == [
+        (1, "ivanov", ["first_name: недопустимый символ NUL"]),
+        (2, None, ["login: недопустимый символ NUL"]),
+    ]
+
+
+# ---------------- Импорт ----------------
+@pytest.mark.asyncio
+@pytest.mark.tables(Position.__table__, User.__table__, UserStatistic.__table__)
+async def test_import_creates_valid_rows_and_reports_the_rest(session, make_user):
+    header = "login,first_name,last_name,date_of_birth,salary,position_id,password\n"
+    body = (
+        f"new1,Иван,Иванов,1990-01-01,1000,1,{PASSWORD}\n"
+        f"new2,Петр,Петров,1991-02-02,2000,,{PASSWORD}\n"
+        f"taken,Анна,Смирнова,1992-03-03,1500,,{PASSWORD}\n"
+        f"new1,Дубль,Дублев,1993-04-04,1500,,{PASSWORD}\n"
+        f"new3,Олег,Олегов,1994-05-05,1500,99,{PASSWORD}\n"
+        f"weak,Слабый,Пароль,1995-06-06,1500,,weak\n"
+    )
+
+    session.add(Position(id=1, name="Монтажник", head_of_group=False))
+    session.add(make_user(100, login="taken", role=Role.USER))
+    await session.commit()
+
+    result = await UserImportService(session).import_users(
+        io.BytesIO((header + body).encode()), "csv", company_id=7
+    )
+    await session.commit()
+
+    assert result.created == 2
+    assert [(error.row, error.login) for error in result.errors] == [
+        (3, "taken"), (4, "new1"), (5, "new3"), (6, "weak"),
+    ]
+
+    created = (await session.execute(select(User).where(User.login.in_(["new1", "new2"])))).scalars().all()
+    assert {user.company_id for user in created} == {7}
+    assert all(user.role == Role.USER for user in created)
+    assert verify_password(PASSWORD, created[0].hashed_password)
+
+    stats = await session.scalar(select(func.count()).select_from(UserStatistic))
+    assert stats == 2
@@ -276,7 +276,7 @@ export function TeamContent() {
         }
 
         try {
-            let savedUserId
+            let savedUser
 
             if (editTarget) {
                 const updatePayload = {
@@ -288,21 +288,27 @@ export function TeamContent() {
                     position_id: payload.position_id,
                     role:        form.role,
                 }
-                const updated = await usersApi.updateUser(editTarget.id, updatePayload)
-                savedUserId = updated.id
+                savedUser = await usersApi.updateUser(editTarget.id, updatePayload)
             } else {
-                const created = await usersApi.createUser({ ...payload, password: form.password })
-                savedUserId = created.id
+                savedUser = await usersApi.createUser({ ...payload, password: form.password })
             }
 
+            let avatarJob = null
             if (avatarFile) {
-                await usersApi.uploadAvatar(savedUserId, avatarFile)
+                const job = await usersApi.uploadAvatar(savedUser.id, avatarFile)
+                avatarJob = await usersApi.waitForAvatarJob(job.job_id)
             } else if (removeAvatar && editTarget?.avatar_url) {
-                await usersApi.deleteAvatar(savedUserId)
+                await usersApi.deleteAvatar(savedUser.id)
             }
 
             await loadEmployees()
 
+            if (avatarJob?.status === 'failed') {
+                // The user is saved; keep the form open as an edit so a retry does not create them again.
+                setEditTarget(savedUser)
+                setFormError(avatarJob.error || 'Не удалось загрузить аватар')
+                return
+            }
             setShowModal(false)
         } catch (err) {
             const detail = err.response?.data?.detail
@@ -1,5 +1,8 @@
 import axiosInstance from '@/shared/api/axios'
 
+const AVATAR_POLL_INTERVAL_MS = 500
+const AVATAR_POLL_TIMEOUT_MS = 30000
+
 export const usersApi = {
     getById: (id) =>
         axiosInstance.get(`/user/${id}`).then(r => r.data),
@@ -24,6 +27,27 @@ export const usersApi = {
         }).then(r => r.data)
     },
 
+    getAvatarJob: (jobId) =>
+        axiosInstance.get(`/user/avatar-jobs/${jobId}`).then(r => r.data),
+
+    // Uploads are processed in the background: poll the job until it is done or failed.
+    // A 404 means the job is held by another server instance; the caller just refetches.
+    waitForAvatarJob: async (jobId) => {
+        const deadline = Date.now() + AVATAR_POLL_TIMEOUT_MS
+        while (Date.now() < deadline) {
+            let job
+            try {
+                job = await usersApi.getAvatarJob(jobId)
+            } catch (err) {
+                if (err.response?.status === 404) return null
+                throw err
+            }
+            if (job.status === 'done' || job.status === 'failed') return job
+            await new Promise(resolve => setTimeout(resolve, AVATAR_POLL_INTERVAL_MS))
+        }
+        return null
+    },
+
     deleteAvatar: (id) =>
         axiosInstance.delete(`/user/${id}/avatar`).then(r => r.data),
 